@@ -5,6 +5,14 @@ __version__ = pkg_resources.get_distribution('pytest-drf').version
 
 from .authentication import *
 from .authorization import *
+from .benchmarks import *
+from .concurrency import *
+from .data import *
+from .openapi import *
 from .pagination import *
+from .queries import *
+from .scaling import *
+from .shapes import *
+from .snapshots import *
 from .status import *
 from .views import *
@@ -0,0 +1,134 @@
+"""
+Async test client
+=================
+
+This module contains DRFAsyncTestClient, which performs requests through
+Django's ASGI handler (as used by AsyncAPIViewTest). It's kept apart from the
+other test clients, as Django's AsyncClient is only available from Django 3.1.
+
+"""
+from urllib.parse import urlencode
+
+try:
+    from django.test.client import AsyncClient, AsyncClientHandler
+except ImportError:
+    raise ImportError(
+        'DRFAsyncTestClient (and so AsyncAPIViewTest) requires Django 3.1 or later'
+    ) from None
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from pytest_drf.util import decode_json
+
+__all__ = ['DRFAsyncTestClient', 'ForceAuthAsyncClientHandler']
+
+
+def _append_query_string(path, data) -> str:
+    if not data:
+        return path
+
+    separator = '&' if '?' in path else '?'
+    return f'{path}{separator}{urlencode(data, doseq=True)}'
+
+
+class ForceAuthAsyncClientHandler(AsyncClientHandler):
+    """Async client handler which supports DRF's force_authenticate
+
+    This mirrors DRF's ForceAuthClientHandler, for ASGI requests.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._force_user = None
+        self._force_token = None
+        super().__init__(*args, **kwargs)
+
+    async def get_response_async(self, request):
+        force_authenticate(request, self._force_user, self._force_token)
+        return await super().get_response_async(request)
+
+
+class DRFAsyncTestClient(AsyncClient):
+    """Django AsyncClient with the conveniences of DRFTestClient
+
+    Requests are performed through Django's ASGI handler, so async views are run
+    on the event loop, as they would be when deployed with an ASGI server. All
+    request methods return awaitables.
+
+    Like DRFTestClient, this supports passing a headers kwarg, encoding request
+    data with DRF's renderers (see the `format` kwarg), and authenticating with
+    credentials() or force_authenticate().
+    """
+
+    def __init__(self, enforce_csrf_checks=False, **defaults):
+        super().__init__(enforce_csrf_checks=enforce_csrf_checks, **defaults)
+        self.handler = ForceAuthAsyncClientHandler(enforce_csrf_checks)
+        self._credentials = {}
+
+        # Used to encode request data, as APIClient would
+        self._request_factory = APIRequestFactory()
+
+    def credentials(self, **kwargs):
+        """Sets headers (in WSGI environ form) that will be set on every request
+        """
+        self._credentials = kwargs
+
+    def force_authenticate(self, user=None, token=None):
+        self.handler._force_user = user
+        self.handler._force_token = token
+        if user is None and token is None:
+            self.logout()
+
+    def generic(self,
+                method,
+                path,
+                data='',
+                content_type='application/octet-stream',
+                secure=False,
+                headers=None,
+                **extra):
+        # NOTE: ASGI requests take header names, not WSGI environ keys
+        request_headers = {
+            name[len('HTTP_'):].replace('_', '-'): value
+            for name, value in self._credentials.items()
+            if name.startswith('HTTP_')
+        }
+        if headers:
+            request_headers.update(headers)
+
+        extra.update({
+            name.lower(): value
+            for name, value in request_headers.items()
+        })
+        return super().generic(method, path, data, content_type, secure, **extra)
+
+    def _parse_json(self, response, **extra):
+        if extra:
+            return super()._parse_json(response, **extra)
+        return decode_json(response)
+
+    def get(self, path, data=None, secure=False, **extra):
+        path = _append_query_string(path, data)
+        return self.generic('GET', path, secure=secure, **extra)
+
+    def _encoded_request(self, method, path, data, format, content_type, secure, extra):
+        data, content_type = self._request_factory._encode_data(data, format, content_type)
+        return self.generic(method, path, data, content_type or 'application/octet-stream',
+                            secure=secure, **extra)
+
+    def post(self, path, data=None, format=None, content_type=None, secure=False, **extra):
+        return self._encoded_request('POST', path, data, format, content_type, secure, extra)
+
+    def put(self, path, data=None, format=None, content_type=None, secure=False, **extra):
+        return self._encoded_request('PUT', path, data, format, content_type, secure, extra)
+
+    def patch(self, path, data=None, format=None, content_type=None, secure=False, **extra):
+        return self._encoded_request('PATCH', path, data, format, content_type, secure, extra)
+
+    def delete(self, path, data=None, format=None, content_type=None, secure=False, **extra):
+        return self._encoded_request('DELETE', path, data, format, content_type, secure, extra)
+
+    def options(self, path, data=None, format=None, content_type=None, secure=False, **extra):
+        return self._encoded_request('OPTIONS', path, data, format, content_type, secure, extra)
+
+    def head(self, path, data=None, secure=False, **extra):
+        path = _append_query_string(path, data)
+        return self.generic('HEAD', path, secure=secure, **extra)
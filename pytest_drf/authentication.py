@@ -6,15 +6,19 @@ This module contains test mixins for declaring which user is authenticated when
 making requests.
 
 """
-from typing import Type
+from functools import partial
+from typing import Any, Callable, Dict, Type
 
 import inflection
 import pytest
 from pytest_lambda import lambda_fixture
 
+from pytest_drf.fixtures import _shared_db_fixture
+
 __all__ = [
     'AsUser',
     'AsAnonymousUser',
+    'user_fixture',
 ]
 
 
@@ -28,6 +32,11 @@ __all__ = [
 class _AsUserMeta(type):
     # This metaclass allows AsUser('my_user') to return a test mixin with the
     # client fixture authenticated as `my_user`
+    #
+    # The generated mixins are interned, so AsUser('my_user') always returns
+    # the same class.
+
+    _interned: Dict[str, Type['AsUser']] = {}
 
     def __call__(cls, *args, **kwargs) -> Type['AsUser']:
         if cls is not AsUser:
@@ -35,6 +44,14 @@ class _AsUserMeta(type):
 
         user_fixture_name, = args
 
+        try:
+            return cls._interned[user_fixture_name]
+        except KeyError:
+            as_user_cls = cls._interned[user_fixture_name] = cls._create_mixin(user_fixture_name)
+            return as_user_cls
+
+    @staticmethod
+    def _create_mixin(user_fixture_name: str) -> Type['AsUser']:
         class AsUserXYZ:
             f"""Authenticates the `client` fixture to {user_fixture_name}
             """
@@ -51,6 +68,9 @@ class _AsUserMeta(type):
 
 class AsUser(metaclass=_AsUserMeta):
     """Authenticates the `client` fixture to the user fixture named in the constructor
+
+    To create the user only once for all tests in a class (or session), rather
+    than for every test, declare it with `user_fixture()`.
     """
 
     @pytest.fixture
@@ -71,3 +91,42 @@ class AsUser(metaclass=_AsUserMeta):
 
 class AsAnonymousUser:
     client = lambda_fixture('unauthed_client')
+
+
+def user_fixture(fn: Callable[..., Any] = None, *, scope: str = 'class'):
+    """Declare a fixture creating users (and their groups, permissions, ...) once per class
+
+    Like `lambda_fixture`, the method may request other fixtures (of the same
+    or broader scope) with its params. It's called only once for all the tests
+    in a class (or, with scope='session', the whole session), inside a
+    transaction which is rolled back afterward (see `class_db_transaction` and
+    `session_db_transaction`).
+
+    Each test requesting the fixture runs within a savepoint, so any changes
+    it makes to the DB are rolled back before the next test. And any changes
+    made to the returned model instances (or lists, tuples, or dicts of them)
+    are undone by restoring a snapshot of their state — no DB queries required.
+
+    AsUser, and anything else requesting the fixture by name, work unchanged.
+    If `drf_client_authenticator` authenticates clients with real credentials,
+    the users are authenticated once, along with their creation, and the
+    credentials are reused by every test.
+
+        alice = user_fixture(lambda: User.objects.create(username='alice'))
+
+        @user_fixture(scope='session')
+        def staff(permissions):
+            user = User.objects.create(username='staff', is_staff=True)
+            user.user_permissions.set(permissions)
+            return user
+
+        class DescribeUserInfo(APIViewTest, AsUser('alice')):
+            ...
+
+    NOTE: if your test harness does not hold transactions open between tests
+          (e.g. it recreates the test DB for every test), rows created by the
+          fixture will not outlive the first test.
+    """
+    if fn is None:
+        return partial(user_fixture, scope=scope)
+    return _shared_db_fixture(fn, scope, share_credentials=True)
@@ -6,12 +6,204 @@ This module contains test mixins to declare which types of users should not be
 able to access a resource.
 
 """
+import re
+from typing import Any, Dict, Mapping, Tuple, Type, TYPE_CHECKING
+
+import pytest
+from pytest_lambda import static_fixture
+
 from pytest_drf.authentication import AsAnonymousUser
 from pytest_drf.status import Returns403
+from pytest_drf.util import rolled_back_atomic
 
-__all__ = ['ForbidsAnonymousUsers']
+__all__ = ['ForbidsAnonymousUsers', 'AccessMatrix']
 
 
 class ForbidsAnonymousUsers:
     class TestForbidsAnonymousUser(Returns403, AsAnonymousUser):
         pass
+
+
+#: The HTTP method and URL fixture requested for each ViewSet action
+_ACCESS_MATRIX_ACTIONS: Dict[str, Tuple[str, str]] = {
+    'list': ('get', 'list_url'),
+    'create': ('post', 'list_url'),
+    'retrieve': ('get', 'detail_url'),
+    'update': ('put', 'detail_url'),
+    'partial_update': ('patch', 'detail_url'),
+    'destroy': ('delete', 'detail_url'),
+}
+
+#: Name of the role performing requests without authentication
+_ANONYMOUS_ROLE = 'anonymous'
+
+
+def _get_action_request(action: str) -> Tuple[str, str]:
+    """Return the HTTP method and URL fixture name requested for an action
+
+    Besides the standard ViewSet actions, an action may be declared as
+    '<http method> <url fixture name>', e.g. 'post activate_url'
+    """
+    try:
+        return _ACCESS_MATRIX_ACTIONS[action]
+    except KeyError:
+        pass
+
+    try:
+        http_method, url_fixture_name = action.split()
+    except ValueError:
+        raise ValueError(
+            f'Unknown access matrix action {action!r}. Please use one of '
+            f'{", ".join(_ACCESS_MATRIX_ACTIONS)}, or declare the HTTP method '
+            f'and URL fixture, e.g. "post activate_url"'
+        ) from None
+    return http_method.lower(), url_fixture_name
+
+
+def _assert_access_matrix_cell(access_matrix_responses, role: str, action: str, status_code: int):
+    response = access_matrix_responses[role, action]
+
+    expected = status_code
+    actual = response.status_code
+    assert expected == actual, (
+        f'Expected {role} {action} to return {expected}, but got {actual}: '
+        f'{response.content[:200]!r}'
+    )
+
+
+def _create_access_matrix_cell_test(role: str, action: str, status_code: int):
+    def test_access_matrix_cell(self, access_matrix_responses):
+        _assert_access_matrix_cell(access_matrix_responses, role, action, status_code)
+
+    action_name = re.sub(r'\W+', '_', action)
+    test_access_matrix_cell.__name__ = f'test_{role}_{action_name}_returns_{status_code}'
+    return test_access_matrix_cell
+
+
+class _AccessMatrixMeta(type):
+    # This metaclass allows AccessMatrix({role: {action: status}}) to return a
+    # test mixin with a test for each cell of the matrix, and the access_matrix
+    # fixture defined as the matrix.
+
+    def __call__(cls, *args, **kwargs) -> Type['AccessMatrix']:
+        if cls is not AccessMatrix:
+            return super().__call__(*args, **kwargs)
+
+        matrix, = args
+        matrix = {role: dict(statuses) for role, statuses in matrix.items()}
+
+        tests = {}
+        for role, statuses in matrix.items():
+            for action, status_code in statuses.items():
+                _get_action_request(action)  # report unknown actions at declaration
+
+                test = _create_access_matrix_cell_test(role, action, status_code)
+                tests[test.__name__] = test
+
+        return type('AccessMatrix', (AccessMatrix,), {
+            **tests,
+            'access_matrix': static_fixture(matrix),
+        })
+
+
+class AccessMatrix(metaclass=_AccessMatrixMeta):
+    """Declares the status each role should receive for each action, generating a test per cell
+
+    Roles name user fixtures (besides 'anonymous', whose requests are not
+    authenticated), and actions are the standard ViewSet actions (list,
+    create, retrieve, update, partial_update, destroy) — requested with the
+    `list_url` and `detail_url` fixtures — or '<http method> <url fixture>'.
+
+        class DescribeKeyValueViewSet(ViewSetTest):
+            list_url = lambda_fixture(lambda: url_for('key-values-list'))
+            detail_url = lambda_fixture(lambda key_value: url_for('key-values-detail', key_value.pk))
+
+            key_value = lambda_fixture(lambda: KeyValue.objects.create(key='apple', value='π'))
+
+            class DescribeAccess(
+                AccessMatrix({
+                    'anonymous': {'list': 200, 'retrieve': 200, 'create': 403, 'destroy': 403},
+                    'user':      {'list': 200, 'retrieve': 200, 'create': 201, 'destroy': 403},
+                    'admin':     {'list': 200, 'retrieve': 200, 'create': 201, 'destroy': 204},
+                }),
+            ):
+                access_matrix_data = static_fixture({'create': {'key': 'banana', 'value': 'ρ'}})
+
+    All requests are performed once, by the first test of the class: fixture
+    data is set up only once for the whole matrix, and each role's client is
+    built only once. Every request is performed within its own rolled-back
+    savepoint, so e.g. a successful destroy does not affect the next request.
+    Like RequestsOnce, the fixture data is created within `class_db_transaction`.
+
+    The `response` fixture (and its request) is not used by the matrix's tests.
+    """
+
+    @pytest.fixture
+    def access_matrix(self) -> Dict[str, Dict[str, int]]:
+        """Expected status code of each action, by role"""
+        raise NotImplementedError(
+            'Please define the access_matrix fixture. Alternatively, subclass '
+            'AccessMatrix({role: {action: status}}) instead of the bare AccessMatrix.'
+        )
+
+    @pytest.fixture
+    def access_matrix_data(self) -> Mapping[str, Any]:
+        """Data to send with the request of each action (e.g. 'create')"""
+        return {}
+
+    @pytest.fixture(autouse=True)
+    def common_subject_rval(self):
+        # NOTE: the matrix performs requests of its own; the common subject's
+        #       request is skipped entirely.
+        return None
+
+    @pytest.fixture(scope='class')
+    def shared_access_matrix_responses(self, class_db_transaction) -> Dict[Tuple[str, str], Any]:
+        """Storage for the matrix's responses, shared across the class
+        """
+        return {}
+
+    @pytest.fixture
+    def access_matrix_responses(self,
+                                request,
+                                access_matrix,
+                                shared_access_matrix_responses,
+                                ) -> Dict[Tuple[str, str], Any]:
+        """Response to each (role, action) of the matrix"""
+        if shared_access_matrix_responses:
+            return shared_access_matrix_responses
+
+        # NOTE: responses are shared only once every request has succeeded, so
+        #       if one raises, later tests perform the requests anew (and raise
+        #       the same error), instead of finding the matrix partially filled
+        responses = {}
+
+        # NOTE: fixtures are requested lazily, so that later tests in the class
+        #       need not evaluate them
+        data = request.getfixturevalue('access_matrix_data')
+        urls = {}
+
+        for role, statuses in access_matrix.items():
+            if role == _ANONYMOUS_ROLE:
+                client = request.getfixturevalue('unauthed_client')
+            else:
+                create_drf_client = request.getfixturevalue('create_drf_client')
+                client = create_drf_client(request.getfixturevalue(role))
+
+            for action in statuses:
+                http_method, url_fixture_name = _get_action_request(action)
+                if url_fixture_name not in urls:
+                    urls[url_fixture_name] = request.getfixturevalue(url_fixture_name)
+
+                with rolled_back_atomic():
+                    response = getattr(client, http_method)(urls[url_fixture_name], data.get(action))
+                responses[role, action] = response
+
+        shared_access_matrix_responses.update(responses)
+        return shared_access_matrix_responses
+
+    if TYPE_CHECKING:
+        # this appeases code sense, which may not be able to understand how the
+        # metaclass allows using instantiation syntax without really instantiating.
+        def __new__(cls, matrix: Mapping[str, Mapping[str, int]]) -> Type['AccessMatrix']:
+            ...
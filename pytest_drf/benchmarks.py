@@ -0,0 +1,249 @@
+"""
+Benchmarking endpoints
+======================
+
+This module contains the Benchmarks test mixin, which repeats a test context's
+request many times and compares its latency against a baseline recorded in a
+previous run.
+
+Baselines are keyed by test node ID, and stored in the pytest cache — or, to
+share them (e.g. by committing them), as JSON in the file named by
+`--drf-benchmark-baseline`. The first time a benchmark is run, its results are
+added to the baselines. Afterward, the benchmark fails if its median latency
+regresses by more than the threshold (`--drf-benchmark-threshold`, default:
+0.25, i.e. 25%). To overwrite existing baselines with the latest results, pass
+`--drf-benchmark-update`.
+
+With pytest-xdist, workers pass their results along to the controller, which
+alone writes the baselines.
+
+"""
+import json
+import math
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import pytest
+
+from pytest_drf.util import rolled_back_atomic
+
+__all__ = ['Benchmarks', 'BenchmarkStats', 'BenchmarkBaselines']
+
+
+#: Key of the pytest cache entry storing baselines, when no file is given
+BASELINES_CACHE_KEY = 'drf/benchmark-baselines'
+
+
+@dataclass
+class BenchmarkStats:
+    """Latency statistics (in seconds) from a benchmark's rounds"""
+
+    rounds: int
+    min: float
+    p50: float
+    p95: float
+    max: float
+
+    @classmethod
+    def from_timings(cls, timings: Sequence[float]) -> 'BenchmarkStats':
+        timings = sorted(timings)
+
+        def percentile(p: float) -> float:
+            # Nearest-rank method
+            rank = max(math.ceil(p / 100 * len(timings)), 1)
+            return timings[rank - 1]
+
+        return cls(
+            rounds=len(timings),
+            min=timings[0],
+            p50=percentile(50),
+            p95=percentile(95),
+            max=timings[-1],
+        )
+
+    def format(self) -> str:
+        return ', '.join(
+            f'{name}={getattr(self, name) * 1000:.2f}ms'
+            for name in ('min', 'p50', 'p95', 'max')
+        )
+
+
+class BenchmarkBaselines:
+    """Storage for benchmark results, persisted as JSON in a file, or in the pytest cache
+
+    An instance is registered as a plugin for the test session, so results may
+    be written when the session finishes. If neither a path nor a cache is
+    given, nothing is persisted.
+    """
+
+    def __init__(self, path: Optional[str] = None, update: bool = False, cache=None):
+        self.path = path
+        self.update = update
+        self.cache = cache
+
+        self._baselines: Optional[Dict[str, BenchmarkStats]] = None
+        self._results: Dict[str, BenchmarkStats] = {}
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        if self.path is not None:
+            if os.path.exists(self.path):
+                with open(self.path) as fp:
+                    return json.load(fp)
+        elif self.cache is not None:
+            return self.cache.get(BASELINES_CACHE_KEY, {})
+        return {}
+
+    def dump(self, baselines: Dict[str, Dict[str, Any]]):
+        if self.path is not None:
+            with open(self.path, 'w') as fp:
+                json.dump(baselines, fp, indent=2)
+        elif self.cache is not None:
+            self.cache.set(BASELINES_CACHE_KEY, baselines)
+
+    @property
+    def baselines(self) -> Dict[str, BenchmarkStats]:
+        if self._baselines is None:
+            self._baselines = {
+                node_id: BenchmarkStats(**stats)
+                for node_id, stats in self.load().items()
+            }
+        return self._baselines
+
+    def get(self, node_id: str) -> Optional[BenchmarkStats]:
+        """Return the baseline for the benchmark, unless it's being updated"""
+        if self.update:
+            return None
+        return self.baselines.get(node_id)
+
+    def record(self, node_id: str, stats: BenchmarkStats):
+        self._results[node_id] = stats
+
+    def save(self):
+        new_baselines = {
+            node_id: stats
+            for node_id, stats in self._results.items()
+            if self.update or node_id not in self.baselines
+        }
+        if not new_baselines:
+            return
+
+        baselines = {**self.baselines, **new_baselines}
+        self.dump({
+            node_id: asdict(stats)
+            for node_id, stats in sorted(baselines.items())
+        })
+
+    def pytest_sessionfinish(self, session):
+        workeroutput = getattr(session.config, 'workeroutput', None)
+        if workeroutput is not None:
+            # Pass the results along to the xdist controller, which saves them
+            workeroutput['drf_benchmark_results'] = {
+                node_id: asdict(stats)
+                for node_id, stats in self._results.items()
+            }
+            return
+
+        self.save()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        results = getattr(node, 'workeroutput', {}).get('drf_benchmark_results', {})
+        for node_id, stats in results.items():
+            self.record(node_id, BenchmarkStats(**stats))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self._results:
+            return
+
+        terminalreporter.write_sep('=', 'DRF benchmarks')
+        for node_id, stats in self._results.items():
+            line = f'{node_id}: {stats.format()}'
+
+            baseline = self.get(node_id)
+            if baseline is not None:
+                change = stats.p50 / baseline.p50 - 1 if baseline.p50 else 0
+                line += f' (p50 {change:+.1%} vs baseline)'
+
+            terminalreporter.write_line(line)
+
+
+class Benchmarks:
+    """Includes test which benchmarks the request against a recorded baseline
+
+    The request is performed `benchmark_warmup_rounds` times without timing,
+    then timed over `benchmark_rounds` more requests. Each request is performed
+    in a savepoint which is rolled back afterward, so requests which modify the
+    DB (e.g. creating a row) can be repeated.
+
+        class DescribeList(
+            UsesGetMethod,
+            UsesListEndpoint,
+
+            Benchmarks,
+        ):
+            benchmark_rounds = static_fixture(100)
+
+    """
+
+    @pytest.fixture
+    def benchmark_rounds(self) -> int:
+        """Number of timed requests to perform"""
+        return 20
+
+    @pytest.fixture
+    def benchmark_warmup_rounds(self) -> int:
+        """Number of untimed requests to perform before the timed ones"""
+        return 3
+
+    @pytest.fixture
+    def benchmark_threshold(self, request) -> float:
+        """Allowed fractional increase in median latency over the baseline"""
+        return request.config.getoption('drf_benchmark_threshold')
+
+    @pytest.fixture
+    def benchmark_baselines(self, request) -> BenchmarkBaselines:
+        """Storage for benchmark results"""
+        return request.config.pluginmanager.get_plugin('drf_benchmark_baselines')
+
+    @pytest.fixture
+    def benchmark_stats(self,
+                        call_common_subject,
+                        benchmark_rounds: int,
+                        benchmark_warmup_rounds: int,
+                        ) -> BenchmarkStats:
+        """Latency statistics from repeatedly performing the request"""
+        timings: List[float] = []
+
+        for i in range(benchmark_warmup_rounds + benchmark_rounds):
+            with rolled_back_atomic():
+                start = time.perf_counter()
+                call_common_subject()
+                duration = time.perf_counter() - start
+
+            if i >= benchmark_warmup_rounds:
+                timings.append(duration)
+
+        return BenchmarkStats.from_timings(timings)
+
+    def test_it_performs_within_benchmark_baseline(self,
+                                                    request,
+                                                    benchmark_stats: BenchmarkStats,
+                                                    benchmark_baselines: BenchmarkBaselines,
+                                                    benchmark_threshold: float):
+        node_id = request.node.nodeid
+        benchmark_baselines.record(node_id, benchmark_stats)
+        request.node.user_properties.append(('drf_benchmark', asdict(benchmark_stats)))
+
+        baseline = benchmark_baselines.get(node_id)
+        if baseline is None:
+            return
+
+        expected = baseline.p50 * (1 + benchmark_threshold)
+        actual = benchmark_stats.p50
+        assert actual <= expected, (
+            f'Median latency regressed by more than {benchmark_threshold:.0%}\n'
+            f'  baseline: {baseline.format()}\n'
+            f'  current:  {benchmark_stats.format()}'
+        )
@@ -0,0 +1,274 @@
+"""
+Caching responses between runs
+==============================
+
+This module contains the on-disk store behind the CachesResponse test mixin,
+which reuses the response stored by a previous run whenever a test's request
+is unchanged — instead of executing the view again.
+
+A response is stored under a key hashing:
+
+ - the request: its HTTP method, `full_url`, `data`, and `headers`
+ - the client: the user it's authenticated to, and its credentials and cookies
+ - the code behind the endpoint: the contents of the project files the view
+   depends on (see pytest_drf.impact), the URLconf, and the installed versions
+   of Django, DRF, and pytest-drf
+ - the data behind the endpoint: the row count, greatest primary key, and
+   latest auto_now timestamps of the models the view and its serializer use,
+   the models they relate to, and the user model (see
+   ResponseCache.get_data_fingerprint)
+
+Responses are kept in a single SQLite file (by default, in the pytest cache
+directory), compressed, and the least recently used are evicted once the store
+grows past `--drf-response-cache-size` megabytes (default: 100). Pass
+`--drf-no-response-cache` to perform every request.
+
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from functools import partial
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+from pytest_drf.impact import _get_module_file, get_endpoint_classes, get_endpoint_dependencies
+
+__all__ = ['ResponseCache']
+
+
+#: HTTP methods whose responses may be cached
+CACHEABLE_METHODS = frozenset(('get', 'head', 'options'))
+
+
+def _hash_json(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, default=repr, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _get_client_identity(client) -> Dict[str, Any]:
+    """Return everything a client authenticates its requests with"""
+    from pytest_drf.client import _get_user_key
+
+    handler = getattr(client, 'handler', None)
+    force_token = getattr(handler, '_force_token', None)
+    cookies = getattr(client, 'cookies', None)
+    return {
+        'user': _get_user_key(getattr(handler, '_force_user', None)),
+        'token': repr(force_token) if force_token is not None else None,
+        'credentials': getattr(client, '_credentials', {}),
+        'cookies': cookies.output() if cookies is not None else None,
+    }
+
+
+def _get_related_models(models: Iterable[type]) -> Set[type]:
+    """Return the models, along with every model they relate to"""
+    related = set()
+    for model in models:
+        related.add(model)
+        for field in model._meta.get_fields(include_hidden=True):
+            if field.is_relation and field.related_model is not None:
+                related.add(field.related_model)
+                through = getattr(getattr(field, 'remote_field', None), 'through', None)
+                if isinstance(through, type):
+                    related.add(through)
+    return related
+
+
+def _get_model_fingerprint(model: type) -> Dict[str, Any]:
+    """Return the row count, greatest primary key, and latest auto_now values of a model"""
+    from django.db.models import Count, Max
+
+    aggregates = {'count': Count('*'), 'max_pk': Max('pk')}
+    for field in model._meta.concrete_fields:
+        if getattr(field, 'auto_now', False):
+            aggregates[f'max_{field.attname}'] = Max(field.attname)
+
+    return model._base_manager.aggregate(**aggregates)
+
+
+class ResponseCache:
+    """Responses stored on disk, keyed by a hash of everything behind the request
+
+    NOTE: fixture data which differs from run to run (e.g. timestamps, or
+          primary keys drawn from sequences which are never rolled back) yields
+          a new key every run, so those requests are always performed.
+    """
+
+    def __init__(self, path: str, max_size: int = 100 * 1024 * 1024, rootdir: Optional[str] = None):
+        self.path = path
+        self.max_size = max_size
+        self.rootdir = rootdir or os.getcwd()
+
+        self.hits = 0
+        self.misses = 0
+        self._file_digests: Dict[str, str] = {}
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+            # NOTE: isolation_level=None commits every statement immediately,
+            #       so concurrent sessions (e.g. xdist workers) only ever hold
+            #       the lock briefly.
+            self._connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                '  key TEXT PRIMARY KEY,'
+                '  status INTEGER NOT NULL,'
+                '  headers TEXT NOT NULL,'
+                '  content BLOB NOT NULL,'
+                '  size INTEGER NOT NULL,'
+                '  accessed REAL NOT NULL'
+                ')'
+            )
+        return self._connection
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get_key(self,
+                http_method: str,
+                url: str,
+                data: Any,
+                headers: Mapping[str, str],
+                client) -> str:
+        """Return the key storing the response to a request"""
+        return _hash_json({
+            'method': http_method.lower(),
+            'url': url,
+            'data': data,
+            'headers': headers,
+            'client': _get_client_identity(client),
+            'code': self.get_code_fingerprint(url),
+            'data_fingerprint': self.get_data_fingerprint(url),
+        })
+
+    def get_code_fingerprint(self, url: str) -> Dict[str, Any]:
+        """Return the digests of the source files the endpoint serving a URL depends on"""
+        import django
+        import rest_framework
+        from django.conf import settings
+
+        import pytest_drf
+
+        paths = set(get_endpoint_dependencies(url, self.rootdir))
+        urlconf_path = _get_module_file(settings.ROOT_URLCONF, self.rootdir)
+        if urlconf_path is not None:
+            paths.add(urlconf_path)
+
+        return {
+            'versions': [django.__version__, rest_framework.VERSION, pytest_drf.__version__],
+            'files': {path: self._get_file_digest(path) for path in sorted(paths)},
+        }
+
+    def get_data_fingerprint(self, url: str) -> Dict[str, Dict[str, Any]]:
+        """Return aggregates of the rows of every model the endpoint serving a URL may read
+
+        NOTE: only aggregates of each model's rows are read (one query per
+              model, however many rows it has), so rows being created or
+              deleted invalidate stored responses — but updates to existing
+              rows only do so if the model has an auto_now field (e.g. an
+              `updated_at` timestamp). Tests updating rows of other models
+              before their request should not use CachesResponse.
+        """
+        from django.contrib.auth import get_user_model
+        from django.db.models import Model
+
+        endpoint = get_endpoint_classes(url)
+        classes = endpoint[1] if endpoint is not None else []
+        models = [cls for cls in classes if issubclass(cls, Model)]
+        models.append(get_user_model())
+
+        return {
+            model._meta.label: _get_model_fingerprint(model)
+            for model in sorted(_get_related_models(models), key=lambda model: model._meta.label)
+        }
+
+    def _get_file_digest(self, path: str) -> str:
+        # NOTE: source files don't change during a session, so each is hashed once
+        digest = self._file_digests.get(path)
+        if digest is None:
+            with open(os.path.join(self.rootdir, path), 'rb') as fp:
+                digest = self._file_digests[path] = hashlib.sha256(fp.read()).hexdigest()
+        return digest
+
+    def get(self, key: str):
+        """Return the response stored under key, or None"""
+        from django.http import HttpResponse
+
+        from pytest_drf.util import decode_json
+
+        row = self.connection.execute(
+            'SELECT status, headers, content FROM responses WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.connection.execute('UPDATE responses SET accessed = ? WHERE key = ?', (time.time(), key))
+
+        status, headers, content = row
+        response = HttpResponse(zlib.decompress(content), status=status)
+        for name, value in json.loads(headers):
+            response[name] = value
+
+        response.json = partial(decode_json, response)
+        response.from_response_cache = True
+        return response
+
+    def set(self, key: str, response) -> bool:
+        """Store the response under key, returning whether it could be stored
+
+        Streaming responses are not stored.
+        """
+        if getattr(response, 'streaming', False):
+            return False
+
+        headers: List[List[str]] = [[name, value] for name, value in response.items()]
+        content = zlib.compress(response.content)
+        size = len(content) + len(key)
+
+        self.connection.execute(
+            'INSERT OR REPLACE INTO responses (key, status, headers, content, size, accessed) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (key, response.status_code, json.dumps(headers), content, size, time.time()),
+        )
+        self.evict()
+        return True
+
+    def evict(self):
+        """Delete the least recently used responses, until the store fits in max_size"""
+        excess = self.size - self.max_size
+        if excess <= 0:
+            return
+
+        # NOTE: the responses to delete are picked by walking them in order of
+        #       access, rather than with a window function, which would require
+        #       SQLite 3.25+
+        keys = []
+        rows = self.connection.execute('SELECT key, size FROM responses ORDER BY accessed, key DESC')
+        for key, size in rows:
+            if excess <= 0:
+                break
+            keys.append((key,))
+            excess -= size
+        rows.close()
+
+        self.connection.executemany('DELETE FROM responses WHERE key = ?', keys)
+
+    @property
+    def size(self) -> int:
+        """Total size of the stored responses, in bytes"""
+        total_size, = self.connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()
+        return total_size
+
+    def __len__(self) -> int:
+        count, = self.connection.execute('SELECT COUNT(*) FROM responses').fetchone()
+        return count
@@ -1,4 +1,21 @@
-from rest_framework.test import APIClient
+import copy
+import weakref
+from collections import defaultdict
+from functools import lru_cache, partial
+from http.cookies import SimpleCookie
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Type
+
+from django.core.exceptions import PermissionDenied, SuspiciousOperation
+from django.core.handlers.exception import response_for_exception
+from django.core.signals import request_finished, request_started, setting_changed
+from django.db import close_old_connections
+from django.test.client import RequestFactory
+from django.http import Http404
+from django.urls import ResolverMatch, URLResolver, get_resolver, get_urlconf
+from rest_framework.test import APIClient, force_authenticate
+
+from pytest_drf.profiling import EndpointProfiler
+from pytest_drf.util import decode_json
 
 
 class DRFTestClient(APIClient):
@@ -21,6 +38,304 @@ class DRFTestClient(APIClient):
                 f'HTTP_{name.upper().replace("-", "_")}': value
                 for name, value in headers.items()
             })
-        return super().generic(method, path, data, content_type, secure, **extra)
+
+        profiler = EndpointProfiler.active
+        if profiler is None:
+            return super().generic(method, path, data, content_type, secure, **extra)
+
+        with profiler.profile_request(method, path) as record:
+            record.response = super().generic(method, path, data, content_type, secure, **extra)
+        return record.response
+
+    def _parse_json(self, response, **extra):
+        # NOTE: kwargs for json.loads (e.g. object_hook) can't be honoured by
+        #       other decoders, so we only swap in the fast decoder without them.
+        if extra:
+            return super()._parse_json(response, **extra)
+        return decode_json(response)
+
+
+@lru_cache(maxsize=4096)
+def _resolve(path: str, resolver: URLResolver) -> ResolverMatch:
+    # NOTE: resolutions are keyed by the resolver, which Django creates anew
+    #       whenever its URL caches are cleared (e.g. by clear_url_caches()),
+    #       so a URLconf which has since changed is never resolved from cache.
+    return resolver.resolve(path)
+
+
+class DRFDirectTestClient(DRFTestClient):
+    """DRFTestClient which calls views directly, skipping the request handler
+
+    Requests are built just as DRFTestClient builds them, but instead of being
+    passed through the WSGI handler (and thus the middleware stack), the view
+    serving the URL is called directly. URL resolution is cached, so each URL
+    is resolved only once (until Django's URL caches are cleared, or the
+    ROOT_URLCONF setting is changed).
+
+    As with Django's handler, unresolvable URLs, and Http404, PermissionDenied,
+    or SuspiciousOperation raised by views, are converted into error responses
+    (e.g. 404). Other exceptions are raised.
+
+    This is intended for tests which only concern themselves with the behaviour
+    of views and serializers. Since middleware is skipped, anything it would
+    provide (e.g. `request.user` from AuthenticationMiddleware, or sessions) is
+    unavailable. Authenticate with force_authenticate() or credentials() instead.
+    """
+
+    #: Exceptions converted into responses, as Django's request handler does
+    handled_exceptions = (Http404, PermissionDenied, SuspiciousOperation)
+
+    def request(self, **kwargs):
+        # Ensure that any credentials set get added to every request.
+        kwargs.update(self._credentials)
+
+        # NOTE: we skip APIClient/Client.request, which pass the request to the
+        #       handler, and instead build the request object ourselves.
+        request = RequestFactory.request(self, **kwargs)
+        request._dont_enforce_csrf_checks = not self.enforce_csrf_checks
+        force_authenticate(request, self.handler._force_user, self.handler._force_token)
+
+        resolver_match = None
+
+        # Mimic the test client's handler, so request_started/request_finished
+        # receivers (e.g. DB query capturing) behave as they would normally.
+        request_started.disconnect(close_old_connections)
+        request_finished.disconnect(close_old_connections)
+        try:
+            request_started.send(sender=self.__class__, environ=request.environ)
+            try:
+                resolver_match = _resolve(request.path_info, get_resolver(get_urlconf()))
+                request.resolver_match = resolver_match
+
+                response = resolver_match.func(request, *resolver_match.args, **resolver_match.kwargs)
+                if callable(getattr(response, 'render', None)):
+                    response = response.render()
+            except self.handled_exceptions as exc:
+                # NOTE: Resolver404, raised for unresolvable URLs, is an Http404
+                response = response_for_exception(request, exc)
+            finally:
+                request_finished.send(sender=self.__class__)
+        finally:
+            request_started.connect(close_old_connections)
+            request_finished.connect(close_old_connections)
+
+        # Save the client and request that stimulated the response, as Client does
+        response.client = self
+        response.request = kwargs
+        response.wsgi_request = request
+        response.resolver_match = resolver_match
+        response.templates = []
+        response.context = None
+        response.json = partial(self._parse_json, response)
+
+        # Update persistent cookie data.
+        if response.cookies:
+            self.cookies.update(response.cookies)
+
+        return response
+
+
+def _get_user_key(user) -> Optional[Hashable]:
+    """Return a key identifying the user across tests (where instances differ)"""
+    if user is None:
+        return None
+    return type(user)._meta.label, user.pk
+
+
+class _Credentials(NamedTuple):
+    """Auth artifacts left on a client by DRFTestClientPool's authenticate method"""
+    credentials: Dict[str, str]
+    cookies: SimpleCookie
+
+
+class DRFTestClientPool:
+    """Reusable test clients, kept for the session and keyed by their user
+
+    Building a test client is cheap, but each new client's handler loads the
+    middleware chain anew on its first request. Clients released back to the
+    pool are handed out again on a later acquire() for the same user, and all
+    clients in the pool share a single middleware chain.
+
+    Before a client is handed out, it's returned to the state it was created
+    in: cookies, credentials(), force_authenticate(), and any other attributes
+    set on the client are discarded.
+
+    By default, clients are authenticated with force_authenticate(). If an
+    `authenticate(client, user)` method is passed, it's called instead — e.g.
+    to obtain a real token, or log in to a session — and the credentials and
+    cookies it leaves on the client are cached per user, and reused for any
+    later client acquired for that user.
+
+    NOTE: cached credentials are only valid for as long as the artifacts they
+          refer to (tokens, sessions) exist — and users are only identified by
+          their primary key. Call forget_credentials() whenever these are
+          rolled back (the `create_drf_client` fixture does so after each test).
+
+    Credentials may also be shared between tests: share_credentials()
+    authenticates to a user right away — e.g. within the class or session
+    transaction the user was created in — and keeps the credentials, past
+    forget_credentials(), until forget_shared_credentials() is called when that
+    transaction is rolled back (`user_fixture` does both).
+
+    If `reuse` is False, released clients are discarded, and each new client
+    loads its own middleware chain.
+    """
+
+    def __init__(self,
+                 client_class: Type[DRFTestClient] = DRFTestClient,
+                 authenticate: Optional[Callable[[DRFTestClient, Any], None]] = None,
+                 reuse: bool = True):
+        self.client_class = client_class
+        self.authenticate = authenticate
+        self.reuse = reuse
+
+        self._idle: Dict[Hashable, List[DRFTestClient]] = defaultdict(list)
+        self._in_use: 'weakref.WeakSet[DRFTestClient]' = weakref.WeakSet()
+        self._credentials: Dict[Hashable, _Credentials] = {}
+        self._shared_credentials: Dict[Hashable, _Credentials] = {}
+        self._pristine_states: 'weakref.WeakKeyDictionary[DRFTestClient, Dict[str, Any]]' = weakref.WeakKeyDictionary()
+        self._middleware_handler = None
+
+        _client_pools.add(self)
+
+    def acquire(self, user=None) -> DRFTestClient:
+        """Return a fresh-as-new client, authenticated to user (if not None)"""
+        key = _get_user_key(user)
+        idle = self._idle.get(key)
+        if idle:
+            client = idle.pop()
+            self._reset(client)
+        else:
+            client = self._create_client()
+
+        client._pool_key = key
+        self._in_use.add(client)
+
+        if user is not None:
+            self._authenticate(client, user, key)
+        return client
+
+    def release(self, client: DRFTestClient):
+        """Return a client to the pool, to be handed out by a later acquire()"""
+        self._in_use.discard(client)
+        if self.reuse:
+            self._idle[getattr(client, '_pool_key', None)].append(client)
+
+    def share_credentials(self, user) -> Optional[Hashable]:
+        """Authenticate to user now, and reuse the credentials until forget_shared_credentials()
+
+        Returns the key to pass to forget_shared_credentials(), or None if
+        clients are force-authenticated (and so have no credentials to share).
+        """
+        if self.authenticate is None:
+            return None
+
+        key = _get_user_key(user)
+        client = self.acquire()
+        try:
+            self.authenticate(client, user)
+            self._shared_credentials[key] = _Credentials(
+                credentials=dict(client._credentials),
+                cookies=copy.deepcopy(client.cookies),
+            )
+        finally:
+            self.release(client)
+        return key
+
+    def forget_shared_credentials(self, key: Hashable):
+        """Discard the credentials shared by share_credentials()"""
+        self._shared_credentials.pop(key, None)
+
+    def forget_credentials(self):
+        """Discard cached credentials, so each user is authenticated anew on next acquire()
+
+        Credentials shared by share_credentials() are kept.
+        """
+        self._credentials.clear()
+
+    def clear(self):
+        """Discard all idle clients, cached credentials, and the shared middleware
+        """
+        self._idle.clear()
+        self.forget_credentials()
+        self._shared_credentials.clear()
+        self._middleware_handler = None
+
+        # Clients still in use keep working, but load the middleware anew
+        for client in self._in_use:
+            client.handler._middleware_chain = None
+
+    def _create_client(self) -> DRFTestClient:
+        client = self.client_class()
+        if self.reuse:
+            self._share_middleware(client.handler)
+        self._pristine_states[client] = {
+            name: copy.copy(value)
+            for name, value in vars(client).items()
+            if name != 'handler'
+        }
+        return client
+
+    def _reset(self, client: DRFTestClient):
+        pristine_state = self._pristine_states[client]
+        handler = client.handler
+
+        vars(client).clear()
+        vars(client).update({name: copy.copy(value) for name, value in pristine_state.items()})
+        client.handler = handler
+        handler._force_user = None
+        handler._force_token = None
+
+        if handler._middleware_chain is None and self.reuse:
+            self._share_middleware(handler)
+
+    def _share_middleware(self, handler):
+        if self._middleware_handler is None:
+            handler.load_middleware()
+            self._middleware_handler = handler
+            return
+
+        # NOTE: the middleware chain ends in the loading handler's _get_response,
+        #       which only relies on the middleware lists shared here. Force
+        #       authentication happens earlier, in each handler's get_response.
+        for attr in ('_view_middleware', '_template_response_middleware',
+                     '_exception_middleware', '_middleware_chain'):
+            setattr(handler, attr, getattr(self._middleware_handler, attr))
+
+    def _authenticate(self, client: DRFTestClient, user, key: Hashable):
+        if self.authenticate is None:
+            client.force_authenticate(user=user)
+            return
+
+        cached = self._shared_credentials.get(key) or self._credentials.get(key)
+        if cached is None:
+            self.authenticate(client, user)
+            cached = self._credentials[key] = _Credentials(
+                credentials=dict(client._credentials),
+                cookies=copy.deepcopy(client.cookies),
+            )
+        else:
+            client.credentials(**cached.credentials)
+            client.cookies.update(copy.deepcopy(cached.cookies))
+
+
+_client_pools: 'weakref.WeakSet[DRFTestClientPool]' = weakref.WeakSet()
+
+
+def _clear_client_pools_on_middleware_change(*, setting, **kwargs):
+    if setting == 'MIDDLEWARE':
+        for pool in _client_pools:
+            pool.clear()
+
+
+setting_changed.connect(_clear_client_pools_on_middleware_change)
+
+
+def _clear_resolve_cache_on_urlconf_change(*, setting, **kwargs):
+    # NOTE: stale resolutions could never be hit again, but would hold on to
+    #       their resolvers (and URLconfs) until evicted
+    if setting == 'ROOT_URLCONF':
+        _resolve.cache_clear()
 
 
+setting_changed.connect(_clear_resolve_cache_on_urlconf_change)
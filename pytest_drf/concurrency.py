@@ -0,0 +1,298 @@
+"""
+Concurrent requests
+===================
+
+This module contains the ConcurrentRequests test mixin, which fires many copies
+of a test context's request at a live, in-process server from a pool of worker
+threads — exercising the behaviour of an endpoint under concurrency (lock
+contention, connection exhaustion, throttling, etc), which the test client's
+one-request-at-a-time model never does.
+
+"""
+import json
+import socket
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Collection, Dict, List, Optional, TYPE_CHECKING, Type
+from urllib.parse import urlencode
+
+import pytest
+from pytest_lambda import static_fixture
+
+from pytest_drf.benchmarks import BenchmarkStats
+
+if TYPE_CHECKING:
+    from pytest_drf.client import DRFTestClient
+
+__all__ = ['ConcurrentRequests', 'ConcurrentResults']
+
+
+@dataclass
+class ConcurrentResults:
+    """Outcome of firing a batch of concurrent requests"""
+
+    #: Status code of each request, in the order the requests were submitted
+    #: (None for requests which timed out)
+    statuses: List[Optional[int]]
+
+    #: Latency of each request (in seconds), in the order the requests were submitted
+    timings: List[float]
+
+    #: Wall time (in seconds) taken to complete all requests
+    duration: float
+
+    @property
+    def throughput(self) -> float:
+        """Requests completed per second"""
+        return len(self.statuses) / self.duration if self.duration else 0.0
+
+    @property
+    def latency(self) -> BenchmarkStats:
+        return BenchmarkStats.from_timings(self.timings)
+
+    @property
+    def timeouts(self) -> int:
+        """Number of requests which timed out"""
+        return self.statuses.count(None)
+
+    def get_unexpected_statuses(self, expected_statuses: Collection[int]) -> Dict[int, int]:
+        """Return the number of requests returning each unexpected status code"""
+        unexpected: Dict[int, int] = {}
+        for status in self.statuses:
+            if status is not None and status not in expected_statuses:
+                unexpected[status] = unexpected.get(status, 0) + 1
+        return unexpected
+
+    def format(self) -> str:
+        return (
+            f'{len(self.statuses)} requests in {self.duration:.2f}s '
+            f'({self.throughput:.1f} req/s); latency: {self.latency.format()}'
+        )
+
+
+def _get_client_headers(client: 'DRFTestClient') -> Dict[str, str]:
+    """Return headers carrying the credentials and cookies set on a test client
+
+    NOTE: force_authenticate() cannot be carried over to a live server, as it
+          bypasses the authentication classes entirely.
+    """
+    headers = {
+        name[len('HTTP_'):].replace('_', '-').title(): value
+        for name, value in getattr(client, '_credentials', {}).items()
+        if name.startswith('HTTP_')
+    }
+
+    cookies = getattr(client, 'cookies', None)
+    if cookies:
+        headers['Cookie'] = '; '.join(
+            f'{morsel.key}={morsel.coded_value}'
+            for morsel in cookies.values()
+        )
+
+    return headers
+
+
+def _assert_handles_concurrent_requests(results: ConcurrentResults,
+                                        expected_statuses: Collection[int],
+                                        timeout: float):
+    assert not results.timeouts, (
+        f'{results.timeouts} of {len(results.statuses)} concurrent requests '
+        f'timed out after {timeout}s\n'
+        f'  {results.format()}'
+    )
+
+    expected = {}
+    actual = results.get_unexpected_statuses(expected_statuses)
+    assert expected == actual, (
+        f'Unexpected status codes (status: number of requests) received while '
+        f'performing concurrent requests: {actual}\n'
+        f'  {results.format()}'
+    )
+
+
+class _ConcurrentRequestsMeta(type):
+    # This metaclass allows ConcurrentRequests(n, workers=k) to return a test
+    # mixin with the num_concurrent_requests and concurrent_workers fixtures
+    # defined as n and k, respectively.
+
+    def __call__(cls, *args, **kwargs) -> Type['ConcurrentRequests']:
+        if cls is not ConcurrentRequests:
+            return super().__call__(*args, **kwargs)
+
+        num_requests, = args
+        workers = kwargs.pop('workers', 8)
+        if kwargs:
+            raise TypeError(f'Unexpected keyword arguments: {", ".join(kwargs)}')
+
+        # We create a copy of this method, so we can change its name to
+        # include the number of requests.
+        def test_it_handles_concurrent_requests(self,
+                                                concurrent_results,
+                                                concurrent_expected_statuses,
+                                                concurrent_request_timeout):
+            _assert_handles_concurrent_requests(
+                concurrent_results, concurrent_expected_statuses, concurrent_request_timeout)
+
+        test_name = f'test_it_handles_{num_requests}_concurrent_requests'
+        test_it_handles_concurrent_requests.__name__ = test_name
+
+        return type(f'ConcurrentRequests{num_requests}With{workers}Workers', (ConcurrentRequests,), {
+            test_name: test_it_handles_concurrent_requests,
+            'num_concurrent_requests': static_fixture(num_requests),
+            'concurrent_workers': static_fixture(workers),
+
+            # Disable the original method
+            'test_it_handles_concurrent_requests': None,
+        })
+
+
+class ConcurrentRequests(metaclass=_ConcurrentRequestsMeta):
+    """Includes test which fires the request many times concurrently at a live server
+
+    The request (`http_method`, `full_url`, `data`, and `headers`) is sent to
+    the server at `live_server_url` (see pytest_drf.fixtures) N times from K worker threads. The test
+    fails if any request returns a status other than `concurrent_expected_statuses`
+    (by default, the `expected_status_code` of any ReturnsStatus mixin, or any
+    2xx status otherwise), or takes longer than `concurrent_request_timeout`
+    seconds (by default, 30). Throughput and latency are recorded in the test's
+    user_properties (e.g. for --junitxml), and available from the
+    `concurrent_results` fixture.
+
+        class DescribeList(
+            UsesGetMethod,
+            UsesListEndpoint,
+
+            Returns200,
+            ConcurrentRequests(100, workers=16),
+        ):
+            ...
+
+    NOTE: the live server runs in another thread, and so cannot see any data
+          created in an uncommitted transaction (unless using an in-memory
+          SQLite DB, whose connection Django shares with live server threads).
+
+    NOTE: credentials set with client.credentials() and cookies are sent
+          along with each request, but force_authenticate() cannot be carried
+          over to a live server. Use header-based authentication instead.
+
+    """
+
+    @pytest.fixture
+    def num_concurrent_requests(self) -> int:
+        raise NotImplementedError(
+            'Please define the num_concurrent_requests fixture. Alternatively, '
+            'subclass ConcurrentRequests(n) instead of the bare ConcurrentRequests.'
+        )
+
+    @pytest.fixture
+    def concurrent_workers(self) -> int:
+        """Number of threads sending requests simultaneously"""
+        return 8
+
+    @pytest.fixture
+    def concurrent_expected_statuses(self, request) -> Collection[int]:
+        """Status codes which the concurrent requests may return"""
+        try:
+            return {request.getfixturevalue('expected_status_code')}
+        except (pytest.FixtureLookupError, NotImplementedError):
+            return range(200, 300)
+
+    @pytest.fixture
+    def concurrent_request_timeout(self) -> float:
+        """Seconds to wait for each response before counting the request as timed out"""
+        return 30
+
+    @pytest.fixture
+    def send_live_request(self,
+                          live_server_url: str,
+                          http_method: str,
+                          full_url: str,
+                          data: Any,
+                          headers: Dict[str, str],
+                          client: 'DRFTestClient',
+                          concurrent_request_timeout: float,
+                          ) -> Callable[[], Optional[int]]:
+        """A 0-arg method which sends the request to the live server, returning its status
+
+        None is returned if the request times out.
+        """
+        url = live_server_url.rstrip('/') + full_url
+        method = http_method.upper()
+        request_headers = {**_get_client_headers(client), **(headers or {})}
+
+        body: Optional[bytes] = None
+        if data is not None:
+            if method in ('GET', 'HEAD', 'OPTIONS', 'DELETE'):
+                separator = '&' if '?' in url else '?'
+                url += separator + urlencode(data, doseq=True)
+            else:
+                body = json.dumps(data).encode('utf-8')
+                request_headers.setdefault('Content-Type', 'application/json')
+
+        def send_live_request() -> Optional[int]:
+            live_request = urllib.request.Request(url, data=body, headers=request_headers, method=method)
+            try:
+                with urllib.request.urlopen(live_request, timeout=concurrent_request_timeout) as response:
+                    response.read()
+                    return response.status
+            except urllib.error.HTTPError as e:
+                return e.code
+            except socket.timeout:
+                return None
+            except urllib.error.URLError as e:
+                # NOTE: timeouts while connecting are wrapped in URLError
+                if isinstance(e.reason, socket.timeout):
+                    return None
+                raise
+
+        return send_live_request
+
+    @pytest.fixture
+    def concurrent_results(self,
+                           request,
+                           send_live_request: Callable[[], Optional[int]],
+                           num_concurrent_requests: int,
+                           concurrent_workers: int,
+                           ) -> ConcurrentResults:
+        """Statuses and timings from firing the concurrent requests"""
+
+        def timed_request(_) -> tuple:
+            start = time.perf_counter()
+            status = send_live_request()
+            return status, time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrent_workers) as executor:
+            outcomes = list(executor.map(timed_request, range(num_concurrent_requests)))
+        duration = time.perf_counter() - start
+
+        results = ConcurrentResults(
+            statuses=[status for status, _ in outcomes],
+            timings=[timing for _, timing in outcomes],
+            duration=duration,
+        )
+
+        request.node.user_properties.append(('drf_concurrent_requests', {
+            'requests': num_concurrent_requests,
+            'workers': concurrent_workers,
+            'throughput': results.throughput,
+            'timeouts': results.timeouts,
+            'latency': asdict(results.latency),
+        }))
+        return results
+
+    def test_it_handles_concurrent_requests(self,
+                                            concurrent_results,
+                                            concurrent_expected_statuses,
+                                            concurrent_request_timeout):
+        _assert_handles_concurrent_requests(
+            concurrent_results, concurrent_expected_statuses, concurrent_request_timeout)
+
+    if TYPE_CHECKING:
+        # this appeases code sense, which may not be able to understand how the
+        # metaclass allows using instantiation syntax without really instantiating.
+        def __new__(cls, num_requests: int, *, workers: int = 8) -> Type['ConcurrentRequests']:
+            ...
@@ -0,0 +1,64 @@
+"""
+Sharing fixture data between tests
+==================================
+
+This module contains helpers for declaring fixtures which create DB rows only
+once for all the tests in a class — pytest-drf's equivalent of Django's
+`TestCase.setUpTestData`.
+
+"""
+from functools import partial
+from typing import Any, Callable
+
+from pytest_drf.fixtures import _shared_db_fixture
+
+__all__ = [
+    'class_fixture',
+    'describe_fixture',
+]
+
+
+def class_fixture(fn: Callable[..., Any] = None, *, autouse: bool = False):
+    """Declare a fixture creating DB rows once for all the tests in a class
+
+    Like `lambda_fixture`, the method may request other fixtures (of class or
+    broader scope) with its params. It's called only for the first test of
+    each class requesting it, inside a transaction which is rolled back after
+    the class's last test (see `class_db_transaction`).
+
+    Each test requesting the fixture runs within a savepoint, so any changes
+    it makes to the DB are rolled back before the next test. And any changes
+    made to the returned model instances (or lists, tuples, or dicts of them)
+    are undone by restoring a snapshot of their state — no DB queries required.
+
+        class DescribeList(
+            UsesGetMethod,
+            UsesListEndpoint,
+            Returns200,
+        ):
+            key_values = class_fixture(
+                lambda: KeyValue.objects.create_batch(
+                    quay='worth',
+                    chi='revenue',
+                    umma='gumma',
+                ),
+                autouse=True,
+            )
+
+            def it_returns_key_values(self, key_values, results):
+                ...
+
+    NOTE: each class (including nested child contexts) creates its own rows.
+          Declare the fixture on the innermost class whose tests share them.
+
+    NOTE: if your test harness does not hold transactions open between tests
+          (e.g. it recreates the test DB for every test), rows created by the
+          fixture will not outlive the first test.
+    """
+    if fn is None:
+        return partial(class_fixture, autouse=autouse)
+    return _shared_db_fixture(fn, 'class', autouse=autouse)
+
+
+#: Alias of class_fixture, for suites naming their test classes Describe*
+describe_fixture = class_fixture
@@ -0,0 +1,125 @@
+"""
+Distributing tests with pytest-xdist
+====================================
+
+This module contains the `--drf-dist=describe` scheduler for pytest-xdist,
+which sends every test of a top-level Describe class (e.g. a ViewSetTest and
+all its nested contexts) to the same worker — so class- and module-level data
+and fixtures are built once, on one worker, rather than once on every worker
+the class's tests would otherwise be scattered across.
+
+Classes are balanced between workers by cost: the time each took to run in
+previous sessions is recorded in the pytest cache, and the most costly classes
+are handed out first (classes without a recorded duration are estimated from
+their number of tests).
+
+    pytest -n 32 --drf-dist=describe
+
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional
+
+try:
+    from xdist.scheduler import LoadScopeScheduling
+except ImportError:
+    LoadScopeScheduling = object
+
+__all__ = ['LoadDescribeScheduling', 'ScopeDurations']
+
+
+#: pytest cache key storing the duration and number of tests of each Describe class
+DURATIONS_CACHE_KEY = 'drf/describe-durations'
+
+
+def get_describe_scope(nodeid: str) -> str:
+    """Return the node ID of the top-level class (or module) containing a test
+
+    >>> get_describe_scope('tests/test_views.py::DescribeList::ContextEmpty::it_returns_200')
+    'tests/test_views.py::DescribeList'
+    >>> get_describe_scope('tests/test_utils.py::test_url_for')
+    'tests/test_utils.py'
+    """
+    parts = nodeid.split('::', 2)
+    if len(parts) > 2:
+        return '::'.join(parts[:2])
+    return parts[0]
+
+
+def order_by_cost(workqueue: Mapping[str, Mapping[str, Any]],
+                  durations: Mapping[str, Mapping[str, float]],
+                  ) -> 'OrderedDict[str, Any]':
+    """Order the work units (scope: {nodeid: completed}) from most to least costly
+
+    A scope's cost is its recorded duration. Scopes which were not recorded are
+    estimated from their number of tests, at the mean duration of all
+    recorded tests.
+    """
+    total_duration = sum(entry['duration'] for entry in durations.values())
+    total_tests = sum(entry['tests'] for entry in durations.values())
+    mean_test_duration = total_duration / total_tests if total_tests else 1.0
+
+    def get_cost(scope: str, work_unit: Mapping[str, Any]) -> float:
+        entry = durations.get(scope)
+        if entry is not None:
+            return entry['duration']
+        return mean_test_duration * len(work_unit)
+
+    return OrderedDict(sorted(
+        workqueue.items(),
+        key=lambda item: get_cost(*item),
+        reverse=True,
+    ))
+
+
+class LoadDescribeScheduling(LoadScopeScheduling):
+    """Schedules whole top-level Describe classes to workers, most costly first
+
+    As with xdist's loadscope scheduling, each worker is handed another class
+    as soon as it's nearly out of work — which, with the costliest classes
+    handed out first, balances the load between workers.
+    """
+
+    def __init__(self, config, log=None, durations: Optional[Mapping[str, Mapping[str, float]]] = None):
+        super().__init__(config, log)
+        self.durations = durations or {}
+        self._is_ordered = False
+
+    def _split_scope(self, nodeid: str) -> str:
+        return get_describe_scope(nodeid)
+
+    def _assign_work_unit(self, node):
+        # NOTE: the workqueue is only filled when scheduling begins, right
+        #       before the first work unit is assigned
+        if not self._is_ordered:
+            self.workqueue = order_by_cost(self.workqueue, self.durations)
+            self._is_ordered = True
+
+        super()._assign_work_unit(node)
+
+
+class ScopeDurations:
+    """Records how long each top-level Describe class took to run
+
+    An instance is registered as a plugin for the test session (on the xdist
+    controller, which receives the reports of every worker), and the durations
+    are merged into the pytest cache when the session finishes.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._recorded: Dict[str, Dict[str, float]] = {}
+
+    def load(self) -> Dict[str, Dict[str, float]]:
+        return self.cache.get(DURATIONS_CACHE_KEY, {})
+
+    def pytest_runtest_logreport(self, report):
+        entry = self._recorded.setdefault(get_describe_scope(report.nodeid), {'duration': 0.0, 'tests': 0})
+        entry['duration'] += report.duration
+        if report.when == 'setup':
+            entry['tests'] += 1
+
+    def pytest_sessionfinish(self, session):
+        if not self._recorded:
+            return
+
+        self.cache.set(DURATIONS_CACHE_KEY, {**self.load(), **self._recorded})
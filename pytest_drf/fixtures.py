@@ -1,41 +1,475 @@
-from typing import Callable, TYPE_CHECKING
+import inspect
+import os
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, TYPE_CHECKING
 
 import pytest
+from pytest_lambda import lambda_fixture
 
 if TYPE_CHECKING:
     # NOTE: APIClient forward refs used to avoid loading Django settings too early
-    from pytest_drf.client import DRFTestClient
+    from pytest_drf.async_client import DRFAsyncTestClient
+    from pytest_drf.caching import ResponseCache
+    from pytest_drf.client import DRFDirectTestClient, DRFTestClient, DRFTestClientPool
+    from pytest_drf.openapi import OpenAPIValidator
+    from pytest_drf.util import InstanceSnapshot
+    from pytest_lambda.impl import LambdaFixture
     from django.contrib.auth.models import User
 
 
-__all__ = ['create_drf_client', 'unauthed_client']
+__all__ = [
+    'drf_client_authenticator',
+    'drf_client_pool',
+    'create_drf_client',
+    'unauthed_client',
+    'create_drf_async_client',
+    'unauthed_async_client',
+    'create_drf_direct_client',
+    'unauthed_direct_client',
+    'json_decoder',
+    'drf_response_cache',
+    'openapi_schema',
+    'openapi_validator',
+    'class_db_transaction',
+    'session_db_transaction',
+    'shared_db_fixture_savepoint',
+    'live_server_url',
+]
+
+
+@pytest.fixture(scope='session')
+def drf_client_authenticator() -> Optional[Callable[['DRFTestClient', 'User'], None]]:
+    """A method authenticating a test client to a user, or None to force authentication
+
+    By default, clients are authenticated with force_authenticate(), which
+    skips the authentication classes entirely. To authenticate with real
+    credentials instead, override this fixture with a method which leaves them
+    on the client, e.g.
+
+        @pytest.fixture(scope='session')
+        def drf_client_authenticator():
+            def authenticate(client, user):
+                token, _ = Token.objects.get_or_create(user=user)
+                client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+            return authenticate
+
+    The credentials and cookies left on the client are cached by the client
+    pool, and reused for every later client authenticated to the same user
+    within the same test. Users declared with `user_fixture()` are
+    authenticated only once, when they're created, and their credentials are
+    reused by every test until the user's transaction is rolled back.
+    """
+    return None
+
+
+@pytest.fixture(scope='session')
+def drf_client_pool(request, drf_client_authenticator) -> 'DRFTestClientPool':
+    """Session-wide pool of test clients, used by `create_drf_client` and `unauthed_client`
+
+    By default, a new client is created for every test. Pass `--drf-client-pool`
+    to reuse clients released by earlier tests, instead.
+    """
+
+    # NOTE: local import used to avoid loading Django settings too early
+    from pytest_drf.client import DRFTestClient, DRFTestClientPool
+
+    pool = DRFTestClientPool(
+        DRFTestClient,
+        authenticate=drf_client_authenticator,
+        reuse=request.config.getoption('drf_client_pool', False),
+    )
+    yield pool
+    pool.clear()
 
 
 @pytest.fixture
-def create_drf_client() -> Callable[['User'], 'DRFTestClient']:
+def create_drf_client(drf_client_pool) -> Callable[['User'], 'DRFTestClient']:
     """A method returning a test client authenticated to the passed user
 
+    Clients are acquired from the `drf_client_pool`, and released back to it
+    after the test. Any credentials the pool cached during the test are
+    forgotten, too, as the tokens or sessions they refer to are rolled back
+    along with the test's data. (Credentials of users declared with
+    `user_fixture()` outlive the test, as they were obtained along with the
+    user, in its class or session transaction.)
+
     To use a different test client class than the default DRF APIClient, or to
     customize how users are authenticated, override this fixture with your own
-    implementation.
+    implementation (or see `drf_client_authenticator`).
+    """
+    acquired = []
+
+    def create_drf_client(user: 'User') -> 'DRFTestClient':
+        client = drf_client_pool.acquire(user)
+        acquired.append(client)
+        return client
+
+    yield create_drf_client
+
+    for client in acquired:
+        drf_client_pool.release(client)
+    drf_client_pool.forget_credentials()
+
+
+@pytest.fixture
+def unauthed_client(drf_client_pool) -> 'DRFTestClient':
+    """A DRF test client with no authentication"""
+    client = drf_client_pool.acquire()
+    yield client
+    drf_client_pool.release(client)
+
+
+@pytest.fixture
+def create_drf_async_client() -> Callable[['User'], 'DRFAsyncTestClient']:
+    """A method returning an async test client authenticated to the passed user
+
+    This is the AsyncAPIViewTest counterpart of `create_drf_client`.
     """
 
     # NOTE: local import used to avoid loading Django settings too early
-    from pytest_drf.client import DRFTestClient
+    from pytest_drf.async_client import DRFAsyncTestClient
 
-    def create_drf_client(user: 'User') -> 'DRFTestClient':
-        client = DRFTestClient()
+    def create_drf_async_client(user: 'User') -> 'DRFAsyncTestClient':
+        client = DRFAsyncTestClient()
         client.force_authenticate(user=user)
         return client
 
-    return create_drf_client
+    return create_drf_async_client
 
 
 @pytest.fixture
-def unauthed_client() -> 'DRFTestClient':
-    """A DRF test client with no authentication"""
+def unauthed_async_client() -> 'DRFAsyncTestClient':
+    """A DRF async test client with no authentication"""
+
+    # NOTE: local import used to avoid loading Django settings too early
+    from pytest_drf.async_client import DRFAsyncTestClient
+
+    return DRFAsyncTestClient()
+
+
+@pytest.fixture
+def create_drf_direct_client() -> Callable[['User'], 'DRFDirectTestClient']:
+    """A method returning a direct-dispatch test client authenticated to the passed user
+
+    This is the DispatchesDirectly counterpart of `create_drf_client`.
+    """
+
+    # NOTE: local import used to avoid loading Django settings too early
+    from pytest_drf.client import DRFDirectTestClient
+
+    def create_drf_direct_client(user: 'User') -> 'DRFDirectTestClient':
+        client = DRFDirectTestClient()
+        client.force_authenticate(user=user)
+        return client
+
+    return create_drf_direct_client
+
+
+@pytest.fixture
+def unauthed_direct_client() -> 'DRFDirectTestClient':
+    """A direct-dispatch DRF test client with no authentication"""
+
+    # NOTE: local import used to avoid loading Django settings too early
+    from pytest_drf.client import DRFDirectTestClient
+
+    return DRFDirectTestClient()
+
+
+@pytest.fixture
+def json_decoder() -> Callable[[bytes], Any]:
+    """A method decoding the JSON body of responses, for the `json` fixture
+
+    By default, the stdlib's json module is used. To use a different decoder —
+    e.g. the faster orjson (`pip install pytest-drf[orjson]`) — override this
+    fixture:
+
+        @pytest.fixture
+        def json_decoder():
+            return orjson.loads
+
+    """
+
+    # NOTE: local import used to avoid loading Django settings too early
+    from pytest_drf.util import json_loads
+
+    return json_loads
+
+
+@pytest.fixture(scope='session')
+def drf_response_cache(request) -> Optional['ResponseCache']:
+    """On-disk store of responses, reused by CachesResponse tests between runs
+
+    The store is kept in the pytest cache directory (or the rootdir, if the
+    cacheprovider plugin is disabled), and its least recently used responses
+    are evicted once it grows past `--drf-response-cache-size` megabytes.
+
+    Pass `--drf-no-response-cache` to disable the store, performing every
+    request. This fixture is then None.
+    """
+    if request.config.getoption('drf_no_response_cache', False):
+        yield None
+        return
+
+    from pytest_drf.caching import ResponseCache
+
+    rootdir = str(request.config.rootdir)
+    cache = getattr(request.config, 'cache', None)
+    if cache is not None:
+        # NOTE: Cache.mkdir was added in pytest 7.0, replacing Cache.makedir
+        mkdir = getattr(cache, 'mkdir', None) or cache.makedir
+        path = os.path.join(str(mkdir('drf')), 'responses.sqlite3')
+    else:
+        path = os.path.join(rootdir, '.drf-responses.sqlite3')
+
+    max_size_mb = request.config.getoption('drf_response_cache_size', 100)
+    response_cache = ResponseCache(path, max_size=int(max_size_mb * 1024 * 1024), rootdir=rootdir)
+    yield response_cache
+    response_cache.close()
+
+
+def _unblocked_db(request) -> Callable[[], ContextManager]:
+    """Return a context manager allowing DB access outside of tests (with pytest-django)
+    """
+    try:
+        request.getfixturevalue('django_db_setup')
+        return request.getfixturevalue('django_db_blocker').unblock
+    except pytest.FixtureLookupError:
+        return nullcontext
+
+
+def _held_db_transaction(request) -> Iterator[None]:
+    # NOTE: local import used to avoid loading Django settings too early
+    from pytest_drf.util import rolled_back_atomic
+
+    unblocked_db = _unblocked_db(request)
+
+    transaction = rolled_back_atomic()
+    with unblocked_db():
+        transaction.__enter__()
+
+    try:
+        yield
+    finally:
+        with unblocked_db():
+            transaction.__exit__(None, None, None)
+
+
+@pytest.fixture(scope='class')
+def class_db_transaction(request):
+    """Transaction held open for all tests in a class, and rolled back afterward
+
+    This is used by class-scoped conveniences (like the RequestsOnce mixin) to
+    share DB state between tests in the same class, without leaking it into
+    other classes.
+
+    If pytest-django is installed, the test DB is set up and access to it is
+    unblocked while opening and closing the transaction. If your test harness
+    manages the DB differently (e.g. by recreating the test DB for every test,
+    so no transaction can be held open between tests), override this fixture.
+    """
+    yield from _held_db_transaction(request)
+
+
+@pytest.fixture(scope='session')
+def session_db_transaction(request):
+    """Transaction held open for the whole test session, and rolled back afterward
+
+    This is the session-scoped counterpart of `class_db_transaction`, used by
+    fixtures declared with `user_fixture(scope='session')`.
+    """
+    yield from _held_db_transaction(request)
+
+
+#: Snapshots of the values of shared DB fixtures currently set up, by fixture name
+_shared_db_fixture_snapshots: Dict[str, List['InstanceSnapshot']] = {}
+
+
+def _share_user_credentials(request, value: Any):
+    """Authenticate to the users among value now, sharing their credentials until teardown"""
+    # NOTE: local import used to avoid loading Django settings too early
+    from django.contrib.auth import get_user_model
+    from pytest_drf.util.instances import _iter_instances
+
+    pool = request.getfixturevalue('drf_client_pool')
+    if pool.authenticate is None:
+        return
+
+    user_model = get_user_model()
+    with _unblocked_db(request)():
+        keys = [
+            pool.share_credentials(user)
+            for user in _iter_instances(value)
+            if isinstance(user, user_model)
+        ]
+
+    def forget_shared_credentials():
+        for key in keys:
+            pool.forget_shared_credentials(key)
+
+    request.addfinalizer(forget_shared_credentials)
+
+
+def _shared_db_fixture(fn: Callable[..., Any],
+                       scope: str,
+                       autouse: bool = False,
+                       share_credentials: bool = False,
+                       ) -> 'LambdaFixture':
+    """Build a fixture creating DB rows once per class/session, for sharing between tests
+
+    The rows are created within the `class_db_transaction` or
+    `session_db_transaction`, and the in-memory state of the model instances
+    returned is recorded. Before each test requesting the fixture, the
+    instances are restored to that state, and the test is run within a
+    savepoint (see `shared_db_fixture_savepoint`), so any changes the test
+    makes to the rows are rolled back.
+
+    If share_credentials is True, the `drf_client_pool` authenticates to any
+    users returned within the same transaction, and reuses their credentials
+    for every test (see DRFTestClientPool.share_credentials).
+    """
+    if scope not in ('class', 'session'):
+        raise ValueError(f"scope must be 'class' or 'session', not {scope!r}")
+
+    transaction_fixture_name = f'{scope}_db_transaction'
+    fn_params = inspect.signature(fn).parameters
+    fixture_names = [name for name in fn_params if name != 'request']
+
+    def shared_db_fixture(request, **kwargs):
+        # NOTE: local import used to avoid loading Django settings too early
+        from pytest_drf.util import snapshot_instances
+
+        kwargs.pop(transaction_fixture_name, None)
+        if 'request' in fn_params:
+            kwargs['request'] = request
+
+        with _unblocked_db(request)():
+            value = fn(**kwargs)
+
+        if share_credentials:
+            _share_user_credentials(request, value)
+
+        snapshot = snapshot_instances(value)
+        snapshots = _shared_db_fixture_snapshots.setdefault(request.fixturename, [])
+        snapshots.append(snapshot)
+        request.addfinalizer(lambda: snapshots.remove(snapshot))
+
+        return value
+
+    # NOTE: this marks the fixture for `add_shared_db_fixture_savepoint`
+    shared_db_fixture.is_shared_db_fixture = True
+
+    # NOTE: the transaction is requested first, so it's opened before any of
+    #       the fixtures passed to fn create rows of their own
+    shared_db_fixture.__signature__ = inspect.Signature([
+        inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY)
+        for name in ('request', transaction_fixture_name, *fixture_names)
+    ])
+
+    return lambda_fixture(shared_db_fixture, scope=scope, autouse=autouse)
+
+
+def add_shared_db_fixture_savepoint(metafunc):
+    """Make a test using any shared DB fixtures use `shared_db_fixture_savepoint`, too
+
+    The savepoint is placed right after the last of the test's shared DB
+    fixtures — which, being class- or session-scoped, are set up before any of
+    its function-scoped fixtures — so it's opened after the shared rows are
+    created, but before the test's own fixtures create any rows.
+
+    NOTE: this must be called after the fixtures have been sorted by scope (and
+          by pytest-fixture-order's marks), as it's called by the plugin's
+          pytest_generate_tests hook.
+    """
+    fixturenames = metafunc.fixturenames
+    if 'shared_db_fixture_savepoint' in fixturenames:
+        return
+
+    shared_indices = [
+        i
+        for i, name in enumerate(fixturenames)
+        if any(
+            getattr(fixturedef.func, 'is_shared_db_fixture', False)
+            for fixturedef in metafunc._arg2fixturedefs.get(name, ())
+        )
+    ]
+    if shared_indices:
+        # NOTE: this list MUST be edited in-place for pytest to see our changes
+        fixturenames.insert(shared_indices[-1] + 1, 'shared_db_fixture_savepoint')
+
+
+@pytest.fixture
+def shared_db_fixture_savepoint(request):
+    """Savepoint rolling back the changes made by each test using shared DB fixtures
+
+    This fixture is used only by tests requesting fixtures declared with
+    `user_fixture()` or `class_fixture()` (see `add_shared_db_fixture_savepoint`).
+    """
+    snapshots = [
+        snapshot
+        for name in request.fixturenames
+        for snapshot in _shared_db_fixture_snapshots.get(name, ())
+    ]
+    if not snapshots:
+        yield
+        return
+
+    for snapshot in snapshots:
+        snapshot.restore()
 
     # NOTE: local import used to avoid loading Django settings too early
-    from pytest_drf.client import DRFTestClient
+    from pytest_drf.util import rolled_back_atomic
+
+    unblocked_db = _unblocked_db(request)
+
+    savepoint = rolled_back_atomic()
+    with unblocked_db():
+        savepoint.__enter__()
+
+    try:
+        yield
+    finally:
+        with unblocked_db():
+            savepoint.__exit__(None, None, None)
+
+
+@pytest.fixture
+def live_server_url(request) -> str:
+    """Base URL of a live, in-process server running the Django project
+
+    This is used by the ConcurrentRequests mixin. By default, pytest-django's
+    `live_server` fixture is used. To use a different server, override this
+    fixture with your own implementation.
+    """
+    try:
+        live_server = request.getfixturevalue('live_server')
+    except pytest.FixtureLookupError:
+        raise NotImplementedError(
+            'Please define the live_server_url fixture, returning the base URL '
+            'of a running server (or install pytest-django, whose live_server '
+            'fixture is used by default).'
+        )
+    return live_server.url
+
+
+@pytest.fixture(scope='session')
+def openapi_schema() -> Dict[str, Any]:
+    """The project's OpenAPI schema, generated once per test session
+
+    By default, the schema is generated with DRF's SchemaGenerator. To use a
+    different schema (e.g. one generated by drf-spectacular, or loaded from a
+    file), override this fixture.
+    """
+
+    # NOTE: local import used to avoid loading Django settings too early
+    from rest_framework.schemas.openapi import SchemaGenerator
+
+    return SchemaGenerator().get_schema(request=None, public=True)
+
+
+@pytest.fixture(scope='session')
+def openapi_validator(openapi_schema) -> 'OpenAPIValidator':
+    """Validator of responses against the OpenAPI schema, caching compiled validators
+    """
+    from pytest_drf.openapi import OpenAPIValidator
 
-    return DRFTestClient()
+    return OpenAPIValidator(openapi_schema)
@@ -0,0 +1,304 @@
+"""
+Test-impact selection
+=====================
+
+This module maps each APIViewTest to the source files of the endpoint it
+requests — the view, its serializer, permission, authentication, pagination,
+and other policy classes, and their models — so that only the tests whose
+endpoints depend on changed files need be run.
+
+Record the mapping (the "impact index") during a full run, then select tests
+with a git ref to diff against:
+
+    pytest --drf-impact-record              # e.g. on every merge to main
+    pytest --drf-changed=origin/main        # e.g. on every pull request
+
+The endpoint of a test is found by resolving the URL of its `full_url` fixture.
+Selection errs on the side of running tests:
+
+ - tests not in the index (e.g. new tests, or tests which aren't APIViewTests)
+   are always run
+ - tests whose own file changed are always run
+ - if any changed file is neither a test file nor a dependency of any
+   recorded endpoint (e.g. settings, URLconfs, middleware, templates, fixtures,
+   or helpers imported by views), every test is run — unless it matches one of
+   the glob patterns passed with `--drf-changed-ignore` (e.g. `docs/*`)
+
+NOTE: only the modules defining the classes an endpoint is composed of are
+      recorded — not, say, helper functions those classes import and call. A
+      change to such a helper makes its file unknown (so every test is run),
+      unless it happens to also define a recorded class.
+
+"""
+import json
+import os
+import subprocess
+import sys
+from fnmatch import fnmatch
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+import pytest
+
+__all__ = ['ImpactIndex', 'get_endpoint_classes', 'get_endpoint_dependencies', 'get_changed_files']
+
+
+#: Attributes of DRF views declaring the classes involved in serving a request
+_VIEW_POLICY_ATTRS = (
+    'serializer_class',
+    'pagination_class',
+    'permission_classes',
+    'authentication_classes',
+    'throttle_classes',
+    'filter_backends',
+    'renderer_classes',
+    'parser_classes',
+    'content_negotiation_class',
+    'metadata_class',
+    'versioning_class',
+)
+
+
+def _iter_classes(value: Any) -> Iterable[type]:
+    """Yield the classes declared by a view attribute (a class, or list of them)
+
+    NOTE: composed permissions (e.g. `IsAdminUser | IsOwner`) are unpacked
+          into the permissions they're composed of.
+    """
+    if value is None:
+        return
+
+    if isinstance(value, type):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_classes(item)
+    else:
+        for operand_attr in ('op1_class', 'op2_class'):
+            yield from _iter_classes(getattr(value, operand_attr, None))
+
+
+def _get_module_file(module_name: str, rootdir: str) -> Optional[str]:
+    """Return the module's file relative to rootdir, if it's part of the project"""
+    module = sys.modules.get(module_name)
+    filename = getattr(module, '__file__', None)
+    if not filename:
+        return None
+
+    path = os.path.relpath(os.path.abspath(filename), rootdir)
+    if path.startswith(os.pardir) or 'site-packages' in path.split(os.sep):
+        return None
+    return path.replace(os.sep, '/')
+
+
+def get_endpoint_classes(url: str, urlconf: Optional[str] = None) -> Optional[Tuple[Callable, List[type]]]:
+    """Return the view serving a URL, and the classes it relies on to serve requests
+
+    The classes are the view class, its serializer, permission, and other policy
+    classes, and the models of its queryset and serializer. If the URL does not
+    resolve, None is returned.
+    """
+    from django.db.models import Model
+    from django.urls import Resolver404, resolve
+
+    try:
+        match = resolve(urlparse(url).path, urlconf=urlconf)
+    except Resolver404:
+        return None
+
+    view = match.func
+    classes: List[type] = []
+
+    view_class = getattr(view, 'cls', None) or getattr(view, 'view_class', None)
+    if view_class is not None:
+        classes.append(view_class)
+        for attr in _VIEW_POLICY_ATTRS:
+            classes.extend(_iter_classes(getattr(view_class, attr, None)))
+
+        queryset = getattr(view_class, 'queryset', None)
+        if queryset is not None:
+            classes.append(queryset.model)
+
+    for cls in list(classes):
+        meta = getattr(cls, 'Meta', None)
+        model = getattr(meta, 'model', None)
+        if isinstance(model, type) and issubclass(model, Model):
+            classes.append(model)
+
+    return view, classes
+
+
+def get_endpoint_dependencies(url: str, rootdir: str, urlconf: Optional[str] = None) -> Set[str]:
+    """Return the project files the endpoint serving a URL depends on
+
+    Paths are relative to rootdir; files outside of it (e.g. installed
+    packages) are omitted.
+    """
+    endpoint = get_endpoint_classes(url, urlconf=urlconf)
+    if endpoint is None:
+        return set()
+
+    view, classes = endpoint
+    modules = {view.__module__}
+    for cls in classes:
+        modules.update(base.__module__ for base in cls.__mro__)
+
+    return {
+        path
+        for path in (_get_module_file(module, rootdir) for module in modules)
+        if path is not None
+    }
+
+
+def get_changed_files(ref: str, rootdir: str) -> Set[str]:
+    """Return the files changed since the git ref (including uncommitted and untracked files)
+
+    Paths are relative to rootdir.
+    """
+    def git(*args: str) -> List[str]:
+        output = subprocess.run(
+            ('git', *args),
+            cwd=rootdir,
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout
+        return [line for line in output.splitlines() if line]
+
+    toplevel, = git('rev-parse', '--show-toplevel')
+    changed = {
+        *git('diff', '--name-only', ref, '--'),
+        *git('ls-files', '--others', '--exclude-standard', '--full-name'),
+    }
+
+    return {
+        os.path.relpath(os.path.join(toplevel, path), rootdir).replace(os.sep, '/')
+        for path in changed
+    }
+
+
+class ImpactIndex:
+    """The project files each test's endpoint depends on, persisted as JSON
+
+    An instance is registered as a plugin for the test session, which records
+    the dependencies of each test when `record` is True, and deselects the
+    tests unaffected by `changed_files` when given.
+    """
+
+    def __init__(self,
+                 path: str,
+                 rootdir: str,
+                 record: bool = False,
+                 changed_files: Optional[Set[str]] = None,
+                 ignored_patterns: Iterable[str] = ()):
+        self.path = path
+        self.rootdir = rootdir
+        self.record = record
+        self.changed_files = changed_files
+        self.ignored_patterns = tuple(ignored_patterns)
+
+        self._index: Optional[Dict[str, List[str]]] = None
+        self._recorded: Dict[str, List[str]] = {}
+        self.num_deselected = 0
+        self.unknown_files: Set[str] = set()
+
+    @property
+    def index(self) -> Dict[str, List[str]]:
+        if self._index is None:
+            self._index = {}
+            if os.path.exists(self.path):
+                with open(self.path) as fp:
+                    self._index = json.load(fp)
+        return self._index
+
+    def is_affected(self, nodeid: str, changed_files: Set[str]) -> bool:
+        """Return whether the test may be affected by the changed files"""
+        dependencies = self.index.get(nodeid)
+        if dependencies is None:
+            return True
+
+        test_file = nodeid.split('::', 1)[0]
+        return test_file in changed_files or not changed_files.isdisjoint(dependencies)
+
+    def get_unknown_files(self, changed_files: Set[str], test_files: Set[str]) -> Set[str]:
+        """Return changed files which aren't known to be a test or dependency, nor ignored"""
+        known_files = set(test_files)
+        for dependencies in self.index.values():
+            known_files.update(dependencies)
+
+        return {
+            path
+            for path in changed_files
+            if path not in known_files
+            and not any(fnmatch(path, pattern) for pattern in self.ignored_patterns)
+        }
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        if self.changed_files is None:
+            return
+
+        test_files = {item.nodeid.split('::', 1)[0] for item in items}
+        self.unknown_files = self.get_unknown_files(self.changed_files, test_files)
+        if self.unknown_files:
+            return
+
+        selected = []
+        deselected = []
+        for item in items:
+            if self.is_affected(item.nodeid, self.changed_files):
+                selected.append(item)
+            else:
+                deselected.append(item)
+
+        if deselected:
+            self.num_deselected = len(deselected)
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_call(self, item):
+        if not self.record:
+            return
+
+        # NOTE: this is called after the test's fixtures are set up, but before
+        #       the test runs, so even failing tests are recorded.
+        full_url = getattr(item, 'funcargs', {}).get('full_url')
+        if isinstance(full_url, str):
+            self._recorded[item.nodeid] = sorted(get_endpoint_dependencies(full_url, self.rootdir))
+
+    def pytest_sessionfinish(self, session):
+        workeroutput = getattr(session.config, 'workeroutput', None)
+        if workeroutput is not None:
+            # Pass the recorded dependencies along to the xdist controller
+            workeroutput['drf_impact_index'] = self._recorded
+            return
+
+        self.save()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        self._recorded.update(getattr(node, 'workeroutput', {}).get('drf_impact_index', {}))
+
+    def save(self):
+        if not self._recorded:
+            return
+
+        index = {**self.index, **self._recorded}
+        with open(self.path, 'w') as fp:
+            json.dump(dict(sorted(index.items())), fp, indent=2)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.changed_files is None:
+            return
+
+        if self.unknown_files:
+            terminalreporter.write_line(
+                f'--drf-changed: ran all tests, as the impact of changes to these '
+                f'files is unknown: {", ".join(sorted(self.unknown_files))}'
+            )
+        else:
+            terminalreporter.write_line(
+                f'--drf-changed: deselected {self.num_deselected} tests '
+                f'unaffected by {len(self.changed_files)} changed files'
+            )
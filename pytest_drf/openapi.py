@@ -0,0 +1,218 @@
+"""
+OpenAPI schema validation
+=========================
+
+This module validates API responses against the project's OpenAPI schema, as
+generated by DRF — catching any drift between what an endpoint documents and
+what it actually returns.
+
+Include the MatchesOpenAPISchema mixin to validate the responses of specific
+test contexts, or pass `--drf-openapi` to include it in every APIViewTest (and
+ViewSetTest) context which declares tests of its own — so any drift is reported
+as the failure of that test. The schema is generated only once per test session
+(see the `openapi_schema` fixture), and a validator for each documented
+(path, method, status) is compiled on first use and cached for the session.
+
+NOTE: jsonschema must be installed to validate responses (e.g. with
+      `pip install pytest-drf[openapi]`), and DRF's schema generator requires
+      uritemplate.
+
+"""
+import copy
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+
+from pytest_drf.util import decode_json
+
+__all__ = ['MatchesOpenAPISchema', 'OpenAPIValidator']
+
+
+def _import_jsonschema():
+    try:
+        import jsonschema
+    except ImportError:
+        raise ImportError(
+            'jsonschema is required to validate responses against the OpenAPI '
+            'schema. Please install it, e.g. with `pip install pytest-drf[openapi]`'
+        ) from None
+    return jsonschema
+
+
+def _to_json_schema(schema: Any) -> Any:
+    """Convert OpenAPI 3.0's dialect of a schema into plain JSON Schema
+
+    Namely, this replaces `nullable: true` (which JSON Schema doesn't
+    understand) with a union of the declared type and null.
+    """
+    if isinstance(schema, list):
+        return [_to_json_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    converted = {key: _to_json_schema(value) for key, value in schema.items()}
+    if converted.pop('nullable', False):
+        if 'type' in converted:
+            converted['type'] = [converted['type'], 'null']
+        if 'enum' in converted:
+            converted['enum'] = [*converted['enum'], None]
+        if '$ref' in converted or 'allOf' in converted or 'oneOf' in converted:
+            converted = {'anyOf': [converted, {'type': 'null'}]}
+    return converted
+
+
+def _compile_path_template(template: str) -> Pattern:
+    pattern = re.sub(r'\\\{[^}]+\\\}', '[^/]+', re.escape(template))
+    return re.compile(f'^{pattern}$')
+
+
+class OpenAPIValidator:
+    """Validates response bodies against an OpenAPI schema
+
+    Request paths are matched to the schema's path templates once, and a
+    JSON Schema validator is compiled once for each (path, method, status) —
+    both are cached for the lifetime of the validator.
+    """
+
+    def __init__(self, schema: Dict[str, Any]):
+        _import_jsonschema()  # report a missing jsonschema upfront
+
+        self.schema = schema
+        self.components = _to_json_schema(schema.get('components', {}))
+
+        # NOTE: templates without placeholders are tried first, so that e.g.
+        #       /users/me is not mistaken for /users/{id}
+        templates = sorted(schema.get('paths', {}), key=lambda template: '{' in template)
+        self._path_patterns: List[Tuple[Pattern, str]] = [
+            (_compile_path_template(template), template)
+            for template in templates
+        ]
+        self._path_templates: Dict[str, Optional[str]] = {}
+        self._validators: Dict[Tuple[str, str, int], Any] = {}
+
+    def get_path_template(self, path: str) -> Optional[str]:
+        """Return the schema's path template matching the request path, if any"""
+        try:
+            return self._path_templates[path]
+        except KeyError:
+            template = next((t for pattern, t in self._path_patterns if pattern.match(path)), None)
+            self._path_templates[path] = template
+            return template
+
+    def get_validator(self, template: str, method: str, status: int):
+        """Return a compiled validator for the response, or None if undocumented"""
+        key = (template, method.lower(), status)
+        try:
+            return self._validators[key]
+        except KeyError:
+            validator = self._validators[key] = self._compile_validator(*key)
+            return validator
+
+    def _compile_validator(self, template: str, method: str, status: int):
+        jsonschema = _import_jsonschema()
+
+        operation = self.schema['paths'][template].get(method)
+        if operation is None:
+            return None
+
+        responses = operation.get('responses', {})
+        documented = (
+            responses.get(str(status))
+            or responses.get(f'{str(status)[0]}XX')
+            or responses.get('default')
+        )
+        if documented is None:
+            return None
+
+        content = documented.get('content', {}).get('application/json')
+        if content is None or 'schema' not in content:
+            return None
+
+        # The components are included, so $refs to them resolve
+        response_schema = _to_json_schema(copy.deepcopy(content['schema']))
+        validator_schema = {**response_schema, 'components': self.components}
+
+        validator_cls = jsonschema.validators.validator_for(validator_schema, default=jsonschema.Draft7Validator)
+        return validator_cls(validator_schema)
+
+    def get_errors(self, response) -> List[str]:
+        """Return descriptions of the ways the response body drifts from the schema
+
+        Responses to paths, methods, or statuses the schema does not document
+        (as well as empty or streaming responses) are not validated.
+        """
+        request = getattr(response, 'wsgi_request', None) or getattr(response, 'asgi_request', None)
+        if request is None:
+            return []
+
+        template = self.get_path_template(request.path_info)
+        if template is None:
+            return []
+
+        validator = self.get_validator(template, request.method, response.status_code)
+        if validator is None:
+            return []
+
+        if getattr(response, 'streaming', False) or not response.content:
+            return []
+
+        try:
+            body = decode_json(response)
+        except ValueError:
+            return [f'Expected a JSON response, but Content-Type is {response.get("Content-Type")!r}']
+
+        return [
+            f'{error.json_path}: {error.message}'
+            for error in validator.iter_errors(body)
+        ]
+
+
+def assert_matches_openapi_schema(response, validator: OpenAPIValidator):
+    __tracebackhide__ = True
+
+    # NOTE: a response may be shared between many tests (e.g. with
+    #       RequestsOnce), but it only needs validating once.
+    errors = getattr(response, '_openapi_errors', None)
+    if errors is None:
+        errors = response._openapi_errors = validator.get_errors(response)
+
+    if errors:
+        raise AssertionError(
+            'Response does not match the OpenAPI schema:\n'
+            + '\n'.join(f'  {error}' for error in errors)
+        )
+
+
+class MatchesOpenAPISchema:
+    """Includes test which checks the response matches the OpenAPI schema
+
+    To validate every response, instead of declaring this mixin on each test
+    context, pass `--drf-openapi`. To leave a context out, set
+    `test_it_matches_openapi_schema = None` on it.
+    """
+
+    def test_it_matches_openapi_schema(self, response, openapi_validator):
+        assert_matches_openapi_schema(response, openapi_validator)
+
+
+def needs_openapi_test(cls: type,
+                       enclosing_classes: Iterable[type],
+                       is_test_name: Callable[[str], bool]) -> bool:
+    """Return whether --drf-openapi should include MatchesOpenAPISchema into a test class
+
+    This is the case for classes which are (or are nested within) APIViewTests,
+    and which declare tests of their own — i.e. contexts which perform a
+    request — unless they already include (or disable) the mixin's test.
+    """
+    # NOTE: local import used to avoid a circular import
+    from pytest_drf.views import APIViewTest
+
+    if hasattr(cls, 'test_it_matches_openapi_schema'):
+        return False
+
+    if not any(issubclass(context, APIViewTest) for context in (cls, *enclosing_classes)):
+        return False
+
+    return any(
+        is_test_name(name) and callable(value) and not isinstance(value, type)
+        for name, value in ((name, getattr(cls, name, None)) for name in dir(cls))
+    )
@@ -2,42 +2,404 @@
 Enforce the use of pagination
 =============================
 
-Test mixins to declare the structure of paginated responses.
+Test mixins to declare the structure of paginated responses, and to walk
+through every page of a paginated endpoint.
 
 """
-from pytest_assert_utils import util
+import inspect
+import json as jsonlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence
+from urllib.parse import urlparse
+
+import pytest
+
+from pytest_drf.benchmarks import BenchmarkStats
+from pytest_drf.shapes import assert_matches_shape
+from pytest_drf.util import compile_shape, decode_json
+
+__all__ = [
+    'ReturnsPageNumberPagination',
+    'ReturnsLimitOffsetPagination',
+    'ReturnsCursorPagination',
+    'WalksAllPages',
+    'PaginatedPage',
+    'PaginationWalk',
+]
+
+
+PAGE_NUMBER_PAGINATION_SHAPE = compile_shape({
+    'count': int,
+    'next': Optional[str],
+    'previous': Optional[str],
+    'results': list,
+})
+
+LIMIT_OFFSET_PAGINATION_SHAPE = compile_shape({
+    'count': int,
+    'next': Optional[str],
+    'previous': Optional[str],
+    'results': list,
+})
+
+CURSOR_PAGINATION_SHAPE = compile_shape({
+    'next': Optional[str],
+    'previous': Optional[str],
+    'results': list,
+})
 
 
 class ReturnsPageNumberPagination:
     def test_it_returns_page_number_pagination_format(self, json):
-        expected = {
-            'count': util.Any(int),
-            'next': util.Optional(util.Any(str)),
-            'previous': util.Optional(util.Any(str)),
-            'results': util.Any(list),
-        }
-        actual = json
-        assert expected == actual, 'Response is not in PageNumberPagination format'
+        assert_matches_shape(json, PAGE_NUMBER_PAGINATION_SHAPE, 'Response is not in PageNumberPagination format')
 
 
 class ReturnsLimitOffsetPagination:
     def test_it_returns_limit_offset_pagination_format(self, json):
-        expected = {
-            'count': util.Any(int),
-            'next': util.Optional(util.Any(str)),
-            'previous': util.Optional(util.Any(str)),
-            'results': util.Any(list),
-        }
-        actual = json
-        assert expected == actual, 'Response is not in LimitOffsetPagination format'
+        assert_matches_shape(json, LIMIT_OFFSET_PAGINATION_SHAPE, 'Response is not in LimitOffsetPagination format')
 
 
 class ReturnsCursorPagination:
     def test_it_returns_cursor_pagination_format(self, json):
-        expected = {
-            'next': util.Optional(util.Any(str)),
-            'previous': util.Optional(util.Any(str)),
-            'results': util.Any(list),
-        }
-        actual = json
-        assert expected == actual, 'Response is not in CursorPagination format'
+        assert_matches_shape(json, CURSOR_PAGINATION_SHAPE, 'Response is not in CursorPagination format')
+
+
+@dataclass
+class PaginatedPage:
+    """A single page of results, retrieved while walking a paginated endpoint"""
+
+    #: 1-based position of the page in the walk
+    number: int
+
+    #: URL the page was requested from
+    url: str
+
+    #: Time (in seconds) taken to request the page
+    duration: float
+
+    #: The decoded JSON body of the page
+    json: Dict[str, Any]
+
+    @property
+    def results(self) -> List[Any]:
+        return self.json['results']
+
+
+@dataclass
+class PaginationWalk:
+    """Every page retrieved by following `next` links from the first page"""
+
+    pages: List[PaginatedPage] = field(default_factory=list)
+
+    @property
+    def results(self) -> List[Any]:
+        """Items from all pages, in order"""
+        return [item for page in self.pages for item in page.results]
+
+    @property
+    def latency(self) -> BenchmarkStats:
+        return BenchmarkStats.from_timings([page.duration for page in self.pages])
+
+    def format(self) -> str:
+        return '\n'.join(
+            f'  page {page.number}: {len(page.results)} items in '
+            f'{page.duration * 1000:.2f}ms ({page.url})'
+            for page in self.pages
+        )
+
+
+def _resolve_awaitable(value: Any) -> Any:
+    """Return the result of value, awaiting it on an event loop if it's awaitable
+
+    Async test clients (e.g. the one used by AsyncAPIViewTest) return
+    awaitables from their request methods.
+    """
+    if not inspect.isawaitable(value):
+        return value
+
+    # NOTE: local import used, as asgiref is only installed from Django 3.0
+    from asgiref.sync import async_to_sync
+
+    async def await_value():
+        return await value
+
+    return async_to_sync(await_value)()
+
+
+def _get_view_class(url: str) -> Optional[type]:
+    """Return the class of the view serving a URL, if it's class-based"""
+    # NOTE: local import used to avoid loading Django settings too early
+    from django.urls import Resolver404, resolve
+
+    try:
+        match = resolve(urlparse(url).path)
+    except Resolver404:
+        return None
+
+    return getattr(match.func, 'cls', None) or getattr(match.func, 'view_class', None)
+
+
+def _get_queryset_count(url: str) -> Optional[int]:
+    """Return the number of rows in the queryset of the view serving a URL, if it's unfiltered
+
+    None is returned if the view has no `queryset`, or may filter it — i.e. it
+    overrides get_queryset(), or the URL passes query params to its filters.
+    """
+    # NOTE: local import used to avoid loading Django settings too early
+    from rest_framework.generics import GenericAPIView
+
+    view_class = _get_view_class(url)
+    queryset = getattr(view_class, 'queryset', None)
+    if queryset is None or view_class.get_queryset is not GenericAPIView.get_queryset:
+        return None
+
+    if urlparse(url).query and getattr(view_class, 'filter_backends', None):
+        return None
+
+    return queryset.all().count()
+
+
+def _get_pagination_ordering(url: str) -> Optional[Sequence[str]]:
+    """Return the ordering of the pagination class of the view serving a URL, if it declares one
+
+    e.g. the `ordering` of a CursorPagination subclass
+    """
+    view_class = _get_view_class(url)
+    pagination_class = getattr(view_class, 'pagination_class', None)
+    ordering = getattr(pagination_class, 'ordering', None)
+    if isinstance(ordering, str):
+        return (ordering,)
+    return tuple(ordering) if ordering else None
+
+
+def _compare_values(a: Any, b: Any, nulls_largest: bool) -> int:
+    """Compare two values as the DB orders them, returning -1, 0, or 1
+
+    NULLs sort after every other value if nulls_largest (as on PostgreSQL and
+    Oracle), and before them otherwise (as on SQLite and MySQL).
+    """
+    if a == b:
+        return 0
+    if a is None:
+        return 1 if nulls_largest else -1
+    if b is None:
+        return -1 if nulls_largest else 1
+    return 1 if a > b else -1
+
+
+def _find_misordered_item(items: List[Any], ordering: Sequence[str], nulls_largest: bool = False) -> Optional[int]:
+    """Return the index of the first item sorting before its predecessor, if any"""
+    fields = [(name.lstrip('-'), name.startswith('-')) for name in ordering]
+    for index in range(1, len(items)):
+        previous, item = items[index - 1], items[index]
+        for name, descending in fields:
+            comparison = _compare_values(previous[name], item[name], nulls_largest)
+            if comparison == 0:
+                continue
+            if (comparison > 0) != descending:
+                return index
+            break
+    return None
+
+
+def _get_item_key(item: Any) -> Hashable:
+    if isinstance(item, dict) and 'id' in item:
+        return item['id']
+    return jsonlib.dumps(item, sort_keys=True)
+
+
+class WalksAllPages:
+    """Includes test which follows `next` links through every page of results
+
+    Starting from the test context's URL, each page is requested with a GET,
+    and timed. The walk fails if a `next` link leads back to a page already
+    retrieved, and the test fails if any item appears on more than one page.
+
+    Items skipped between pages are detected by comparing the number of items
+    retrieved to the `count` reported by the first page (where the pagination
+    style reports one), and to the `pagination_expected_count` fixture — by
+    default, the number of rows in the view's queryset, where that's known. If
+    neither total is available, skipped items can't be detected, so the test
+    fails, rather than pass unchecked; override `pagination_expected_count`.
+
+    Where the `pagination_ordering` fixture names the fields pages are ordered
+    by (by default, the `ordering` of the view's pagination class, as with
+    CursorPagination), the test also fails if items are returned out of order.
+
+    Per-page latency is available from the `pagination_walk` fixture, and
+    recorded in the test's user_properties (e.g. for --junitxml). Pages are
+    requested with the test context's `client` — asynchronously, with
+    AsyncAPIViewTest. This can be combined with any of the Returns*Pagination
+    mixins:
+
+        class DescribeList(
+            UsesGetMethod,
+            UsesListEndpoint,
+
+            ReturnsLimitOffsetPagination,
+            WalksAllPages,
+        ):
+            ...
+
+    """
+
+    @pytest.fixture
+    def pagination_item_key(self) -> Callable[[Any], Hashable]:
+        """Method returning the identity of an item, to detect duplicates
+
+        By default, an item's 'id' is used, if it has one; otherwise, the
+        entire item is compared.
+        """
+        return _get_item_key
+
+    @pytest.fixture
+    def pagination_ordering(self, full_url: str) -> Optional[Sequence[str]]:
+        """Names of the item fields pages are ordered by (prefixed with '-' if descending)
+
+        Used to check that items are returned in order across pages. By
+        default, the `ordering` of the view's pagination class is used, if it
+        has one (as CursorPagination does).
+        """
+        return _get_pagination_ordering(full_url)
+
+    @pytest.fixture
+    def pagination_expected_count(self, response, full_url: str) -> Optional[int]:
+        """Number of items expected across all pages, or None if unknown
+
+        Used to detect skipped items. By default, the rows of the view's
+        queryset are counted — unless the view may filter them (by overriding
+        get_queryset(), or through filter backends given query params).
+        """
+        # NOTE: we request the response fixture only so rows are counted after
+        #       all preconditions have created them
+        return _get_queryset_count(full_url)
+
+    @pytest.fixture
+    def max_pages(self) -> int:
+        """Number of pages after which to give up following `next` links"""
+        return 1000
+
+    @pytest.fixture
+    def iter_pages(self,
+                   client,
+                   full_url: str,
+                   headers: Dict[str, str],
+                   json_decoder,
+                   max_pages: int,
+                   ) -> Callable[[], Iterator[PaginatedPage]]:
+        """A 0-arg method which requests and yields each page, one at a time
+        """
+        def iter_pages() -> Iterator[PaginatedPage]:
+            url: Optional[str] = full_url
+            number = 0
+            seen_urls = set()
+            while url is not None:
+                if url in seen_urls:
+                    raise AssertionError(
+                        f'The next link of page {number} leads back to a page '
+                        f'already retrieved ({url})'
+                    )
+                seen_urls.add(url)
+
+                number += 1
+                if number > max_pages:
+                    raise AssertionError(
+                        f'Gave up following next links after {max_pages} pages '
+                        f'(is the pagination looping?)'
+                    )
+
+                start = time.perf_counter()
+                response = _resolve_awaitable(client.get(url, headers=headers))
+                duration = time.perf_counter() - start
+
+                assert response.status_code == 200, (
+                    f'Expected page {number} ({url}) to return 200, but it '
+                    f'returned {response.status_code}'
+                )
+
+                page = PaginatedPage(number, url, duration, decode_json(response, loads=json_decoder))
+                yield page
+                url = page.json.get('next')
+
+        return iter_pages
+
+    @pytest.fixture
+    def pagination_walk(self, request, response, iter_pages) -> PaginationWalk:
+        """All pages retrieved by following `next` links"""
+        # NOTE: we request the response fixture only so the walk is performed
+        #       after all preconditions, just as the test context's request is
+        walk = PaginationWalk(list(iter_pages()))
+
+        request.node.user_properties.append(('drf_pagination_walk', [
+            {'url': page.url, 'duration': page.duration, 'results': len(page.results)}
+            for page in walk.pages
+        ]))
+        return walk
+
+    def test_it_returns_each_item_once_across_pages(self,
+                                                    pagination_walk,
+                                                    pagination_item_key,
+                                                    pagination_ordering,
+                                                    pagination_expected_count):
+        seen = set()
+        duplicates = []
+        for item in pagination_walk.results:
+            key = pagination_item_key(item)
+            if key in seen:
+                duplicates.append(key)
+            seen.add(key)
+
+        expected = []
+        actual = duplicates
+        assert expected == actual, (
+            f'Items were returned on more than one page:\n'
+            f'{pagination_walk.format()}'
+        )
+
+        first_page = pagination_walk.pages[0].json
+        if 'count' not in first_page and pagination_expected_count is None:
+            raise AssertionError(
+                'Unable to check for skipped items: the first page reports no '
+                'count, and the number of items expected is unknown. Override '
+                'the pagination_expected_count fixture.'
+            )
+
+        totals = []
+        if 'count' in first_page:
+            totals.append((first_page['count'], 'as reported by the first page'))
+        if pagination_expected_count is not None:
+            totals.append((pagination_expected_count, 'per pagination_expected_count'))
+
+        for expected, source in totals:
+            actual = len(pagination_walk.results)
+            assert expected == actual, (
+                f'Expected {expected} items across all pages, {source}, but '
+                f'{actual} were returned:\n'
+                f'{pagination_walk.format()}'
+            )
+
+        if pagination_ordering:
+            # NOTE: local import used to avoid loading Django settings too early
+            from django.db import connection
+
+            results = pagination_walk.results
+            missing_fields = {
+                name.lstrip('-') for name in pagination_ordering
+                for item in results
+                if name.lstrip('-') not in item
+            }
+            assert not missing_fields, (
+                f'Unable to check the order of items: the pagination ordering '
+                f'{list(pagination_ordering)} refers to fields missing from '
+                f'the items ({", ".join(sorted(missing_fields))}). Override '
+                f'the pagination_ordering fixture.'
+            )
+
+            nulls_largest = connection.features.nulls_order_largest
+            misordered_index = _find_misordered_item(results, pagination_ordering, nulls_largest)
+            assert misordered_index is None, (
+                f'Item {misordered_index} across all pages is out of the pagination '
+                f'ordering {list(pagination_ordering)}:\n'
+                f'{pagination_walk.format()}'
+            )
@@ -1,2 +1,274 @@
-# Expose our fixtures to pytest
+import os
+import subprocess
+from dataclasses import asdict
+
+import pytest
+
+from .benchmarks import BenchmarkBaselines
+from .distribution import DURATIONS_CACHE_KEY, LoadDescribeScheduling, ScopeDurations
+from .impact import ImpactIndex, get_changed_files
+from .openapi import MatchesOpenAPISchema, needs_openapi_test
 from .fixtures import *
+from .fixtures import add_shared_db_fixture_savepoint
+from .profiling import EndpointProfile, EndpointProfiler
+from .snapshots import SnapshotStore
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('drf', 'Django REST framework')
+    group.addoption(
+        '--drf-profile',
+        action='store_true',
+        default=False,
+        help='Record the time, DB queries, and response size of every request '
+             'made through DRFTestClient, and report the slowest endpoints.',
+    )
+    group.addoption(
+        '--drf-profile-json',
+        metavar='PATH',
+        default=None,
+        help='Write the full endpoint profiling report as JSON to PATH. '
+             'Implies --drf-profile.',
+    )
+    group.addoption(
+        '--drf-profile-top',
+        metavar='N',
+        type=int,
+        default=20,
+        help='Number of slowest endpoints to report (default: 20).',
+    )
+    group.addoption(
+        '--drf-update-snapshots',
+        action='store_true',
+        default=False,
+        help='Record missing snapshots of MatchesSnapshot tests, overwrite stored '
+             'snapshots with the latest responses, and remove the snapshots of '
+             'tests which no longer exist.',
+    )
+    group.addoption(
+        '--drf-client-pool',
+        action='store_true',
+        default=False,
+        help='Reuse test clients (and their middleware) from a session-wide '
+             'pool, instead of creating a new client for every test.',
+    )
+    group.addoption(
+        '--drf-no-response-cache',
+        action='store_true',
+        default=False,
+        help='Perform the requests of CachesResponse tests, instead of '
+             'reusing responses stored by previous runs.',
+    )
+    group.addoption(
+        '--drf-response-cache-size',
+        metavar='MB',
+        type=float,
+        default=100,
+        help='Size at which the least recently used responses are evicted '
+             'from the response cache (default: 100).',
+    )
+    group.addoption(
+        '--drf-dist',
+        choices=('no', 'describe'),
+        default='no',
+        help='With pytest-xdist, "describe" sends all tests of each top-level '
+             'Describe class to the same worker, balancing classes between '
+             'workers by the durations recorded in previous runs (default: no).',
+    )
+    group.addoption(
+        '--drf-changed',
+        metavar='REF',
+        nargs='?',
+        const='HEAD',
+        default=None,
+        help='Run only the tests whose endpoints depend on files changed since '
+             'the git REF (default: HEAD), according to the impact index. Only '
+             'the modules of the classes composing each endpoint are tracked — '
+             'not helpers they import — so if any changed file is neither a '
+             'test nor a tracked dependency, all tests are run.',
+    )
+    group.addoption(
+        '--drf-changed-ignore',
+        metavar='PATTERN',
+        action='append',
+        default=[],
+        help='Glob pattern of changed files (relative to the rootdir) known not '
+             'to affect any test, e.g. "docs/*", so --drf-changed need not run '
+             'all tests when they change. May be given more than once.',
+    )
+    group.addoption(
+        '--drf-impact-record',
+        action='store_true',
+        default=False,
+        help='Record the files the endpoint of each APIViewTest depends on '
+             'into the impact index, for use by --drf-changed.',
+    )
+    group.addoption(
+        '--drf-impact-index',
+        metavar='PATH',
+        default=None,
+        help='JSON file storing the impact index '
+             '(default: .drf-impact.json in the rootdir).',
+    )
+    group.addoption(
+        '--drf-openapi',
+        action='store_true',
+        default=False,
+        help='Include the MatchesOpenAPISchema test in every APIViewTest '
+             "context, validating its response against the project's OpenAPI schema.",
+    )
+    group.addoption(
+        '--drf-benchmark-baseline',
+        metavar='PATH',
+        default=None,
+        help='JSON file storing the baselines of Benchmarks tests, e.g. to '
+             'commit them (default: stored in the pytest cache).',
+    )
+    group.addoption(
+        '--drf-benchmark-update',
+        action='store_true',
+        default=False,
+        help='Overwrite the stored baselines of Benchmarks tests with the '
+             'latest results.',
+    )
+    group.addoption(
+        '--drf-benchmark-threshold',
+        metavar='FRACTION',
+        type=float,
+        default=0.25,
+        help='Allowed fractional increase in median latency over a Benchmarks '
+             "test's baseline, before it fails (default: 0.25).",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption('drf_profile') or config.getoption('drf_profile_json'):
+        EndpointProfiler.active = EndpointProfiler()
+
+    config.pluginmanager.register(
+        BenchmarkBaselines(
+            config.getoption('drf_benchmark_baseline'),
+            update=config.getoption('drf_benchmark_update'),
+            cache=getattr(config, 'cache', None),
+        ),
+        'drf_benchmark_baselines',
+    )
+
+    config.pluginmanager.register(
+        SnapshotStore(update=config.getoption('drf_update_snapshots')),
+        'drf_snapshots',
+    )
+
+    # NOTE: durations are recorded by the xdist controller (or a lone session),
+    #       never by workers, which would overwrite each other's records.
+    cache = getattr(config, 'cache', None)
+    is_xdist_worker = hasattr(config, 'workerinput')
+    if config.getoption('drf_dist') == 'describe' and cache is not None and not is_xdist_worker:
+        config.pluginmanager.register(ScopeDurations(cache), 'drf_describe_durations')
+
+    changed_ref = config.getoption('drf_changed')
+    record_impact = config.getoption('drf_impact_record')
+    if changed_ref is not None or record_impact:
+        rootdir = str(config.rootdir)
+
+        impact_index_path = config.getoption('drf_impact_index')
+        if impact_index_path is None:
+            impact_index_path = os.path.join(rootdir, '.drf-impact.json')
+
+        changed_files = None
+        if changed_ref is not None:
+            try:
+                changed_files = get_changed_files(changed_ref, rootdir)
+            except (OSError, subprocess.CalledProcessError) as e:
+                raise pytest.UsageError(f'--drf-changed: unable to diff against {changed_ref!r}: {e}')
+
+        config.pluginmanager.register(
+            ImpactIndex(
+                impact_index_path,
+                rootdir,
+                record=record_impact,
+                changed_files=changed_files,
+                ignored_patterns=config.getoption('drf_changed_ignore'),
+            ),
+            'drf_impact_index',
+        )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_pycollect_makeitem(collector, name, obj):
+    outcome = yield
+    if not collector.config.getoption('drf_openapi'):
+        return
+
+    node = outcome.get_result()
+    if not isinstance(node, pytest.Class):
+        return
+
+    enclosing_classes = [parent.obj for parent in collector.listchain() if isinstance(parent, pytest.Class)]
+    if needs_openapi_test(node.obj, enclosing_classes, collector.funcnamefilter):
+        # NOTE: the class's markers are loaded upon first access of node.obj
+        #       (above), so they're kept when it's swapped for the subclass
+        cls = node.obj
+        node.obj = type(cls.__name__, (cls, MatchesOpenAPISchema), {
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '__doc__': cls.__doc__,
+        })
+
+
+@pytest.hookimpl(trylast=True)  # run after fixtures are ordered (e.g. by pytest-fixture-order)
+def pytest_generate_tests(metafunc):
+    add_shared_db_fixture_savepoint(metafunc)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getoption('drf_dist') != 'describe':
+        return None
+
+    cache = getattr(config, 'cache', None)
+    durations = cache.get(DURATIONS_CACHE_KEY, {}) if cache is not None else {}
+    return LoadDescribeScheduling(config, log, durations=durations)
+
+
+def pytest_sessionfinish(session):
+    profiler = EndpointProfiler.active
+    workeroutput = getattr(session.config, 'workeroutput', None)
+    if profiler is not None and workeroutput is not None:
+        # Pass the profiles along to the xdist controller, which reports them
+        workeroutput['drf_endpoint_profiles'] = [asdict(profile) for profile in profiler.profiles.values()]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    profiler = EndpointProfiler.active
+    if profiler is None:
+        return
+
+    profiles = getattr(node, 'workeroutput', {}).get('drf_endpoint_profiles', [])
+    profiler.merge(EndpointProfile(**profile) for profile in profiles)
+
+
+def pytest_unconfigure(config):
+    EndpointProfiler.active = None
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    profiler = EndpointProfiler.active
+    if profiler is None or hasattr(config, 'workerinput'):
+        return
+
+    json_path = config.getoption('drf_profile_json')
+    if json_path:
+        profiler.write_json(json_path)
+
+    terminalreporter.write_sep('=', 'slowest DRF endpoints')
+    if not profiler.profiles:
+        terminalreporter.write_line('No requests were made through DRFTestClient')
+        return
+
+    for line in profiler.format_table(limit=config.getoption('drf_profile_top')):
+        terminalreporter.write_line(line)
+
+    if json_path:
+        terminalreporter.write_line(f'Full endpoint profile written to {json_path}')
@@ -0,0 +1,210 @@
+"""
+Profiling endpoints
+===================
+
+This module contains the machinery behind the `--drf-profile` option, which
+records the wall time, number of DB queries, DB time, and response size of
+every request made through DRFTestClient, grouped by endpoint (the resolved URL
+name and HTTP method).
+
+At the end of the test session, the slowest endpoints are printed, and a full
+report can be written as JSON with `--drf-profile-json=path/to/report.json`.
+With pytest-xdist, workers pass their profiles along to the controller, which
+merges them and reports on the whole session.
+
+"""
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from django.urls import Resolver404, resolve
+
+from pytest_drf.util import capture_request_queries
+
+__all__ = ['EndpointProfiler', 'EndpointProfile']
+
+
+@dataclass
+class EndpointProfile:
+    """Aggregate measurements of all requests made to a single endpoint"""
+
+    endpoint: str
+    method: str
+    requests: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    total_queries: int = 0
+    total_db_time: float = 0.0
+    total_size: int = 0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.requests if self.requests else 0.0
+
+    @property
+    def mean_queries(self) -> float:
+        return self.total_queries / self.requests if self.requests else 0.0
+
+    @property
+    def mean_db_time(self) -> float:
+        return self.total_db_time / self.requests if self.requests else 0.0
+
+    @property
+    def mean_size(self) -> float:
+        return self.total_size / self.requests if self.requests else 0.0
+
+    def add(self, duration: float, num_queries: int, db_time: float, size: int):
+        self.requests += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        self.total_queries += num_queries
+        self.total_db_time += db_time
+        self.total_size += size
+
+    def merge(self, other: 'EndpointProfile'):
+        """Add the measurements of another profile of the same endpoint"""
+        self.requests += other.requests
+        self.total_time += other.total_time
+        self.max_time = max(self.max_time, other.max_time)
+        self.total_queries += other.total_queries
+        self.total_db_time += other.total_db_time
+        self.total_size += other.total_size
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'endpoint': self.endpoint,
+            'method': self.method,
+            'requests': self.requests,
+            'total_time': self.total_time,
+            'mean_time': self.mean_time,
+            'max_time': self.max_time,
+            'mean_queries': self.mean_queries,
+            'mean_db_time': self.mean_db_time,
+            'mean_size': self.mean_size,
+        }
+
+
+@dataclass
+class _RequestRecord:
+    response: Any = None
+
+
+@dataclass
+class EndpointProfiler:
+    """Records measurements of requests made through DRFTestClient
+
+    While a profiler is active (see `EndpointProfiler.active`), DRFTestClient
+    will route every request through `profile_request()`.
+    """
+
+    #: The profiler currently recording requests, if any
+    active: ClassVar[Optional['EndpointProfiler']] = None
+
+    profiles: Dict[Tuple[str, str], EndpointProfile] = field(default_factory=dict)
+
+    @staticmethod
+    def get_endpoint_name(path: str) -> str:
+        """Return the URL name of the view serving path, or the path itself"""
+        try:
+            match = resolve(urlsplit(path).path)
+        except Resolver404:
+            return path
+        return match.view_name or match.route
+
+    @contextmanager
+    def profile_request(self, method: str, path: str) -> Iterator[_RequestRecord]:
+        """Measure the request made within the block
+
+        The response must be stored on the yielded record, so its size may be
+        measured:
+
+            with profiler.profile_request('GET', '/my/url') as record:
+                record.response = client.get('/my/url')
+
+        """
+        record = _RequestRecord()
+
+        with capture_request_queries() as queries:
+            start = time.perf_counter()
+            yield record
+            duration = time.perf_counter() - start
+
+        response = record.response
+        if response is None or getattr(response, 'streaming', False):
+            size = 0
+        else:
+            size = len(response.content)
+
+        endpoint = self.get_endpoint_name(path)
+        key = (endpoint, method.upper())
+        profile = self.profiles.get(key)
+        if profile is None:
+            profile = self.profiles[key] = EndpointProfile(*key)
+
+        profile.add(
+            duration=duration,
+            num_queries=len(queries),
+            db_time=sum(query.time for query in queries),
+            size=size,
+        )
+
+    def merge(self, profiles: Iterable[EndpointProfile]):
+        """Add the measurements of profiles recorded elsewhere (e.g. by xdist workers)"""
+        for other in profiles:
+            key = (other.endpoint, other.method)
+            profile = self.profiles.get(key)
+            if profile is None:
+                profile = self.profiles[key] = EndpointProfile(*key)
+            profile.merge(other)
+
+    def get_ranked_profiles(self) -> List[EndpointProfile]:
+        """Return all endpoint profiles, slowest (by mean wall time) first"""
+        return sorted(self.profiles.values(), key=lambda p: p.mean_time, reverse=True)
+
+    def write_json(self, path: str):
+        report = [profile.as_dict() for profile in self.get_ranked_profiles()]
+        with open(path, 'w') as fp:
+            json.dump(report, fp, indent=2)
+
+    def format_table(self, limit: Optional[int] = None) -> List[str]:
+        """Return the lines of a table listing the slowest endpoints"""
+        headers = (
+            'Endpoint',
+            'Method',
+            'Requests',
+            'Mean (ms)',
+            'Max (ms)',
+            'Queries',
+            'DB (ms)',
+            'Size (B)',
+        )
+        rows = [
+            (
+                profile.endpoint,
+                profile.method,
+                str(profile.requests),
+                f'{profile.mean_time * 1000:.2f}',
+                f'{profile.max_time * 1000:.2f}',
+                f'{profile.mean_queries:.1f}',
+                f'{profile.mean_db_time * 1000:.2f}',
+                f'{profile.mean_size:.0f}',
+            )
+            for profile in self.get_ranked_profiles()[:limit]
+        ]
+
+        widths = [
+            max(len(row[i]) for row in (headers, *rows))
+            for i in range(len(headers))
+        ]
+
+        def format_row(row) -> str:
+            # Left-align the endpoint and method; right-align all measurements
+            return '  '.join(
+                value.ljust(width) if i < 2 else value.rjust(width)
+                for i, (value, width) in enumerate(zip(row, widths))
+            )
+
+        return [format_row(headers), *map(format_row, rows)]
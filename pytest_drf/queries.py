@@ -0,0 +1,207 @@
+"""
+Enforcing DB query budgets
+==========================
+
+This module contains test mixins to declare how many DB queries an endpoint
+may execute while handling a request — either as a fixed budget, or as a
+promise that the number of queries does not grow with the amount of data
+returned (i.e. the endpoint has no N+1 query problems).
+
+"""
+from typing import Callable, Iterable, List, Mapping, Sequence, TYPE_CHECKING, Type
+
+import pytest
+from pytest_lambda import static_fixture
+
+from pytest_drf.util import (
+    CapturedQuery,
+    capture_queries,
+    capture_request_queries,
+    rolled_back_atomic,
+)
+
+__all__ = [
+    'CapturesRequestQueries',
+    'CreatesDataSets',
+    'ExecutesAtMostQueries',
+    'ExecutesConstantQueries',
+]
+
+
+def _format_queries(queries: Sequence[CapturedQuery]) -> str:
+    return '\n'.join(
+        f'  {i}. {query}'
+        for i, query in enumerate(queries, start=1)
+    )
+
+
+def _assert_executes_at_most(queries: Sequence[CapturedQuery], max_queries: int):
+    expected = max_queries
+    actual = len(queries)
+    assert actual <= expected, (
+        f'Expected at most {expected} queries, but {actual} were executed:\n'
+        f'{_format_queries(queries)}'
+    )
+
+
+def _assert_constant_queries(queries_by_size: Mapping[int, Sequence[CapturedQuery]]):
+    """Assert the same number of queries was executed for every data set size"""
+    __tracebackhide__ = True
+
+    smallest_size = min(queries_by_size)
+    baseline = len(queries_by_size[smallest_size])
+
+    expected = {size: baseline for size in queries_by_size}
+    actual = {size: len(queries) for size, queries in queries_by_size.items()}
+
+    largest_size = max(queries_by_size)
+    assert expected == actual, (
+        f'Number of queries grows with data set size '
+        f'(data set size: number of queries): {actual}\n'
+        f'Queries with data set size {largest_size}:\n'
+        f'{_format_queries(queries_by_size[largest_size])}'
+    )
+
+
+class CapturesRequestQueries:
+    """Records the DB queries executed while the server handles the request
+    """
+
+    @pytest.fixture(autouse=True)
+    def captured_request_queries(self) -> List[CapturedQuery]:
+        """DB queries executed while handling any requests during the test
+
+        NOTE: only queries executed by the server while handling a request are
+              recorded; queries made by fixtures setting up the request are not.
+        """
+        with capture_request_queries() as queries:
+            yield queries
+
+    @pytest.fixture(autouse=True)
+    @pytest.mark.late  # ensure the queries are stored right after the request is made
+    def request_queries(self,
+                        is_common_subject_deferred: bool,
+                        common_subject_rval,
+                        captured_request_queries,
+                        ) -> List[CapturedQuery]:
+        """DB queries executed while handling the request
+        """
+        if is_common_subject_deferred:
+            return captured_request_queries
+
+        # NOTE: the queries are stored on the response as soon as the request is
+        #       made — whether or not the test uses them — so they're shared
+        #       along with the response itself (e.g. when using RequestsOnce)
+        if not hasattr(common_subject_rval, 'request_queries'):
+            common_subject_rval.request_queries = list(captured_request_queries)
+        return common_subject_rval.request_queries
+
+
+class _ExecutesAtMostQueriesMeta(type):
+    # This metaclass allows ExecutesAtMostQueries(n) to return a test mixin
+    # with the max_queries fixture defined as n.
+
+    def __call__(cls, *args, **kwargs) -> Type['ExecutesAtMostQueries']:
+        if cls is not ExecutesAtMostQueries:
+            return super().__call__(*args, **kwargs)
+
+        num_queries, = args
+
+        # We create a copy of this method, so we can change its name to
+        # include the query budget.
+        def test_it_executes_at_most_max_queries(self, request_queries, max_queries):
+            _assert_executes_at_most(request_queries, max_queries)
+
+        test_name = f'test_it_executes_at_most_{num_queries}_queries'
+        test_it_executes_at_most_max_queries.__name__ = test_name
+
+        return type(f'ExecutesAtMost{num_queries}Queries', (CapturesRequestQueries,), {
+            test_name: test_it_executes_at_most_max_queries,
+            'max_queries': static_fixture(num_queries),
+
+            # Disable the original method
+            'test_it_executes_at_most_max_queries': None,
+        })
+
+
+class ExecutesAtMostQueries(CapturesRequestQueries, metaclass=_ExecutesAtMostQueriesMeta):
+    """Includes test which checks the request executes no more than N DB queries
+    """
+
+    @pytest.fixture
+    def max_queries(self) -> int:
+        raise NotImplementedError(
+            'Please define the max_queries fixture. Alternatively, subclass '
+            'ExecutesAtMostQueries(n) instead of the bare ExecutesAtMostQueries.'
+        )
+
+    def test_it_executes_at_most_max_queries(self, request_queries, max_queries):
+        _assert_executes_at_most(request_queries, max_queries)
+
+    if TYPE_CHECKING:
+        # this appeases code sense, which may not be able to understand how the
+        # metaclass allows using instantiation syntax without really instantiating.
+        def __new__(cls, num_queries: int) -> Type['ExecutesAtMostQueries']:
+            ...
+
+
+class CreatesDataSets:
+    """Declares how to create data sets of several sizes for the request to return
+
+    This is the base of mixins which repeat the request against data sets of
+    each of `data_set_sizes`, created with the `create_data_set` fixture.
+    """
+
+    @pytest.fixture
+    def create_data_set(self) -> Callable[[int], None]:
+        """Callable which creates a data set of the passed size
+
+        The callable receives the number of items to create, and should create
+        that many of whatever the endpoint returns.
+        """
+        raise NotImplementedError(
+            'Please define the create_data_set fixture, returning a callable '
+            'which accepts the number of items to create.'
+        )
+
+    data_set_sizes = static_fixture((1, 5, 10))
+
+
+class ExecutesConstantQueries(CreatesDataSets):
+    """Includes test which checks the number of queries doesn't grow with the data
+
+    The request is repeated once for each of `data_set_sizes`, after creating a
+    data set of that size with the `create_data_set` fixture. Each data set is
+    created within a savepoint, which is rolled back after its request, so
+    every request sees only the data set created for it.
+
+        class DescribeList(
+            UsesGetMethod,
+            UsesListEndpoint,
+
+            ExecutesConstantQueries,
+        ):
+            create_data_set = lambda_fixture(lambda: (
+                lambda size: [
+                    KeyValue.objects.create(key=f'key-{i}', value=f'value-{i}')
+                    for i in range(size)
+                ]
+            ))
+
+    """
+
+    def test_it_executes_constant_queries(self,
+                                          call_common_subject,
+                                          create_data_set,
+                                          data_set_sizes: Iterable[int]):
+        queries_by_size = {}
+        for size in data_set_sizes:
+            with rolled_back_atomic():
+                create_data_set(size)
+
+                with capture_queries() as queries:
+                    call_common_subject()
+
+            queries_by_size[size] = queries
+
+        _assert_constant_queries(queries_by_size)
@@ -0,0 +1,205 @@
+"""
+Complexity scaling
+==================
+
+This module contains the ScalesLinearlyAtMost test mixin, which repeats a test
+context's request against data sets of several sizes, and checks that neither
+the number of DB queries nor the latency of the request grows faster than the
+amount of data does.
+
+"""
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Sequence
+
+import pytest
+from pytest_lambda import static_fixture
+
+from pytest_drf.queries import CreatesDataSets, _assert_constant_queries
+from pytest_drf.util import CapturedQuery, capture_queries, rolled_back_atomic
+
+__all__ = ['ScalesLinearlyAtMost', 'ScalingMeasurement', 'fit_scaling_exponent']
+
+
+@dataclass
+class ScalingMeasurement:
+    """Measurements of the request against a data set of a single size"""
+
+    #: Number of items in the data set
+    size: int
+
+    #: Fastest time (in seconds) taken to perform the request, of all rounds
+    duration: float
+
+    #: DB queries executed while performing the request, in each round
+    round_queries: List[List[CapturedQuery]]
+
+    @property
+    def queries(self) -> List[CapturedQuery]:
+        """DB queries executed by the round executing the most of them"""
+        return max(self.round_queries, key=len)
+
+
+def fit_scaling_exponent(sizes: Sequence[float], durations: Sequence[float]) -> float:
+    """Return k, where duration ~ size^k, fit by least squares on a log-log scale
+
+    An exponent near 1 indicates linear growth, near 2 quadratic growth, and
+    near (or below) 0 indicates the duration does not depend on size at all.
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(duration, 1e-9)) for duration in durations]
+
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if not variance:
+        raise ValueError('At least two distinct data set sizes are required to fit scaling')
+
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return covariance / variance
+
+
+def _format_measurements(measurements: Iterable[ScalingMeasurement]) -> str:
+    return '\n'.join(
+        f'  size {m.size}: {m.duration * 1000:.2f}ms, {len(m.queries)} queries'
+        for m in measurements
+    )
+
+
+class ScalesLinearlyAtMost(CreatesDataSets):
+    """Includes tests which check the request scales no worse than linearly with data
+
+    For each of `data_set_sizes` (by default: 10, 100, and 1000), a data set of
+    that size is created with the `create_data_set` fixture, and the request
+    performed `scaling_rounds` times. Each data set is created within a
+    savepoint, which is rolled back after its requests.
+
+    The tests fail if the number of DB queries differs between data set sizes
+    at all (i.e. N+1 queries), or if latency grows super-linearly — that is, if
+    the exponent of a power law fit to latency against data set size exceeds
+    `max_scaling_exponent` (default: 1.3, leaving some headroom for noise).
+
+    To keep timer noise from failing the latency test, durations shorter than
+    `min_scaling_duration` (default: 1ms) are raised to it before fitting, and
+    the measurements are retaken (up to `scaling_attempts` times in all) before
+    the test fails.
+
+    The measurements are taken once per class, and shared by both tests.
+
+        class DescribeList(
+            UsesGetMethod,
+            UsesListEndpoint,
+
+            ScalesLinearlyAtMost,
+        ):
+            create_data_set = lambda_fixture(lambda: (
+                lambda size: KeyValue.objects.bulk_create([
+                    KeyValue(key=f'key-{i}', value=f'value-{i}')
+                    for i in range(size)
+                ])
+            ))
+
+    """
+
+    data_set_sizes = static_fixture((10, 100, 1000))
+
+    @pytest.fixture
+    def scaling_rounds(self) -> int:
+        """Number of times to perform the request for each data set size"""
+        return 3
+
+    @pytest.fixture
+    def max_scaling_exponent(self) -> float:
+        """Greatest allowed exponent of latency growth with data set size"""
+        return 1.3
+
+    @pytest.fixture
+    def min_scaling_duration(self) -> float:
+        """Duration (in seconds) below which latency is considered timer noise"""
+        return 0.001
+
+    @pytest.fixture
+    def scaling_attempts(self) -> int:
+        """Number of times to take measurements before failing the latency test"""
+        return 2
+
+    @pytest.fixture
+    def measure_scaling(self,
+                        call_common_subject,
+                        create_data_set,
+                        data_set_sizes: Iterable[int],
+                        scaling_rounds: int,
+                        ) -> Callable[[], List[ScalingMeasurement]]:
+        """A 0-arg method measuring the request against each data set size"""
+        def measure_scaling() -> List[ScalingMeasurement]:
+            measurements = []
+            for size in sorted(data_set_sizes):
+                with rolled_back_atomic():
+                    create_data_set(size)
+
+                    timings = []
+                    round_queries = []
+                    for _ in range(scaling_rounds):
+                        with rolled_back_atomic(), capture_queries() as queries:
+                            start = time.perf_counter()
+                            call_common_subject()
+                            timings.append(time.perf_counter() - start)
+                        round_queries.append(queries)
+
+                measurements.append(ScalingMeasurement(size, min(timings), round_queries))
+
+            return measurements
+
+        return measure_scaling
+
+    @pytest.fixture(scope='class')
+    def shared_scaling_measurements(self) -> Dict[str, List[ScalingMeasurement]]:
+        """Storage for the scaling measurements, shared across the class"""
+        return {}
+
+    @pytest.fixture
+    def scaling_measurements(self,
+                             request,
+                             shared_scaling_measurements,
+                             ) -> List[ScalingMeasurement]:
+        """Latency and DB queries of the request, for each data set size
+
+        The measurements are taken by the first test of the class requesting
+        them, and reused by the rest.
+        """
+        if 'measurements' not in shared_scaling_measurements:
+            # NOTE: fixtures are requested lazily, so the fixtures setting up
+            #       the measurements are not evaluated for later tests
+            measure_scaling = request.getfixturevalue('measure_scaling')
+            shared_scaling_measurements['measurements'] = measure_scaling()
+
+        return shared_scaling_measurements['measurements']
+
+    def test_its_queries_do_not_grow_with_data(self, scaling_measurements):
+        _assert_constant_queries({m.size: m.queries for m in scaling_measurements})
+
+    def test_its_latency_scales_linearly_at_most(self,
+                                                 scaling_measurements,
+                                                 measure_scaling,
+                                                 max_scaling_exponent: float,
+                                                 min_scaling_duration: float,
+                                                 scaling_attempts: int):
+        measurements = scaling_measurements
+        for attempt in range(scaling_attempts):
+            if attempt:
+                measurements = measure_scaling()
+
+            exponent = fit_scaling_exponent(
+                [m.size for m in measurements],
+                [max(m.duration, min_scaling_duration) for m in measurements],
+            )
+            if exponent <= max_scaling_exponent:
+                return
+
+        raise AssertionError(
+            f'Latency grows super-linearly with data set size '
+            f'(~size^{exponent:.2f}, exceeding size^{max_scaling_exponent:.2f}, '
+            f'in each of {scaling_attempts} attempts):\n'
+            f'{_format_measurements(measurements)}'
+        )
@@ -0,0 +1,151 @@
+"""
+Enforcing response shapes
+=========================
+
+This module contains test mixins to declare the shape of an API response's
+JSON body, or of each item in its results. Shapes are compiled into fast
+validators once, when the test class is declared (see
+pytest_drf.util.compile_shape for the shape syntax).
+
+"""
+from typing import Any, Iterable, List, TYPE_CHECKING, Type
+
+import pytest
+from pytest_lambda import static_fixture
+
+from pytest_drf.util import CompiledShape, compile_shape
+
+__all__ = ['ReturnsShape', 'ReturnsResultsOfShape']
+
+
+#: Maximum number of mismatches reported in a failure message
+MAX_REPORTED_ERRORS = 10
+
+
+def _format_errors(errors: List[str]) -> str:
+    lines = [f'  {error}' for error in errors[:MAX_REPORTED_ERRORS]]
+    if len(errors) > MAX_REPORTED_ERRORS:
+        lines.append(f'  ... and {len(errors) - MAX_REPORTED_ERRORS} more')
+    return '\n'.join(lines)
+
+
+def assert_matches_shape(value: Any,
+                         shape: CompiledShape,
+                         message: str = 'Response does not match the expected shape'):
+    __tracebackhide__ = True
+
+    if not shape(value):
+        raise AssertionError(f'{message}:\n{_format_errors(shape.get_errors(value))}')
+
+
+def assert_items_match_shape(items: Iterable[Any],
+                             shape: CompiledShape,
+                             message: str = 'Results do not match the expected shape'):
+    __tracebackhide__ = True
+
+    errors = []
+    num_items = 0
+    for i, item in enumerate(items):
+        num_items += 1
+        if not shape(item):
+            errors.extend(shape.get_errors(item, path=f'$[{i}]'))
+
+    if errors:
+        raise AssertionError(
+            f'{message} ({num_items} items checked):\n'
+            f'{_format_errors(errors)}'
+        )
+
+
+class _ReturnsShapeMeta(type):
+    # This metaclass allows ReturnsShape(shape) to return a test mixin with the
+    # expected_shape fixture defined as the compiled shape.
+
+    def __call__(cls, *args, **kwargs) -> Type['ReturnsShape']:
+        if cls is not ReturnsShape:
+            return super().__call__(*args, **kwargs)
+
+        shape, = args
+        return type('ReturnsShape', (ReturnsShape,), {
+            'expected_shape': static_fixture(compile_shape(shape)),
+        })
+
+
+class ReturnsShape(metaclass=_ReturnsShapeMeta):
+    """Includes test which checks the response JSON matches a declared shape
+
+        class DescribeRetrieve(
+            UsesGetMethod,
+            UsesDetailEndpoint,
+
+            ReturnsShape({'id': int, 'key': str, 'value': Optional[str]}),
+        ):
+            ...
+
+    """
+
+    @pytest.fixture
+    def expected_shape(self) -> CompiledShape:
+        raise NotImplementedError(
+            'Please define the expected_shape fixture (using compile_shape()). '
+            'Alternatively, subclass ReturnsShape(shape) instead of the bare '
+            'ReturnsShape.'
+        )
+
+    def test_it_returns_expected_shape(self, json, expected_shape):
+        assert_matches_shape(json, expected_shape)
+
+    if TYPE_CHECKING:
+        # this appeases code sense, which may not be able to understand how the
+        # metaclass allows using instantiation syntax without really instantiating.
+        def __new__(cls, shape: Any) -> Type['ReturnsShape']:
+            ...
+
+
+class _ReturnsResultsOfShapeMeta(type):
+    # This metaclass allows ReturnsResultsOfShape(shape) to return a test mixin
+    # with the expected_result_shape fixture defined as the compiled shape.
+
+    def __call__(cls, *args, **kwargs) -> Type['ReturnsResultsOfShape']:
+        if cls is not ReturnsResultsOfShape:
+            return super().__call__(*args, **kwargs)
+
+        shape, = args
+        return type('ReturnsResultsOfShape', (ReturnsResultsOfShape,), {
+            'expected_result_shape': static_fixture(compile_shape(shape)),
+        })
+
+
+class ReturnsResultsOfShape(metaclass=_ReturnsResultsOfShapeMeta):
+    """Includes test which checks every item of `results` matches a declared shape
+
+    This pairs well with the pagination mixins, which check only the envelope
+    around the results:
+
+        class DescribeList(
+            UsesGetMethod,
+            UsesListEndpoint,
+
+            ReturnsPageNumberPagination,
+            ReturnsResultsOfShape({'id': int, 'key': str, 'value': Optional[str]}),
+        ):
+            ...
+
+    """
+
+    @pytest.fixture
+    def expected_result_shape(self) -> CompiledShape:
+        raise NotImplementedError(
+            'Please define the expected_result_shape fixture (using '
+            'compile_shape()). Alternatively, subclass ReturnsResultsOfShape(shape) '
+            'instead of the bare ReturnsResultsOfShape.'
+        )
+
+    def test_it_returns_results_of_expected_shape(self, results, expected_result_shape):
+        assert_items_match_shape(results, expected_result_shape)
+
+    if TYPE_CHECKING:
+        # this appeases code sense, which may not be able to understand how the
+        # metaclass allows using instantiation syntax without really instantiating.
+        def __new__(cls, shape: Any) -> Type['ReturnsResultsOfShape']:
+            ...
@@ -0,0 +1,351 @@
+"""
+Comparing responses against golden snapshots
+============================================
+
+This module contains the MatchesSnapshot test mixin, which compares the JSON
+body of a test context's response against a snapshot stored by a previous run.
+
+Snapshots are kept in a single binary file per test module — e.g. the
+snapshots of tests/test_views.py are stored in
+tests/__snapshots__/test_views.snap — keyed by each test's node ID within its
+module. The file is read through mmap, and only its index is decoded upfront:
+each snapshot is compared by its encoded bytes, and decoded only to describe a
+mismatch.
+
+A snapshot test fails if the response differs from its snapshot — or if no
+snapshot is stored for it. To record missing snapshots, and overwrite existing
+ones with the latest responses, pass `--drf-update-snapshots`. This also
+removes the snapshots of tests which no longer exist, from the files of every
+test module collected in full.
+
+Snapshot files are written under an exclusive lock (where fcntl is available),
+so concurrent sessions — e.g. xdist workers — don't lose each other's updates.
+
+"""
+import json
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+from typing import Any, Collection, Dict, Iterator, List, Mapping, Optional, Set
+
+import pytest
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from pytest_drf.util import json_loads
+from pytest_drf.util.comparisons import _format_items, _repr
+
+__all__ = ['MatchesSnapshot', 'SnapshotFile', 'SnapshotStore']
+
+
+#: Leading bytes of every snapshot file, identifying its format (and version)
+SNAPSHOT_FILE_MAGIC = b'DRFSNAP\x01'
+
+#: Byte length of the index, following the magic
+_INDEX_LENGTH = struct.Struct('>I')
+
+
+def encode_snapshot(value: Any) -> bytes:
+    """Return the canonical encoding of a JSON value, as stored in snapshot files"""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def get_snapshot_path(module_path: str) -> str:
+    """Return the path of the snapshot file storing the snapshots of a test module"""
+    dirname, filename = os.path.split(module_path)
+    name, _ = os.path.splitext(filename)
+    return os.path.join(dirname, '__snapshots__', f'{name}.snap')
+
+
+def _diff_json(expected: Any, actual: Any, path: str = '$') -> Iterator[str]:
+    """Yield a description of each difference between two JSON values, by path"""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in sorted(expected.keys() - actual.keys()):
+            yield f'{path}.{key} is missing (expected: {_repr.repr(expected[key])})'
+        for key in sorted(actual.keys() - expected.keys()):
+            yield f'{path}.{key} is unexpected (actual: {_repr.repr(actual[key])})'
+        for key in sorted(expected.keys() & actual.keys()):
+            yield from _diff_json(expected[key], actual[key], f'{path}.{key}')
+
+    elif isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            yield f'{path} has {len(actual)} items, but {len(expected)} were expected'
+        for i, (expected_item, actual_item) in enumerate(zip(expected, actual)):
+            yield from _diff_json(expected_item, actual_item, f'{path}[{i}]')
+
+    elif expected != actual or type(expected) is not type(actual):
+        yield f'{path} expected: {_repr.repr(expected)}, actual: {_repr.repr(actual)}'
+
+
+def _get_snapshot_key(item) -> str:
+    """Return the key storing the snapshot of a test, within its module's file"""
+    return item.nodeid.split('::', 1)[1]
+
+
+class SnapshotFile:
+    """The snapshots of one test module, stored in a single binary file
+
+    The file consists of the magic bytes, the length of the index as a 4-byte
+    big-endian integer, the index — a JSON object mapping each key to the
+    offset and length of its snapshot — and then every snapshot's canonical
+    JSON encoding, back to back.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self._mmap: Optional[mmap.mmap] = None
+        self._index: Optional[Dict[str, List[int]]] = None
+        self._data_offset = 0
+
+    @property
+    def index(self) -> Dict[str, List[int]]:
+        if self._index is None:
+            self._index = {}
+            if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+                self._load()
+        return self._index
+
+    def _load(self):
+        with open(self.path, 'rb') as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_size = len(SNAPSHOT_FILE_MAGIC) + _INDEX_LENGTH.size
+        if self._mmap[:len(SNAPSHOT_FILE_MAGIC)] != SNAPSHOT_FILE_MAGIC:
+            self.close()
+            raise ValueError(f'{self.path} is not a pytest-drf snapshot file (or is of an unsupported version)')
+
+        index_length, = _INDEX_LENGTH.unpack_from(self._mmap, len(SNAPSHOT_FILE_MAGIC))
+        self._index = json_loads(self._mmap[header_size:header_size + index_length])
+        self._data_offset = header_size + index_length
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def get_encoded(self, key: str) -> Optional[bytes]:
+        """Return the encoded snapshot stored under key, or None"""
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+
+        offset, length = entry
+        start = self._data_offset + offset
+        return self._mmap[start:start + length]
+
+    def get(self, key: str) -> Any:
+        """Return the decoded snapshot stored under key
+
+        :raises KeyError: if no snapshot is stored under key
+        """
+        encoded = self.get_encoded(key)
+        if encoded is None:
+            raise KeyError(key)
+        return json_loads(encoded)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock on the file (through a sidecar lock file)"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        if fcntl is None:  # pragma: no cover
+            yield
+            return
+
+        with open(f'{self.path}.lock', 'wb') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def save(self, updates: Mapping[str, bytes], removals: Collection[str] = ()):
+        """Write the stored snapshots, along with the updated (encoded) snapshots
+
+        Snapshots stored under any of `removals` are left out.
+
+        The file is re-read beforehand, under a lock, so snapshots saved by
+        other sessions (e.g. other xdist workers) are kept.
+        """
+        with self._locked():
+            self._save(updates, removals)
+
+    def _save(self, updates: Mapping[str, bytes], removals: Collection[str]):
+        self.close()  # re-read the file on next access
+        snapshots = {key: self.get_encoded(key) for key in self.index if key not in removals}
+        snapshots.update(updates)
+
+        index = {}
+        offset = 0
+        for key, encoded in sorted(snapshots.items()):
+            index[key] = [offset, len(encoded)]
+            offset += len(encoded)
+        encoded_index = encode_snapshot(index)
+
+        self.close()
+
+        # NOTE: the file is written in full under another name, then moved into
+        #       place, so readers never see a partially-written file
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as fp:
+            fp.write(SNAPSHOT_FILE_MAGIC)
+            fp.write(_INDEX_LENGTH.pack(len(encoded_index)))
+            fp.write(encoded_index)
+            for key in index:
+                fp.write(snapshots[key])
+        os.replace(tmp_path, self.path)
+
+    def close(self):
+        """Unmap the file; it will be loaded again on next access"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._index = None
+
+
+class SnapshotStore:
+    """The snapshot files of all test modules, by path
+
+    An instance is registered as a plugin for the test session, so new and
+    updated snapshots may be written when the session finishes.
+
+    When updating, the keys of all collected snapshot tests are recorded, and
+    any other snapshots in their modules' files are removed — except for
+    modules only partially collected (e.g. `pytest tests/test_views.py::DescribeList`),
+    whose other tests may well still exist.
+    """
+
+    def __init__(self, update: bool = False, max_diff: int = 10):
+        self.update = update
+        self.max_diff = max_diff
+
+        self._files: Dict[str, SnapshotFile] = {}
+        self._updates: Dict[str, Dict[str, bytes]] = {}
+        self._collected_keys: Dict[str, Set[str]] = {}
+        self._partially_collected: Set[str] = set()
+        self.num_written = 0
+        self.num_removed = 0
+
+    def get_file(self, path: str) -> SnapshotFile:
+        snapshot_file = self._files.get(path)
+        if snapshot_file is None:
+            snapshot_file = self._files[path] = SnapshotFile(path)
+        return snapshot_file
+
+    def assert_match(self, path: str, key: str, value: Any):
+        """Assert value matches the snapshot stored under key in the snapshot file at path
+
+        If snapshots are being updated, value is recorded as the snapshot,
+        instead.
+        """
+        __tracebackhide__ = True
+
+        snapshot_file = self.get_file(path)
+        encoded = encode_snapshot(value)
+
+        stored = snapshot_file.get_encoded(key)
+        if stored == encoded:
+            return
+
+        if self.update:
+            self._updates.setdefault(path, {})[key] = encoded
+            return
+
+        if stored is None:
+            raise AssertionError(
+                f'No snapshot {key!r} is stored in {path}. '
+                f'Pass --drf-update-snapshots to record it.'
+            )
+
+        diff = list(_diff_json(snapshot_file.get(key), value))
+        raise AssertionError('\n'.join([
+            f'Response differs from snapshot {key!r} in {path}',
+            *_format_items('Differences', diff[:self.max_diff], len(diff)),
+            'Pass --drf-update-snapshots to overwrite the snapshot.',
+        ]))
+
+    def record_collected(self, path: str, key: str):
+        """Record that a snapshot test storing its snapshot under key was collected"""
+        self._collected_keys.setdefault(path, set()).add(key)
+
+    def get_stale_keys(self, path: str) -> Set[str]:
+        """Return the keys of stored snapshots whose tests were not collected"""
+        if not self.update or path in self._partially_collected:
+            return set()
+        return set(self.get_file(path).index) - self._collected_keys.get(path, set())
+
+    def save(self):
+        for path in sorted(self._updates.keys() | self._collected_keys.keys()):
+            updates = self._updates.get(path, {})
+            removals = self.get_stale_keys(path)
+            if updates or removals:
+                self.get_file(path).save(updates, removals)
+                self.num_written += len(updates)
+                self.num_removed += len(removals)
+        self._updates.clear()
+
+    def pytest_sessionstart(self, session):
+        for arg in session.config.args:
+            module_path, sep, _ = str(arg).partition('::')
+            if sep:
+                self._partially_collected.add(get_snapshot_path(os.path.abspath(module_path)))
+
+    def pytest_itemcollected(self, item):
+        if getattr(item, 'originalname', None) == 'test_it_matches_snapshot':
+            self.record_collected(get_snapshot_path(str(item.fspath)), _get_snapshot_key(item))
+
+    def pytest_sessionfinish(self, session):
+        self.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.num_written or self.num_removed:
+            terminalreporter.write_line(
+                f'DRF snapshots: wrote {self.num_written} snapshots, '
+                f'removed {self.num_removed} stale snapshots'
+            )
+
+    def pytest_unconfigure(self, config):
+        for snapshot_file in self._files.values():
+            snapshot_file.close()
+
+
+class MatchesSnapshot:
+    """Includes test which compares the response JSON against a stored snapshot
+
+        class DescribeList(
+            UsesGetMethod,
+            UsesListEndpoint,
+
+            MatchesSnapshot,
+        ):
+            key_values = precondition_fixture(lambda: KeyValue.objects.create_batch(alpha='beta'))
+
+    Values which differ on every run (e.g. timestamps) can be left out of the
+    comparison by overriding the `snapshot_value` fixture:
+
+            snapshot_value = lambda_fixture(lambda results: [
+                {k: v for k, v in item.items() if k != 'created_at'}
+                for item in results
+            ])
+
+    """
+
+    @pytest.fixture
+    def snapshot_value(self, json) -> Any:
+        """The value compared against the snapshot — by default, the response JSON"""
+        return json
+
+    @pytest.fixture
+    def snapshot_path(self, request) -> str:
+        """Path of the snapshot file storing the snapshots of the test's module"""
+        return get_snapshot_path(str(request.node.fspath))
+
+    @pytest.fixture
+    def snapshot_store(self, request) -> SnapshotStore:
+        """Storage for snapshots"""
+        return request.config.pluginmanager.get_plugin('drf_snapshots')
+
+    def test_it_matches_snapshot(self, request, snapshot_value, snapshot_path: str, snapshot_store: SnapshotStore):
+        snapshot_store.assert_match(snapshot_path, _get_snapshot_key(request.node), snapshot_value)
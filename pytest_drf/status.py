@@ -6,7 +6,7 @@ This module contains test mixins to declare the HTTP status code expected in
 an API response
 
 """
-from typing import Type, TYPE_CHECKING
+from typing import Dict, Type, TYPE_CHECKING
 
 import pytest
 from pytest_lambda import static_fixture
@@ -40,6 +40,12 @@ __all__ = [
 class _ReturnsSpecificStatusMeta(type):
     # This metaclass allows ReturnStatus(xyz) to return a subclass of
     # ReturnStatus with the expected_status_code fixture defined as xyz.
+    #
+    # The generated mixins are interned, so ReturnsStatus(xyz) always returns
+    # the same class — sparing large suites from declaring (and pytest from
+    # parsing the fixtures of) thousands of identical classes.
+
+    _interned: Dict[int, Type['ReturnsStatus']] = {}
 
     def __call__(cls, *args, **kwargs) -> Type['ReturnsStatus']:
         if cls is not ReturnsStatus:
@@ -47,6 +53,14 @@ class _ReturnsSpecificStatusMeta(type):
 
         status_code, = args
 
+        try:
+            return cls._interned[status_code]
+        except KeyError:
+            returns_code_cls = cls._interned[status_code] = cls._create_mixin(status_code)
+            return returns_code_cls
+
+    @staticmethod
+    def _create_mixin(status_code: int) -> Type['ReturnsStatus']:
         # We create a copy of this method, so we can change its name to
         # include the expected status code.
         def test_it_returns_expected_status_code(self, response, expected_status_code):
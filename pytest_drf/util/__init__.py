@@ -1,3 +1,9 @@
+from .comparisons import *
+from .decoding import *
 from .expressions import *
+from .instances import *
 from .metaclasses import *
+from .shapes import *
+from .queries import *
+from .transactions import *
 from .urls import *
@@ -0,0 +1,171 @@
+import hashlib
+import json
+import reprlib
+from collections import Counter
+from typing import Any, List, NamedTuple, Sequence
+
+__all__ = ['assert_results_equal', 'json_digest', 'JSONDigest']
+
+
+_repr = reprlib.Repr()
+_repr.maxlevel = 3
+_repr.maxdict = 8
+_repr.maxlist = 8
+_repr.maxstring = 60
+_repr.maxother = 60
+
+
+def _canonicalize(item: Any) -> str:
+    """Return a stable JSON encoding of item, for hashing
+
+    NOTE: matchers (e.g. pytest_assert_utils' util.Any) cannot be encoded, and
+          thus cannot be hashed. A TypeError is raised for them.
+    """
+    return json.dumps(item, sort_keys=True, separators=(',', ':'))
+
+
+class JSONDigest(NamedTuple):
+    """A compact stand-in for a very large JSON payload"""
+
+    #: Number of items in the payload (if a list), or 1
+    count: int
+
+    #: SHA-256 of the payload's canonical JSON encoding
+    hash: str
+
+
+def json_digest(value: Any, *, ignore_order: bool = False) -> JSONDigest:
+    """Summarize a JSON-serializable value by its size and a stable hash
+
+    Comparing digests is far cheaper than comparing (or storing) the full
+    payloads, and their equality doesn't depend on key order of dicts. With
+    `ignore_order=True`, the order of a list's items doesn't matter, either.
+
+    >>> json_digest([{'a': 1, 'b': 2}]) == json_digest([{'b': 2, 'a': 1}])
+    True
+    """
+    if not isinstance(value, (list, tuple)):
+        value = [value]
+
+    encoded_items = [_canonicalize(item).encode('utf-8') for item in value]
+    if ignore_order:
+        encoded_items.sort()
+
+    digest = hashlib.sha256()
+    for encoded_item in encoded_items:
+        digest.update(hashlib.sha256(encoded_item).digest())
+
+    return JSONDigest(len(encoded_items), digest.hexdigest())
+
+
+def _format_items(label: str, items: List[str], total: int) -> List[str]:
+    lines = [f'{label} ({total}):']
+    lines.extend(f'  {item}' for item in items)
+    if total > len(items):
+        lines.append(f'  ... and {total - len(items)} more')
+    return lines
+
+
+def _diff_ordered(expected: Sequence, actual: Sequence, max_diff: int) -> List[str]:
+    lines = []
+    if len(expected) != len(actual):
+        lines.append(f'Expected {len(expected)} items, but {len(actual)} were returned')
+
+    mismatched = []
+    num_mismatched = 0
+    for i, (expected_item, actual_item) in enumerate(zip(expected, actual)):
+        if expected_item != actual_item:
+            num_mismatched += 1
+            if len(mismatched) < max_diff:
+                mismatched.append(
+                    f'[{i}] expected: {_repr.repr(expected_item)}\n'
+                    f'  {" " * len(str(i))}     actual: {_repr.repr(actual_item)}'
+                )
+    if num_mismatched:
+        lines.extend(_format_items('Mismatched items', mismatched, num_mismatched))
+
+    if len(actual) > len(expected):
+        extra = actual[len(expected):]
+        lines.extend(_format_items('Unexpected items', [_repr.repr(item) for item in extra[:max_diff]], len(extra)))
+    elif len(expected) > len(actual):
+        missing = expected[len(actual):]
+        lines.extend(_format_items('Missing items', [_repr.repr(item) for item in missing[:max_diff]], len(missing)))
+
+    return lines
+
+
+def _diff_unordered(expected: Sequence, actual: Sequence, max_diff: int) -> List[str]:
+    try:
+        expected_counts = Counter(map(_canonicalize, expected))
+    except TypeError as e:
+        raise TypeError(
+            'Expected items must be JSON-serializable (not matchers) to be '
+            'compared with ignore_order=True'
+        ) from e
+    actual_counts = Counter(map(_canonicalize, actual))
+
+    missing = expected_counts - actual_counts
+    unexpected = actual_counts - expected_counts
+    if not missing and not unexpected:
+        return []
+
+    lines = []
+    if len(expected) != len(actual):
+        lines.append(f'Expected {len(expected)} items, but {len(actual)} were returned')
+
+    for label, counts, items in (('Missing items', missing, expected),
+                                 ('Unexpected items', unexpected, actual)):
+        if not counts:
+            continue
+
+        # Find an example of each of the first max_diff differing items
+        shown_counts = dict(list(counts.items())[:max_diff])
+        examples = {}
+        for item in items:
+            encoded = _canonicalize(item)
+            if encoded in shown_counts:
+                examples.setdefault(encoded, item)
+
+        shown = [
+            _repr.repr(examples[encoded]) + (f' (x{count})' if count > 1 else '')
+            for encoded, count in shown_counts.items()
+        ]
+        lines.extend(_format_items(label, shown, sum(counts.values())))
+
+    return lines
+
+
+def assert_results_equal(expected: Sequence,
+                         actual: Sequence,
+                         *,
+                         ignore_order: bool = False,
+                         max_diff: int = 10):
+    """Assert two (potentially very large) lists of items are equal
+
+    Unlike a bare `expected == actual`, a mismatch is reported as a bounded
+    diff — listing at most `max_diff` mismatched, missing, or unexpected
+    items, each with a truncated repr — instead of the full contents of both
+    lists.
+
+    With `ignore_order=True`, the lists are compared as multisets, by hashing
+    each item's canonical JSON encoding, in O(n) time. Expected items must
+    therefore be JSON-serializable (i.e. not matchers, like util.Any) in
+    this mode. Otherwise, items are compared pairwise by equality, so
+    matchers may be used.
+
+    >>> assert_results_equal([{'id': 1}, {'id': 2}], [{'id': 2}, {'id': 1}], ignore_order=True)
+    """
+    __tracebackhide__ = True
+
+    expected = list(expected)
+    actual = list(actual)
+
+    if ignore_order:
+        diff = _diff_unordered(expected, actual, max_diff)
+    elif expected == actual:
+        diff = []
+    else:
+        diff = _diff_ordered(expected, actual, max_diff)
+
+    if diff:
+        raise AssertionError('\n'.join(['Results differ'] + diff))
@@ -0,0 +1,59 @@
+import io
+import json
+import re
+from typing import Any, Callable, Iterator, Optional
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+__all__ = ['json_loads', 'decode_json', 'iter_json_items']
+
+
+JSON_CONTENT_TYPE_RE = re.compile(r'^application/(.+\+)?json')
+
+#: The default JSON decoder. A faster one (e.g. orjson.loads) may be used for the
+#: `json` fixture by overriding the `json_decoder` fixture.
+json_loads: Callable[[bytes], Any] = json.loads
+
+
+def _check_json_content_type(response):
+    content_type = response.get('Content-Type')
+    if not JSON_CONTENT_TYPE_RE.match(content_type or ''):
+        raise ValueError(f'Content-Type header is "{content_type}", not "application/json"')
+
+
+def decode_json(response, loads: Optional[Callable[[bytes], Any]] = None) -> Any:
+    """Decode the JSON body of a response, caching the result on the response
+
+    The decoded body is stored where Django's test client caches it, so
+    decode_json() and response.json() share the work, whichever is called
+    first. `loads` defaults to `json_loads`.
+    """
+    if not hasattr(response, '_json'):
+        _check_json_content_type(response)
+        if loads is None:
+            loads = json_loads
+        response._json = loads(response.content)
+    return response._json
+
+
+def iter_json_items(response, key: Optional[str] = 'results') -> Iterator[Any]:
+    """Iterate over the items of a JSON array in a response's body
+
+    With ijson installed (e.g. with `pip install pytest-drf[ijson]`), the items
+    are decoded one at a time, without ever materializing the full list. Otherwise (or if the body has already been
+    decoded), the items are read from the fully-decoded body.
+
+    :param key:
+        Name of the key holding the array in the top-level JSON object, or None
+        if the body itself is an array.
+    """
+    if hasattr(response, '_json') or ijson is None:
+        body = decode_json(response)
+        return iter(body if key is None else body[key])
+
+    _check_json_content_type(response)
+    prefix = 'item' if key is None else f'{key}.item'
+    return ijson.items(io.BytesIO(response.content), prefix, use_float=True)
@@ -1,4 +1,7 @@
-from typing import Callable, Iterable, List, TypeVar, Union
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar, Union
+
+from django.db.models import QuerySet, prefetch_related_objects
 
 try:
     from typing import Protocol
@@ -23,7 +26,12 @@ class ExpressionMethodWithoutKwargs(Protocol):
 ExpressionMethod = Union[ExpressionMethodWithKwargs, ExpressionMethodWithoutKwargs]
 
 
-def pluralized(fn: ExpressionMethod) -> Callable[[Iterable[T]], List[V]]:
+def pluralized(fn: Optional[ExpressionMethod] = None,
+               *,
+               select_related: Sequence[str] = (),
+               prefetch_related: Sequence[str] = (),
+               prepare: Optional[Callable[[List[T]], Dict[str, Any]]] = None,
+               ) -> Callable[[Iterable[T]], List[V]]:
     """Return a method which maps a set of args onto fn()
 
     >>> fn = lambda d: d
@@ -33,9 +41,51 @@ def pluralized(fn: ExpressionMethod) -> Callable[[Iterable[T]], List[V]]:
     >>> fn_pluralized([{'id': 1}, {'id': 2}])
     [{'id': 1}, {'id': 2}]
 
+    When expressing model instances, related objects the expression method
+    touches may be loaded up front for all instances (in a constant number of
+    queries), instead of one at a time as fn() is called for each instance:
+
+        @pluralized(select_related=['owner'], prefetch_related=['tags'])
+        def express_articles(article):
+            ...
+
+    select_related is applied to querysets only; for lists of instances, the
+    relations are prefetched instead. For anything else which can be computed
+    in bulk, `prepare` is called once with the list of all objects, and the
+    dict it returns is passed as kwargs to every call of fn():
+
+        def prepare(articles):
+            counts = Comment.objects.filter(article__in=articles)...
+            return {'comment_counts': dict(counts)}
+
+        @pluralized(prepare=prepare)
+        def express_articles(article, comment_counts=None):
+            ...
+
     """
+    if fn is None:
+        return partial(
+            pluralized,
+            select_related=select_related,
+            prefetch_related=prefetch_related,
+            prepare=prepare,
+        )
 
     def bulk_fn(args: Iterable[T], **kwargs) -> List[V]:
+        if isinstance(args, QuerySet):
+            if select_related:
+                args = args.select_related(*select_related)
+            if prefetch_related:
+                args = args.prefetch_related(*prefetch_related)
+            args = list(args)
+        elif select_related or prefetch_related:
+            args = list(args)
+            prefetch_related_objects(args, *select_related, *prefetch_related)
+
+        if prepare is not None:
+            args = list(args)
+            kwargs = {**prepare(args), **kwargs}
+
         mapped = map(lambda arg: fn(arg, **kwargs), args)
         return list(mapped)
 
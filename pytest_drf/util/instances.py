@@ -0,0 +1,69 @@
+import copy
+from typing import Any, Dict, Iterator, List, Tuple
+
+from django.db.models import Model
+
+__all__ = ['snapshot_instances', 'InstanceSnapshot']
+
+
+def _iter_instances(value: Any) -> Iterator[Model]:
+    if isinstance(value, Model):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_instances(item)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            yield from _iter_instances(item)
+
+
+class InstanceSnapshot:
+    """The in-memory state of model instances, which may be restored later
+
+    See snapshot_instances()
+    """
+
+    def __init__(self, value: Any):
+        self.value = value
+        self._states: List[Tuple[Model, Dict[str, Any]]] = [
+            (instance, self._copy_state(vars(instance)))
+            for instance in _iter_instances(value)
+        ]
+
+    @staticmethod
+    def _copy_state(state: Dict[str, Any]) -> Dict[str, Any]:
+        # NOTE: field values are replaced, not mutated, when a test changes an
+        #       instance — only Django's own ModelState (holding the cache of
+        #       related objects) need be copied, rather than the whole dict.
+        state = dict(state)
+        model_state = state['_state'] = copy.copy(state['_state'])
+        if 'fields_cache' in vars(model_state):
+            model_state.fields_cache = dict(model_state.fields_cache)
+        return state
+
+    def restore(self):
+        """Return every instance to its state when the snapshot was taken
+
+        Any attributes set since then (e.g. cached permissions, or prefetched
+        relations) are discarded.
+        """
+        for instance, state in self._states:
+            instance_dict = vars(instance)
+            instance_dict.clear()
+            instance_dict.update(self._copy_state(state))
+
+
+def snapshot_instances(value: Any) -> InstanceSnapshot:
+    """Record the in-memory state of model instances, to be restored later
+
+    The value may be a model instance, or any (nested) list, tuple, set, or
+    dict of them. Restoring the snapshot is cheap, requiring no DB queries,
+    which makes it suitable for resetting objects shared between tests.
+
+        snapshot = snapshot_instances(user)
+        user.first_name = 'Changed'
+        snapshot.restore()
+        assert user.first_name == 'Alice'
+
+    """
+    return InstanceSnapshot(value)
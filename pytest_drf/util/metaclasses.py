@@ -1,4 +1,4 @@
-from typing import Optional, Type, Tuple, Union
+from typing import Dict, Optional, Type, Tuple, Union
 
 __all__ = ['prioritize_bases', 'prioritize_base', 'deprioritize_base']
 
@@ -9,10 +9,26 @@ class _PrioritizeBases(type):
 
     base_class_priorities: Tuple[Tuple[Type, Optional[Union[int, float]]]] = ()
 
+    # Priorities already computed for each base. A base's priority never
+    # changes, so each need only be computed once per metaclass.
+    _sort_orders: Dict[Type, Union[int, float]] = {}
+
+    def __init_subclass__(mcs, **kwargs):
+        super().__init_subclass__(**kwargs)
+        mcs._sort_orders = {}
+
     @classmethod
     def sort_order(mcs, base) -> Union[int, float]:
         """Return priority of base in a subclass, or Infinity to retain original order
         """
+        try:
+            return mcs._sort_orders[base]
+        except KeyError:
+            order = mcs._sort_orders[base] = mcs._compute_sort_order(base)
+            return order
+
+    @classmethod
+    def _compute_sort_order(mcs, base) -> Union[int, float]:
         highest_priority = len(mcs.base_class_priorities)
 
         for i, (prioritized_base, priority) in enumerate(mcs.base_class_priorities):
@@ -22,7 +38,8 @@ class _PrioritizeBases(type):
             return highest_priority
 
     def __new__(mcs, name, bases, attrs):
-        bases = tuple(sorted(bases, key=mcs.sort_order))
+        if len(bases) > 1:
+            bases = tuple(sorted(bases, key=mcs.sort_order))
         return super().__new__(mcs, name, bases, attrs)
 
 
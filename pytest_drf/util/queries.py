@@ -0,0 +1,81 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, List, NamedTuple, Optional
+
+from django.core.signals import request_finished, request_started
+from django.db import DEFAULT_DB_ALIAS, connections
+
+__all__ = ['CapturedQuery', 'capture_queries', 'capture_request_queries']
+
+
+class CapturedQuery(NamedTuple):
+    sql: str
+    params: Any
+    time: float
+
+    def __str__(self):
+        return f'{self.sql} -- params: {self.params!r}'
+
+
+class _QueryRecorder:
+    """DB execute wrapper which records queries while `recording` is True
+    """
+
+    def __init__(self, recording: bool = True):
+        self.recording = recording
+        self.queries: List[CapturedQuery] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        if not self.recording:
+            return execute(sql, params, many, context)
+
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.queries.append(CapturedQuery(sql, params, duration))
+
+
+@contextmanager
+def capture_queries(using: Optional[str] = None) -> Iterator[List[CapturedQuery]]:
+    """Record every DB query executed within the block
+
+        with capture_queries() as queries:
+            list(KeyValue.objects.all())
+
+        assert len(queries) == 1
+
+    """
+    connection = connections[using or DEFAULT_DB_ALIAS]
+    recorder = _QueryRecorder()
+
+    with connection.execute_wrapper(recorder):
+        yield recorder.queries
+
+
+@contextmanager
+def capture_request_queries(using: Optional[str] = None) -> Iterator[List[CapturedQuery]]:
+    """Record the DB queries executed while handling requests within the block
+
+    Only queries executed between Django's request_started and request_finished
+    signals (which the test client sends around each request) are recorded, so
+    any queries performed to set up a request are ignored.
+    """
+    connection = connections[using or DEFAULT_DB_ALIAS]
+    recorder = _QueryRecorder(recording=False)
+
+    def start_recording(**kwargs):
+        recorder.recording = True
+
+    def stop_recording(**kwargs):
+        recorder.recording = False
+
+    request_started.connect(start_recording, weak=False)
+    request_finished.connect(stop_recording, weak=False)
+    try:
+        with connection.execute_wrapper(recorder):
+            yield recorder.queries
+    finally:
+        request_started.disconnect(start_recording)
+        request_finished.disconnect(stop_recording)
@@ -0,0 +1,210 @@
+import typing
+from typing import Any, Callable, Iterator, List, Tuple
+
+__all__ = ['compile_shape', 'CompiledShape']
+
+
+#: A check returns True if its value fits the shape; its explainer lists the
+#: reasons a value does not fit the shape (as (path, message) pairs).
+_Check = Callable[[Any], bool]
+_Explain = Callable[[Any, str], Iterator[Tuple[str, str]]]
+
+
+def _describe(value: Any) -> str:
+    if value is None:
+        return 'null'
+    return type(value).__name__
+
+
+def _compile_type(shape: type) -> Tuple[_Check, _Explain]:
+    if shape is int:
+        # NOTE: bool is a subclass of int, but true/false are not numbers in JSON
+        def check(value):
+            return isinstance(value, int) and not isinstance(value, bool)
+    elif shape is float:
+        # NOTE: JSON does not distinguish integral floats from ints
+        def check(value):
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+    elif shape is type(None):
+        def check(value):
+            return value is None
+    else:
+        def check(value):
+            return isinstance(value, shape)
+
+    def explain(value, path):
+        if not check(value):
+            yield path, f'expected {shape.__name__}, got {_describe(value)}'
+
+    return check, explain
+
+
+def _compile_dict(shape: dict) -> Tuple[_Check, _Explain]:
+    keys = frozenset(shape)
+    fields = [(key, *_compile(subshape)) for key, subshape in shape.items()]
+
+    def check(value):
+        if not isinstance(value, dict) or value.keys() != keys:
+            return False
+        for key, check_field, _ in fields:
+            if not check_field(value[key]):
+                return False
+        return True
+
+    def explain(value, path):
+        if not isinstance(value, dict):
+            yield path, f'expected object, got {_describe(value)}'
+            return
+
+        missing = keys - value.keys()
+        if missing:
+            yield path, f'missing keys: {", ".join(map(repr, sorted(missing, key=str)))}'
+        unexpected = value.keys() - keys
+        if unexpected:
+            yield path, f'unexpected keys: {", ".join(map(repr, sorted(unexpected, key=str)))}'
+
+        for key, _, explain_field in fields:
+            if key in value:
+                yield from explain_field(value[key], f'{path}.{key}')
+
+    return check, explain
+
+
+def _compile_list(item_shape: Any) -> Tuple[_Check, _Explain]:
+    check_item, explain_item = _compile(item_shape)
+
+    def check(value):
+        if not isinstance(value, list):
+            return False
+        for item in value:
+            if not check_item(item):
+                return False
+        return True
+
+    def explain(value, path):
+        if not isinstance(value, list):
+            yield path, f'expected array, got {_describe(value)}'
+            return
+
+        for i, item in enumerate(value):
+            yield from explain_item(item, f'{path}[{i}]')
+
+    return check, explain
+
+
+def _compile_union(shapes: tuple) -> Tuple[_Check, _Explain]:
+    compiled = [_compile(shape) for shape in shapes]
+    checks = [check for check, _ in compiled]
+
+    def check(value):
+        for check_option in checks:
+            if check_option(value):
+                return True
+        return False
+
+    def explain(value, path):
+        if not check(value):
+            options = ' | '.join(_describe_shape(shape) for shape in shapes)
+            yield path, f'expected {options}, got {_describe(value)}'
+
+    return check, explain
+
+
+def _compile_literal(shape: Any) -> Tuple[_Check, _Explain]:
+    # Anything else is compared by equality, so matchers (e.g. from
+    # pytest_assert_utils' util module) may be used as shapes.
+    def check(value):
+        return shape == value
+
+    def explain(value, path):
+        if not check(value):
+            yield path, f'expected {shape!r}, got {value!r}'
+
+    return check, explain
+
+
+def _describe_shape(shape: Any) -> str:
+    if isinstance(shape, type):
+        return 'null' if shape is type(None) else shape.__name__
+    return repr(shape)
+
+
+def _compile(shape: Any) -> Tuple[_Check, _Explain]:
+    if shape is Any:
+        return (lambda value: True), (lambda value, path: iter(()))
+
+    if isinstance(shape, CompiledShape):
+        return shape.check, shape.explain
+
+    # NOTE: typing.get_origin()/get_args() are unavailable before Python 3.8
+    origin = getattr(shape, '__origin__', None)
+    if origin is typing.Union:
+        return _compile_union(shape.__args__)
+    if origin is list:
+        args = getattr(shape, '__args__', None)
+        item_shape = args[0] if args and not isinstance(args[0], typing.TypeVar) else Any
+        return _compile_list(item_shape)
+
+    if isinstance(shape, type):
+        return _compile_type(shape)
+    if isinstance(shape, dict):
+        return _compile_dict(shape)
+    if isinstance(shape, list):
+        if len(shape) != 1:
+            raise TypeError(
+                f'List shapes must contain exactly one item shape, '
+                f'applied to every item; got: {shape!r}'
+            )
+        return _compile_list(shape[0])
+
+    return _compile_literal(shape)
+
+
+class CompiledShape:
+    """A validator for a JSON shape, compiled into nested closures
+
+    See compile_shape()
+    """
+
+    def __init__(self, shape: Any):
+        self.shape = shape
+        self.check, self.explain = _compile(shape)
+
+    def __call__(self, value: Any) -> bool:
+        return self.check(value)
+
+    def get_errors(self, value: Any, path: str = '$') -> List[str]:
+        """Return descriptions of every way value does not fit the shape"""
+        return [f'{error_path}: {message}' for error_path, message in self.explain(value, path)]
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.shape!r})'
+
+
+def compile_shape(shape: Any) -> CompiledShape:
+    """Compile a declaration of a JSON value's shape into a fast validator
+
+    Shapes are declared with:
+
+     - types, e.g. `int` or `str` (where `float` also accepts ints, and `int`
+       does not accept bools)
+     - dicts, mapping each expected key to the shape of its value (no other
+       keys are allowed)
+     - single-item lists, e.g. `[int]`, giving the shape of every item
+     - typing constructs: `Any`, `Optional[...]`, `Union[...]`, `List[...]`
+     - anything else, which is compared by equality (e.g. `'constant'`, or
+       matchers like pytest_assert_utils' `util.Any(str)`)
+
+    The shape is walked only once, at compile time. The resulting validator
+    returns whether a value fits the shape, stopping at the first mismatch;
+    `get_errors()` describes all mismatches, for use in failure messages.
+
+    >>> from typing import Optional
+    >>> is_page = compile_shape({'next': Optional[str], 'results': [{'id': int}]})
+    >>> is_page({'next': None, 'results': [{'id': 1}, {'id': 2}]})
+    True
+    >>> is_page.get_errors({'next': None, 'results': [{'id': 1}, {'id': '2'}]})
+    ['$.results[1].id: expected int, got str']
+
+    """
+    return CompiledShape(shape)
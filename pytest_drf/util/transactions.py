@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from django.db import transaction
+
+__all__ = ['rolled_back_atomic']
+
+
+@contextmanager
+def rolled_back_atomic(using: Optional[str] = None) -> Iterator[None]:
+    """Run the enclosed block in a transaction (or savepoint), then roll it back
+
+    This behaves like Django's `transaction.atomic()`, except any changes made
+    to the DB within the block are always discarded when the block exits. If
+    an atomic block is already open (as it is within a pytest-django `db`
+    test), a savepoint is used, and only the changes made since the savepoint
+    are rolled back.
+
+        with rolled_back_atomic():
+            KeyValue.objects.create(key='apple', value='π')
+            assert KeyValue.objects.count() == 1
+
+        assert KeyValue.objects.count() == 0
+
+    """
+    with transaction.atomic(using=using):
+        try:
+            yield
+        finally:
+            # NOTE: if the connection was closed while inside our block (e.g.
+            #       by a test harness tearing down the test DB), Django will
+            #       have already reset its atomic state; there is nothing left
+            #       for us to roll back.
+            if transaction.get_connection(using).in_atomic_block:
+                transaction.set_rollback(True, using=using)
@@ -1,8 +1,145 @@
-from django.urls import reverse
+import re
+import threading
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Pattern, Tuple
+from urllib.parse import quote
+
+from django.core.signals import setting_changed
+from django.urls import get_resolver, get_script_prefix, get_urlconf, reverse
+from django.utils.http import RFC3986_SUBDELIMS, escape_leading_slashes
+from django.utils.translation import get_language
 
 __all__ = ['url_for']
 
 
+class _RouteTemplate(NamedTuple):
+    """A single way of building a URL for a view, compiled from its URL pattern"""
+
+    #: %-style template of the URL (sans script prefix), e.g. 'status/%(code)s'
+    template: str
+
+    #: Names of the template's placeholders, in positional order
+    params: Tuple[str, ...]
+
+    #: Default kwargs declared for the pattern (e.g. `path(..., {'x': 1})`)
+    defaults: Dict[str, Any]
+
+    #: Path converters for each placeholder, by name
+    converters: Dict[str, Any]
+
+    #: Pattern the filled template must match (args are not validated otherwise)
+    regex: Pattern
+
+
+class _CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+class _RouteTemplateCache:
+    """Compiled route templates, keyed by resolver, language, view, and arg shape
+
+    Keying by the resolver itself means switching ROOT_URLCONF or calling
+    set_urlconf() naturally selects a different set of templates. The cache is
+    additionally emptied whenever ROOT_URLCONF is changed through Django's
+    setting_changed signal (e.g. with override_settings), so templates built
+    against a replaced resolver are not kept alive.
+    """
+
+    def __init__(self):
+        self.templates: Dict[Hashable, List[_RouteTemplate]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, resolver, viewname: str, num_args: int, kwarg_names: frozenset) -> List[_RouteTemplate]:
+        key = (resolver, get_language(), viewname, num_args, kwarg_names)
+        try:
+            templates = self.templates[key]
+        except KeyError:
+            with self._lock:
+                self.misses += 1
+                templates = self.templates[key] = self.compile(resolver, viewname, num_args, kwarg_names)
+        else:
+            self.hits += 1
+        return templates
+
+    @staticmethod
+    def compile(resolver, viewname: str, num_args: int, kwarg_names: frozenset) -> List[_RouteTemplate]:
+        """Return all route templates capable of accepting the given arg shape
+
+        This mirrors the shape checks of URLResolver._reverse_with_prefix(),
+        which are otherwise repeated on every call to reverse().
+        """
+        templates = []
+        for possibility, pattern, defaults, converters in resolver.reverse_dict.getlist(viewname):
+            regex = re.compile(pattern)
+            for template, params in possibility:
+                if num_args:
+                    if num_args != len(params):
+                        continue
+                elif kwarg_names.symmetric_difference(params).difference(defaults):
+                    continue
+
+                templates.append(_RouteTemplate(
+                    template=template,
+                    params=tuple(params),
+                    defaults=defaults,
+                    converters=converters,
+                    regex=regex,
+                ))
+        return templates
+
+    def info(self) -> _CacheInfo:
+        """Report the hit/miss statistics of url_for's route template cache"""
+        return _CacheInfo(self.hits, self.misses, len(self.templates))
+
+    def clear(self):
+        """Empty url_for's route template cache, and reset its statistics"""
+        with self._lock:
+            self.templates.clear()
+            self.hits = self.misses = 0
+
+
+_route_templates = _RouteTemplateCache()
+
+
+def _clear_route_templates_on_urlconf_change(*, setting, **kwargs):
+    if setting == 'ROOT_URLCONF':
+        _route_templates.clear()
+
+
+setting_changed.connect(_clear_route_templates_on_urlconf_change)
+
+
+def _fill_route_template(route: _RouteTemplate, args: tuple, kwargs: dict) -> Optional[str]:
+    """Fill in the route's template with args/kwargs, or return None if they don't fit
+    """
+    if args:
+        candidate_subs = dict(zip(route.params, args))
+    else:
+        for name, default in route.defaults.items():
+            if name not in route.params and kwargs.get(name, default) != default:
+                return None
+        candidate_subs = kwargs
+
+    text_subs = {}
+    for name, value in candidate_subs.items():
+        converter = route.converters.get(name)
+        if converter is None:
+            text_subs[name] = str(value)
+        else:
+            try:
+                text_subs[name] = converter.to_url(value)
+            except ValueError:
+                return None
+
+    path = route.template % text_subs
+    if not route.regex.match(path):
+        return None
+    return path
+
+
 def url_for(viewname, *args, _urlconf=None, _current_app=None, **kwargs):
     """Build URI for a view, given args and kwargs
 
@@ -18,9 +155,36 @@ def url_for(viewname, *args, _urlconf=None, _current_app=None, **kwargs):
     '/myview/1337'
     >>> url_for('myview-detail', security_event_id=1337)
     '/myview/1337'
+
+    The route templates for each view name are compiled once, on first use, and
+    cached — sparing the walk through the URL resolver reverse() performs on
+    every call. Hit rate is reported by `url_for.cache_info()`, and the cache
+    may be emptied with `url_for.cache_clear()`.
+
+    NOTE: namespaced view names (e.g. 'app:myview-detail') and view callables
+          are passed straight through to reverse()
     """
-    return reverse(viewname,
-                   urlconf=_urlconf,
-                   current_app=_current_app,
-                   args=args,
-                   kwargs=kwargs)
+    if not isinstance(viewname, str) or ':' in viewname or (args and kwargs):
+        return reverse(viewname,
+                       urlconf=_urlconf,
+                       current_app=_current_app,
+                       args=args,
+                       kwargs=kwargs)
+
+    resolver = get_resolver(_urlconf if _urlconf is not None else get_urlconf())
+    routes = _route_templates.get(resolver, viewname, len(args), frozenset(kwargs))
+
+    for route in routes:
+        path = _fill_route_template(route, args, kwargs)
+        if path is not None:
+            # safe characters from `pchar` definition of RFC 3986
+            url = quote(get_script_prefix() + path, safe=RFC3986_SUBDELIMS + '/~:@')
+            # Don't allow construction of scheme relative urls.
+            return escape_leading_slashes(url)
+
+    # Let reverse() raise its descriptive NoReverseMatch
+    return reverse(viewname, urlconf=_urlconf, args=args, kwargs=kwargs)
+
+
+url_for.cache_info = _route_templates.info
+url_for.cache_clear = _route_templates.clear
@@ -8,17 +8,21 @@ mixins are exposed for declaring which HTTP method is used, and for ViewSetTests
 which endpoint is used.
 
 """
-from typing import Dict, Any
+import asyncio
+import inspect
+from typing import Any, Callable, Dict, List
 from urllib.parse import ParseResult, urlparse, parse_qs, urlencode, urlunparse
 
 import pytest
-from pytest_common_subject import CommonSubjectTestMixin
+from pytest_common_subject import CommonSubjectTestMixin, DeferredCommonSubjectRvalUsage
+from pytest_common_subject.util import VolatileValue
 from pytest_lambda import lambda_fixture, static_fixture
 
-from pytest_drf.util import deprioritize_base
+from pytest_drf.util import decode_json, deprioritize_base, iter_json_items
 
 __all__ = [
     'APIViewTest',
+    'AsyncAPIViewTest',
     'ViewSetTest',
     'UsesListEndpoint',
     'UsesDetailEndpoint',
@@ -27,6 +31,10 @@ __all__ = [
     'UsesPutMethod',
     'UsesPatchMethod',
     'UsesDeleteMethod',
+    'StreamsResults',
+    'RequestsOnce',
+    'CachesResponse',
+    'DispatchesDirectly',
 ]
 
 
@@ -146,9 +154,13 @@ class APIViewTest(CommonSubjectTestMixin):
         return common_subject_rval
 
     @pytest.fixture
-    def json(self, response):
-        """The JSON body of the API response"""
-        return response.json()
+    def json(self, response, json_decoder):
+        """The JSON body of the API response
+
+        The body is decoded (with `json_decoder`) only once, and cached on the
+        response.
+        """
+        return decode_json(response, loads=json_decoder)
 
     @pytest.fixture
     def results(self, json):
@@ -170,6 +182,83 @@ class APIViewTest(CommonSubjectTestMixin):
         return dict(data=data, headers=headers)
 
 
+class AsyncAPIViewTest(APIViewTest):
+    """Base class for testing views through Django's ASGI request handler
+
+    Requests are performed with DRFAsyncTestClient, so async views are run on
+    the event loop — not through the async_to_sync bridge used when serving
+    requests through WSGI. The `response`, `json`, and `results` fixtures are
+    the same as with APIViewTest.
+
+    The `gather_responses` fixture may be used to perform the request several
+    times concurrently, on the same event loop:
+
+        class DescribeMyAsyncView(
+            AsyncAPIViewTest,
+            UsesGetMethod,
+        ):
+            url = lambda_fixture(lambda: url_for('my-async-view'))
+
+            def it_handles_concurrent_requests(self, gather_responses):
+                responses = gather_responses(10)
+
+                expected = [200] * 10
+                actual = [response.status_code for response in responses]
+                assert expected == actual
+
+    """
+
+    @pytest.fixture
+    def client(self, unauthed_async_client):
+        """Async API client to perform requests with
+
+        See APIViewTest.client
+        """
+        return unauthed_async_client
+
+    @pytest.fixture
+    def create_drf_client(self, create_drf_async_client):
+        """Creates authenticated clients (e.g. for AsUser) using DRFAsyncTestClient
+        """
+        return create_drf_async_client
+
+    @pytest.fixture
+    def call_common_subject(self, common_subject, args, kwargs) -> Callable[[], Any]:
+        """Performs the request on an event loop, returning the response
+        """
+        # NOTE: local import used, as asgiref is only installed from Django 3.0
+        from asgiref.sync import async_to_sync
+
+        async def perform_request():
+            response = common_subject(*args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+            return response
+
+        # NOTE: async_to_sync (rather than asyncio.run) ensures any sync code
+        #       called by the handler (e.g. through sync_to_async) is run in this
+        #       thread, where the test's DB connection lives.
+        return async_to_sync(perform_request)
+
+    @pytest.fixture
+    def gather_responses(self, common_subject, args, kwargs) -> Callable[[int], List[Any]]:
+        """Performs the request N times concurrently, returning all responses
+        """
+        # NOTE: local import used, as asgiref is only installed from Django 3.0
+        from asgiref.sync import async_to_sync
+
+        def gather_responses(num_requests: int) -> List[Any]:
+            async def perform_requests():
+                return await asyncio.gather(*(
+                    common_subject(*args, **kwargs)
+                    for _ in range(num_requests)
+                ))
+
+            return async_to_sync(perform_requests)()
+
+        return gather_responses
+
+
 class ViewSetTest(APIViewTest):
     """DRF view test w/ ViewSet-specific conveniences"""
 
@@ -225,3 +314,208 @@ class UsesPatchMethod:
 
 class UsesDeleteMethod:
     http_method = static_fixture('delete')
+
+
+###################
+# REQUEST SHARING #
+###################
+#
+# Declare that the request need only be performed once for all tests in a class
+
+
+class StreamsResults:
+    """Make `results` an iterator, decoding the items of the response one by one
+
+    Items are only decoded individually if ijson is installed (e.g. with
+    `pip install pytest-drf[ijson]`). Otherwise, `results` iterates over the
+    fully-decoded list.
+    """
+
+    @pytest.fixture
+    def results(self, response):
+        """Iterator over the items of the 'results' key in the API response JSON body"""
+        return iter_json_items(response, 'results')
+
+
+class RequestsOnce:
+    """Perform the request once, and share its response with every test in the class
+
+    Normally, each test method performs its own request (along with evaluating
+    all the fixtures setting up that request). When a test context contains
+    many assertions about the same response, this can be wasteful. Including
+    this mixin causes the request — and any precondition fixtures — to be
+    evaluated only for the first test of the class. Every later test receives
+    the same `response` (and thus `json` and `results`).
+
+    All changes made to the DB by the request are made within a transaction (or
+    a savepoint, if a transaction is already open), which is rolled back after
+    the last test in the class has run. See the `class_db_transaction` fixture.
+
+        class DescribeList(
+            UsesGetMethod,
+            UsesListEndpoint,
+            RequestsOnce,
+
+            Returns200,
+        ):
+            key_values = class_fixture(
+                lambda:
+                    KeyValue.objects.create_batch(alpha='beta'),
+                autouse=True)
+
+            def it_returns_key_values(self, key_values, results):
+                ...
+
+    NOTE: fixtures requested by the tests themselves (not only by the request)
+          are still evaluated for each test. If a test compares the response
+          to DB rows created before the request, declare those fixtures with
+          class_fixture() (or scope='class'), so every test sees the same rows
+          the request did. The class's transaction is always opened before any
+          class-scoped fixtures are evaluated, so their rows are rolled back,
+          too.
+
+    NOTE: each class (including nested child contexts) performs its own request
+
+    NOTE: if `is_common_subject_deferred` is True (e.g. with
+          WithCommonSubjectDeferred), no request is performed or shared; each
+          test performs its own through `call_common_subject`, as usual.
+
+    """
+
+    @pytest.fixture(scope='class', autouse=True)
+    @pytest.mark.early  # ensure the transaction is opened before other class fixtures
+    def shared_common_subject_rvals(self, class_db_transaction) -> Dict[str, Any]:
+        """Storage for the common subject's return value, shared across the class
+
+        This requests (and so opens) the `class_db_transaction` before any other
+        class-scoped fixtures — e.g. preconditions creating rows — are evaluated.
+        """
+        return {}
+
+    @pytest.fixture(autouse=True)
+    @pytest.mark.late  # ensure the request is made after all other fixtures
+    def common_subject_rval(self, request, is_common_subject_deferred: bool, shared_common_subject_rvals):
+        if is_common_subject_deferred:
+            # NOTE: as with CommonSubjectTestMixin, the preconditions are still
+            #       evaluated, but the request is left to the tests to perform
+            request.getfixturevalue('all_preconditions')
+            return VolatileValue(
+                'An attempt was made to use `common_subject_rval` while '
+                '`is_common_subject_deferred` is True. This exception is '
+                'thrown to prevent accidental passing of tests through '
+                'unintended use of a deferred `common_subject_rval`',
+                exc_class=DeferredCommonSubjectRvalUsage,
+            )
+
+        if 'rval' not in shared_common_subject_rvals:
+            # NOTE: fixtures are requested lazily, so the fixtures setting up
+            #       the request are not evaluated for later tests in the class
+            request.getfixturevalue('all_preconditions')
+            call_common_subject = request.getfixturevalue('call_common_subject')
+            shared_common_subject_rvals['rval'] = call_common_subject()
+
+        return shared_common_subject_rvals['rval']
+
+
+class CachesResponse:
+    """Reuse the response stored by a previous run, if nothing behind the request has changed
+
+    The response to each test's request is stored on disk (see the
+    `drf_response_cache` fixture), keyed by a hash of the request (method,
+    `full_url`, `data`, and `headers`), the user and credentials of the
+    client, the source files of the endpoint's view, serializer, and other
+    policy classes, and the row counts, greatest primary keys, and auto_now
+    timestamps of the models they use. When a later run finds a response
+    under the same key, the view is not executed at all.
+
+    NOTE: updates to existing rows only change the key if their model has an
+          auto_now field (e.g. an `updated_at` timestamp). Tests updating rows
+          of models without one before their request should not use this mixin.
+
+        class DescribeList(
+            UsesGetMethod,
+            UsesListEndpoint,
+            CachesResponse,
+
+            Returns200,
+        ):
+            key_values = precondition_fixture(lambda: KeyValue.objects.create_batch(alpha='beta'))
+
+            def it_returns_key_values(self, key_values, results):
+                ...
+
+    Stored responses are plain HttpResponses with the same status, headers,
+    and body (and `from_response_cache = True`), so `response`, `json`, and
+    `results` are unchanged — but attributes set by the test client and DRF
+    (e.g. `response.data` or `response.wsgi_request`) are not available.
+
+    Only the responses of GET, HEAD, and OPTIONS requests are cached. Requests
+    whose queries are captured (e.g. by ExecutesAtMostQueries), whose responses
+    are validated against the OpenAPI schema (which requires the request the
+    test client attaches to them), or which are profiled with --drf-profile,
+    are always performed. Override the
+    `response_cacheable` fixture to decide otherwise.
+
+    NOTE: anything else the response depends on — e.g. settings overridden by
+          the test, the current time, or data of models the view's classes
+          don't declare — is not part of the key. Don't use this mixin for
+          such endpoints.
+
+    """
+
+    @pytest.fixture
+    def response_cacheable(self, request, http_method) -> bool:
+        """Whether the response may be reused from, and stored in, the response cache"""
+        from pytest_drf.caching import CACHEABLE_METHODS
+
+        return (
+            http_method.lower() in CACHEABLE_METHODS
+            and 'captured_request_queries' not in request.fixturenames
+            and 'openapi_validator' not in request.fixturenames
+            and not request.config.getoption('drf_profile', default=False)
+            and not request.config.getoption('drf_profile_json', default=None)
+        )
+
+    @pytest.fixture
+    def response_cache_key(self, drf_response_cache, http_method, full_url, data, headers, client) -> str:
+        """Key storing the response in the response cache"""
+        return drf_response_cache.get_key(http_method, full_url, data, headers, client)
+
+    @pytest.fixture(autouse=True)
+    @pytest.mark.late  # ensure the request is made after all other fixtures
+    def common_subject_rval(self, request, drf_response_cache, all_preconditions, call_common_subject):
+        if drf_response_cache is None or not request.getfixturevalue('response_cacheable'):
+            return call_common_subject()
+
+        # NOTE: the key is generated only after all preconditions have been
+        #       evaluated, so it fingerprints the data they create
+        key = request.getfixturevalue('response_cache_key')
+        response = drf_response_cache.get(key)
+        if response is None:
+            response = call_common_subject()
+            drf_response_cache.set(key, response)
+
+        return response
+
+
+####################
+# REQUEST DISPATCH #
+####################
+#
+# Declare how the request reaches the view
+
+
+class DispatchesDirectly:
+    """Call views directly, skipping the request handler and middleware
+
+    The `unauthed_client` and `create_drf_client` fixtures (and thus the default
+    `client`, and AsUser clients) are swapped for DRFDirectTestClients, which
+    call the view serving the requested URL directly. The `response`, `json`,
+    and `results` fixtures are unchanged.
+
+    This is a faster alternative for tests concerned only with the behaviour
+    of views and serializers. See DRFDirectTestClient for what is skipped.
+    """
+
+    unauthed_client = lambda_fixture('unauthed_direct_client')
+    create_drf_client = lambda_fixture('create_drf_direct_client')
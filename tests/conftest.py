@@ -1,21 +1,103 @@
+import os
+import textwrap
+
+import pytest
 from pytest_djangoapp import configure_djangoapp_plugin
 
-pytest_plugins = configure_djangoapp_plugin(
-    app_name='tests',
-    migrate=False,
-    settings=dict(
-        INSTALLED_APPS=[
-            'django.contrib.auth',
-            'django.contrib.contenttypes',
-            'rest_framework',
-            'tests.testapp',
+TESTS_SETTINGS = dict(
+    INSTALLED_APPS=[
+        'django.contrib.auth',
+        'django.contrib.contenttypes',
+        'rest_framework',
+        'tests.testapp',
+    ],
+    ROOT_URLCONF='tests.testapp.urls',
+    REST_FRAMEWORK={
+        'DEFAULT_PERMISSION_CLASSES': [
+            'rest_framework.permissions.AllowAny',
         ],
-        ROOT_URLCONF='tests.testapp.urls',
-        REST_FRAMEWORK={
-            'DEFAULT_PERMISSION_CLASSES': [
-                'rest_framework.permissions.AllowAny',
-            ],
-            'PAGE_SIZE': 100,
-        },
-    ),
+        'PAGE_SIZE': 100,
+    },
 )
+
+pytest_plugins = ['pytester', configure_djangoapp_plugin(
+    app_name='tests',
+    migrate=False,
+    settings=TESTS_SETTINGS,
+)]
+
+
+@pytest.fixture(scope='class')
+def class_db_transaction():
+    # NOTE: pytest-djangoapp creates a fresh test DB before every test, so
+    #       there is no way (nor any need) to hold a transaction open between
+    #       the tests of a class.
+    yield
+
+
+@pytest.fixture(scope='session')
+def session_db_transaction():
+    yield
+
+
+@pytest.fixture
+def live_server_url(liveserver):
+    with liveserver() as server:
+        yield server.url
+
+
+#: conftest of the sessions run by `run_with_shared_db`, which set up the test
+#: DB only once — so class and session transactions are held for real
+SHARED_DB_CONFTEST = textwrap.dedent('''
+    import django
+    import pytest
+    from django.conf import settings
+
+    settings.configure(
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+        **%r,
+    )
+    django.setup()
+
+
+    @pytest.fixture(scope='session')
+    def django_db_setup():
+        from django.test.utils import setup_databases, teardown_databases
+
+        old_config = setup_databases(verbosity=0, interactive=False)
+        yield
+        teardown_databases(old_config, verbosity=0)
+
+
+    @pytest.fixture(autouse=True)
+    def db(django_db_setup):
+        pass
+''') % (TESTS_SETTINGS,)
+
+
+@pytest.fixture
+def run_with_shared_db(monkeypatch, request):
+    """Run the passed test module in a pytest session whose test DB is set up only once
+
+    This suite recreates the test DB for every test, so no transaction can be
+    held open between tests (see `class_db_transaction` above). To test such
+    transactions, and the data shared through them, the source is run in a
+    subprocess sharing one test DB between all its tests, instead.
+    """
+    # NOTE: the pytester fixture was added in pytest 6.2, superseding testdir,
+    #       which offers the same methods used here
+    pytester = request.getfixturevalue('pytester' if hasattr(pytest, 'Pytester') else 'testdir')
+
+    monkeypatch.setenv('PYTHONPATH', str(request.config.rootdir), prepend=os.pathsep)
+    pytester.makeconftest(SHARED_DB_CONFTEST)
+    pytester.makeini(textwrap.dedent('''
+        [pytest]
+        python_classes = Describe* Context*
+        python_functions = it_* test_*
+    '''))
+
+    def run_with_shared_db(source: str, *args: str):
+        pytester.makepyfile(test_shared_db=textwrap.dedent(source))
+        return pytester.runpytest_subprocess('-p', 'no:cacheprovider', *args)
+
+    return run_with_shared_db
@@ -59,3 +59,122 @@ class DescribeUserInfo(
             expected = {'username': ''}
             actual = json
             assert expected == actual
+
+
+class DescribeAsUser:
+
+    def it_interns_mixins_by_user_fixture_name(self):
+        expected = AsUser('alice')
+        actual = AsUser('alice')
+        assert expected is actual
+
+    def it_creates_distinct_mixins_per_user_fixture_name(self):
+        assert AsUser('alice') is not AsUser('bob')
+
+
+class DescribeUserFixture:
+
+    def it_shares_saved_users_between_tests_of_a_class(self, run_with_shared_db):
+        # NOTE: each test checks the state it expects before changing it, so
+        #       the tests of the class pass in any order
+        result = run_with_shared_db('''
+            from django.contrib.auth.models import User
+            from django.db import transaction
+            from pytest_drf import user_fixture
+
+            @user_fixture
+            def carol():
+                return User.objects.create(username='carol', first_name='Carol')
+
+            def assert_pristine(carol):
+                expected = ([('carol', 'Carol')], 'Carol', False)
+                actual = (
+                    list(User.objects.values_list('username', 'first_name')),
+                    carol.first_name,
+                    hasattr(carol, '_perm_cache'),
+                )
+                assert expected == actual
+
+            def change(carol):
+                carol.first_name = 'Changed'
+                carol._perm_cache = {'testapp.change_keyvalue'}
+                carol.save()
+                User.objects.create(username='dave')
+
+            class DescribeUserFixture:
+                def it_rolls_back_changes_of_other_tests(self, carol):
+                    assert_pristine(carol)
+                    change(carol)
+
+                def it_rolls_back_changes_of_other_tests_too(self, carol):
+                    assert_pristine(carol)
+                    change(carol)
+
+                def it_runs_the_test_in_a_savepoint(self, carol):
+                    assert transaction.get_connection().in_atomic_block
+
+            class DescribeLaterClass:
+                def it_rolls_back_the_user_after_the_class(self):
+                    expected = 0
+                    actual = User.objects.count()
+                    assert expected == actual
+        ''')
+        result.assert_outcomes(passed=4)
+
+    def it_authenticates_as_the_shared_user(self, run_with_shared_db):
+        result = run_with_shared_db('''
+            from django.contrib.auth.models import User
+            from pytest_lambda import lambda_fixture
+            from pytest_drf import APIViewTest, AsUser, UsesGetMethod, user_fixture
+            from pytest_drf.util import url_for
+
+            @user_fixture
+            def carol():
+                return User.objects.create(username='carol')
+
+            class DescribeUserInfo(APIViewTest, UsesGetMethod, AsUser('carol')):
+                url = lambda_fixture(lambda: url_for('authentication-user-info'))
+
+                def it_authenticates_as_the_shared_user(self, json):
+                    expected = 'carol'
+                    actual = json['username']
+                    assert expected == actual
+        ''')
+        result.assert_outcomes(passed=1)
+
+    def it_authenticates_shared_users_once_for_all_tests(self, run_with_shared_db):
+        result = run_with_shared_db('''
+            import base64
+
+            import pytest
+            from django.contrib.auth.models import User
+            from pytest_lambda import lambda_fixture
+            from pytest_drf import APIViewTest, AsUser, UsesGetMethod, user_fixture
+            from pytest_drf.util import url_for
+
+            @pytest.fixture(scope='session')
+            def drf_client_authenticator():
+                def authenticate(client, user):
+                    print(f'authenticating {user.username}')
+                    credentials = base64.b64encode(f'{user.username}:password'.encode()).decode()
+                    client.credentials(HTTP_AUTHORIZATION=f'Basic {credentials}')
+                return authenticate
+
+            @user_fixture
+            def carol():
+                return User.objects.create_user(username='carol', password='password')
+
+            class DescribeUserInfo(APIViewTest, UsesGetMethod, AsUser('carol')):
+                url = lambda_fixture(lambda: url_for('authentication-user-info'))
+
+                def it_authenticates_in_one_test(self, json):
+                    assert json['username'] == 'carol'
+
+                def it_authenticates_in_another_test(self, json):
+                    assert json['username'] == 'carol'
+        ''', '-s')
+        result.assert_outcomes(passed=2)
+
+        expected = 1
+        actual = sum('authenticating carol' in line for line in result.outlines)
+        assert expected == actual
@@ -1,14 +1,18 @@
+import pytest
 from django.contrib.auth.models import User
-from pytest_lambda import lambda_fixture
+from pytest_lambda import lambda_fixture, static_fixture
 
 from pytest_drf import (
+    AccessMatrix,
     APIViewTest,
     AsUser,
     ForbidsAnonymousUsers,
     Returns200,
     UsesGetMethod,
+    ViewSetTest,
 )
 from pytest_drf.util import url_for
+from tests.testapp.models import KeyValue
 
 
 user = lambda_fixture(lambda: User.objects.create(
@@ -32,3 +36,83 @@ class DescribeLoginRequired(
     #       (i.e. it declares IsAuthenticated for its permission_classes)
     url = lambda_fixture(lambda: url_for('authorization-login-required'))
 
+
+
+admin = lambda_fixture(lambda: User.objects.create(
+    username='admin',
+    is_staff=True,
+))
+
+
+class DescribeKeyValueAccess(ViewSetTest):
+    # NOTE: anyone may read key-values, authenticated users may write them,
+    #       and only admins may delete them
+    list_url = lambda_fixture(lambda: url_for('authorization-key-values-list'))
+    detail_url = lambda_fixture(lambda key_value: url_for('authorization-key-values-detail', key_value.pk))
+
+    key_value = lambda_fixture(lambda: KeyValue.objects.create(key='apple', value='π'))
+
+
+    class DescribeAccessMatrix(
+        AccessMatrix({
+            'anonymous': {'list': 200, 'retrieve': 200, 'create': 403, 'partial_update': 403, 'destroy': 403},
+            'user': {'list': 200, 'retrieve': 200, 'create': 201, 'partial_update': 200, 'destroy': 403},
+            'admin': {'list': 200, 'retrieve': 200, 'create': 201, 'partial_update': 200, 'destroy': 204},
+        }),
+    ):
+        access_matrix_data = static_fixture({
+            'create': {'key': 'banana', 'value': 'ρ'},
+            'partial_update': {'value': 'ρ'},
+        })
+
+        def it_performs_each_request_only_once(self, access_matrix_responses):
+            expected = 15
+            actual = len({id(response) for response in access_matrix_responses.values()})
+            assert expected == actual
+
+        def it_rolls_back_each_request(self, access_matrix_responses):
+            expected = ['apple']
+            actual = [item['key'] for item in access_matrix_responses['admin', 'list'].json()['results']]
+            assert expected == actual
+
+
+    class DescribeAccessMatrixWithRaisingRequest(
+        AccessMatrix,
+    ):
+        error_url = lambda_fixture(lambda: url_for('views-raises-error'))
+        access_matrix = static_fixture({'anonymous': {'list': 200, 'get error_url': 500}})
+
+        # NOTE: each test checks nothing was shared beforehand, so they pass
+        #       in any order
+        def it_shares_no_responses_when_a_request_raises(self, request, shared_access_matrix_responses):
+            assert {} == shared_access_matrix_responses
+            with pytest.raises(RuntimeError):
+                request.getfixturevalue('access_matrix_responses')
+            assert {} == shared_access_matrix_responses
+
+        def it_shares_no_responses_in_later_tests(self, request, shared_access_matrix_responses):
+            assert {} == shared_access_matrix_responses
+            with pytest.raises(RuntimeError):
+                request.getfixturevalue('access_matrix_responses')
+            assert {} == shared_access_matrix_responses
+
+
+class DescribeAccessMatrix:
+
+    def it_generates_a_test_per_cell(self):
+        mixin = AccessMatrix({
+            'anonymous': {'list': 403},
+            'user': {'list': 200, 'post activate_url': 204},
+        })
+
+        expected = {
+            'test_anonymous_list_returns_403',
+            'test_user_list_returns_200',
+            'test_user_post_activate_url_returns_204',
+        }
+        actual = {name for name in vars(mixin) if name.startswith('test_')}
+        assert expected == actual
+
+    def it_rejects_unknown_actions(self):
+        with pytest.raises(ValueError):
+            AccessMatrix({'user': {'frobnicate': 200}})
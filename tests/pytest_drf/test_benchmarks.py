@@ -0,0 +1,156 @@
+from types import SimpleNamespace
+
+import pytest
+from pytest_lambda import lambda_fixture, static_fixture
+
+from pytest_drf import (
+    APIViewTest,
+    Benchmarks,
+    BenchmarkBaselines,
+    BenchmarkStats,
+    UsesGetMethod,
+    UsesPostMethod,
+)
+from pytest_drf.benchmarks import BASELINES_CACHE_KEY
+from pytest_drf.util import url_for
+
+from tests.testapp.models import KeyValue
+
+
+class DescribeBenchmarks(
+    APIViewTest,
+    UsesGetMethod,
+
+    Benchmarks,
+):
+    url = lambda_fixture(lambda: url_for('queries-key-values'))
+
+    # NOTE: baselines are stored in a temporary file, so as not to litter
+    #       the repo with this test's results
+    benchmark_baselines = lambda_fixture(
+        lambda tmp_path:
+            BenchmarkBaselines(str(tmp_path / 'benchmarks.json')))
+
+    benchmark_rounds = static_fixture(5)
+    benchmark_warmup_rounds = static_fixture(1)
+
+
+    def it_times_each_round(self, benchmark_stats, benchmark_rounds):
+        expected = benchmark_rounds
+        actual = benchmark_stats.rounds
+        assert expected == actual
+
+    def it_orders_stats(self, benchmark_stats):
+        assert (
+            benchmark_stats.min
+            <= benchmark_stats.p50
+            <= benchmark_stats.p95
+            <= benchmark_stats.max
+        )
+
+
+    class ContextModifyingRequest(
+        UsesPostMethod,
+    ):
+        # NOTE: KeyValue.key is unique, so repeating this request would fail,
+        #       were each round not rolled back.
+        url = lambda_fixture(lambda: url_for('views-key-values-list'))
+        data = static_fixture({
+            'key': 'apple',
+            'value': 'π',
+        })
+
+        def it_rolls_back_each_round(self, benchmark_stats):
+            expected = ['apple']
+            actual = list(KeyValue.objects.values_list('key', flat=True))
+            assert expected == actual
+
+
+class DescribeBenchmarkStats:
+    def it_computes_percentiles(self):
+        stats = BenchmarkStats.from_timings([float(i) for i in range(100, 0, -1)])
+
+        expected = BenchmarkStats(rounds=100, min=1.0, p50=50.0, p95=95.0, max=100.0)
+        actual = stats
+        assert expected == actual
+
+
+class DescribeBenchmarkBaselines:
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / 'benchmarks.json')
+
+    @pytest.fixture
+    def stats(self):
+        return BenchmarkStats(rounds=1, min=1.0, p50=1.0, p95=1.0, max=1.0)
+
+    def it_saves_new_baselines(self, path, stats):
+        baselines = BenchmarkBaselines(path)
+        baselines.record('test_node', stats)
+        baselines.save()
+
+        expected = stats
+        actual = BenchmarkBaselines(path).get('test_node')
+        assert expected == actual
+
+    def it_retains_existing_baselines(self, path, stats):
+        baselines = BenchmarkBaselines(path)
+        baselines.record('test_node', stats)
+        baselines.save()
+
+        slower_stats = BenchmarkStats(rounds=1, min=2.0, p50=2.0, p95=2.0, max=2.0)
+        baselines = BenchmarkBaselines(path)
+        baselines.record('test_node', slower_stats)
+        baselines.save()
+
+        expected = stats
+        actual = BenchmarkBaselines(path).get('test_node')
+        assert expected == actual
+
+    def it_overwrites_baselines_when_updating(self, path, stats):
+        baselines = BenchmarkBaselines(path)
+        baselines.record('test_node', stats)
+        baselines.save()
+
+        slower_stats = BenchmarkStats(rounds=1, min=2.0, p50=2.0, p95=2.0, max=2.0)
+        baselines = BenchmarkBaselines(path, update=True)
+        baselines.record('test_node', slower_stats)
+        baselines.save()
+
+        expected = slower_stats
+        actual = BenchmarkBaselines(path).get('test_node')
+        assert expected == actual
+
+    def it_stores_baselines_in_the_cache_without_a_path(self, stats):
+        cache = DictCache()
+        baselines = BenchmarkBaselines(cache=cache)
+        baselines.record('test_node', stats)
+        baselines.save()
+
+        expected = stats
+        actual = BenchmarkBaselines(cache=cache).get('test_node')
+        assert expected == actual
+
+    def it_passes_xdist_worker_results_to_the_controller(self, stats):
+        cache = DictCache()
+        worker_baselines = BenchmarkBaselines(cache=cache)
+        worker_baselines.record('test_node', stats)
+
+        worker_config = SimpleNamespace(workeroutput={})
+        worker_baselines.pytest_sessionfinish(SimpleNamespace(config=worker_config))
+        assert cache.get(BASELINES_CACHE_KEY, None) is None
+
+        controller_baselines = BenchmarkBaselines(cache=cache)
+        controller_baselines.pytest_testnodedown(SimpleNamespace(workeroutput=worker_config.workeroutput), None)
+        controller_baselines.pytest_sessionfinish(SimpleNamespace(config=SimpleNamespace()))
+
+        expected = stats
+        actual = BenchmarkBaselines(cache=cache).get('test_node')
+        assert expected == actual
+
+
+class DictCache(dict):
+    """In-memory stand-in for pytest's config.cache"""
+
+    def set(self, key, value):
+        self[key] = value
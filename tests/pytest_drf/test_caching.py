@@ -0,0 +1,214 @@
+import os
+
+import pytest
+from django.contrib.auth.models import User
+from django.http import HttpResponse, StreamingHttpResponse
+from pytest_common_subject import precondition_fixture
+from pytest_lambda import lambda_fixture, static_fixture
+
+from pytest_drf import (
+    APIViewTest,
+    CachesResponse,
+    ExecutesAtMostQueries,
+    MatchesOpenAPISchema,
+    Returns200,
+    UsesGetMethod,
+    UsesListEndpoint,
+    UsesPostMethod,
+    ViewSetTest,
+)
+from pytest_drf.caching import ResponseCache, _get_model_fingerprint
+from pytest_drf.util import url_for
+
+from tests.testapp.models import KeyValue, Note
+
+
+@pytest.fixture
+def drf_response_cache(request, tmp_path):
+    response_cache = ResponseCache(str(tmp_path / 'responses.sqlite3'), rootdir=str(request.config.rootdir))
+    yield response_cache
+    response_cache.close()
+
+
+class DescribeResponseCache:
+
+    def it_returns_stored_responses(self, drf_response_cache):
+        response = HttpResponse(b'{"alpha": "beta"}', status=201, content_type='application/json')
+        response['X-Custom'] = 'value'
+        drf_response_cache.set('key', response)
+
+        stored = drf_response_cache.get('key')
+
+        expected = (201, 'application/json', 'value', {'alpha': 'beta'}, True)
+        actual = (
+            stored.status_code,
+            stored['Content-Type'],
+            stored['X-Custom'],
+            stored.json(),
+            stored.from_response_cache,
+        )
+        assert expected == actual
+
+    def it_returns_none_for_unknown_keys(self, drf_response_cache):
+        expected = None
+        actual = drf_response_cache.get('unknown')
+        assert expected == actual
+
+    def it_does_not_store_streaming_responses(self, drf_response_cache):
+        stored = drf_response_cache.set('key', StreamingHttpResponse(iter([b'abc'])))
+
+        expected = (False, None)
+        actual = (stored, drf_response_cache.get('key'))
+        assert expected == actual
+
+    def it_evicts_least_recently_used_responses(self, drf_response_cache):
+        content = os.urandom(1000)  # incompressible, so each is stored in ~1KB
+        drf_response_cache.max_size = 2500
+
+        drf_response_cache.set('first', HttpResponse(content))
+        drf_response_cache.set('second', HttpResponse(content))
+        drf_response_cache.get('first')
+        drf_response_cache.set('third', HttpResponse(content))
+
+        expected = {'first': True, 'second': False, 'third': True}
+        actual = {key: drf_response_cache.get(key) is not None for key in expected}
+        assert expected == actual
+        assert drf_response_cache.size <= drf_response_cache.max_size
+
+
+class DescribeGetKey:
+
+    @lambda_fixture
+    def get_key(drf_response_cache, unauthed_client):
+        def get_key(client=unauthed_client, data=None):
+            return drf_response_cache.get_key('get', url_for('views-key-values-list'), data, {}, client)
+        return get_key
+
+    def it_is_stable_while_nothing_changes(self, get_key):
+        KeyValue.objects.create(key='alpha', value='beta')
+
+        expected = get_key()
+        actual = get_key()
+        assert expected == actual
+
+    def it_changes_when_endpoint_rows_are_created(self, get_key):
+        KeyValue.objects.create(key='alpha', value='beta')
+        initial_key = get_key()
+
+        KeyValue.objects.create(key='gamma', value='delta')
+
+        assert get_key() != initial_key
+
+    def it_changes_when_endpoint_rows_are_deleted(self, get_key):
+        KeyValue.objects.create(key='alpha', value='beta')
+        key_value = KeyValue.objects.create(key='gamma', value='delta')
+        initial_key = get_key()
+
+        key_value.delete()
+
+        assert get_key() != initial_key
+
+    def it_changes_with_request_data(self, get_key):
+        assert get_key(data={'page': 2}) != get_key()
+
+    def it_changes_with_authenticated_user(self, get_key, create_drf_client):
+        user = User.objects.create(username='alice')
+        assert get_key(client=create_drf_client(user)) != get_key()
+
+
+class DescribeGetModelFingerprint:
+
+    def it_changes_when_rows_with_auto_now_fields_are_updated(self):
+        note = Note.objects.create(text='alpha')
+        initial_fingerprint = _get_model_fingerprint(Note)
+
+        note.text = 'beta'
+        note.save()
+
+        assert _get_model_fingerprint(Note) != initial_fingerprint
+
+
+class DescribeCachesResponse(
+    ViewSetTest,
+    CachesResponse,
+):
+    list_url = lambda_fixture(lambda: url_for('views-key-values-list'))
+
+    key_values = precondition_fixture(lambda: KeyValue.objects.create_batch(alpha='beta'))
+
+    class ContextStored(
+        UsesGetMethod,
+        UsesListEndpoint,
+        Returns200,
+    ):
+        stored_response = precondition_fixture(
+            lambda drf_response_cache, response_cache_key:
+                drf_response_cache.set(
+                    response_cache_key,
+                    HttpResponse(b'{"results": "stored"}', content_type='application/json'),
+                ))
+
+        def it_returns_stored_response(self, response, results):
+            expected = (True, 'stored')
+            actual = (response.from_response_cache, results)
+            assert expected == actual
+
+    class ContextNotStored(
+        UsesGetMethod,
+        UsesListEndpoint,
+        Returns200,
+    ):
+        def it_performs_and_stores_request(self, response, drf_response_cache, response_cache_key):
+            expected = (False, response.content)
+            actual = (
+                getattr(response, 'from_response_cache', False),
+                drf_response_cache.get(response_cache_key).content,
+            )
+            assert expected == actual
+
+    class ContextUnsafeMethod(
+        UsesPostMethod,
+        UsesListEndpoint,
+    ):
+        data = static_fixture({'key': 'gamma', 'value': 'delta'})
+
+        def it_is_not_cacheable(self, response_cacheable):
+            expected = False
+            actual = response_cacheable
+            assert expected == actual
+
+    class ContextCapturingQueries(
+        UsesGetMethod,
+        UsesListEndpoint,
+        ExecutesAtMostQueries(2),
+    ):
+        def it_is_not_cacheable(self, response_cacheable):
+            expected = False
+            actual = response_cacheable
+            assert expected == actual
+
+    class ContextValidatedAgainstOpenAPI(
+        UsesGetMethod,
+        UsesListEndpoint,
+        MatchesOpenAPISchema,
+    ):
+        # NOTE: only tests validating the response (i.e. requesting the
+        #       openapi_validator fixture) perform their request
+        def it_is_not_cacheable(self, response_cacheable, openapi_validator):
+            expected = False
+            actual = response_cacheable
+            assert expected == actual
+
+
+class DescribeCachesResponseDisabled(
+    APIViewTest,
+    UsesGetMethod,
+    CachesResponse,
+):
+    url = lambda_fixture(lambda: url_for('views-query-params'))
+    drf_response_cache = static_fixture(None)
+
+    def it_performs_request(self, response):
+        expected = False
+        actual = getattr(response, 'from_response_cache', False)
+        assert expected == actual
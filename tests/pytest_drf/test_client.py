@@ -0,0 +1,222 @@
+import sys
+from types import ModuleType
+
+import pytest
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.test import override_settings
+from django.urls import clear_url_caches, path
+from pytest_lambda import lambda_fixture
+
+from pytest_drf.client import DRFDirectTestClient, DRFTestClientPool, _resolve
+from pytest_drf.util import url_for
+
+alice = lambda_fixture(lambda: User(pk=1, username='alice'))
+bob = lambda_fixture(lambda: User(pk=2, username='bob'))
+
+
+class DescribeDRFTestClientPool:
+    pool = lambda_fixture(lambda: DRFTestClientPool())
+
+    def it_reuses_released_clients_for_the_same_user(self, pool, alice):
+        client = pool.acquire(alice)
+        pool.release(client)
+
+        expected = client
+        actual = pool.acquire(User(pk=alice.pk, username='alice'))
+        assert expected is actual
+
+    def it_does_not_hand_out_clients_for_other_users(self, pool, alice, bob):
+        client = pool.acquire(alice)
+        pool.release(client)
+
+        assert pool.acquire(bob) is not client
+        assert pool.acquire(None) is not client
+
+    def it_does_not_hand_out_clients_in_use(self, pool, alice):
+        assert pool.acquire(alice) is not pool.acquire(alice)
+
+    def it_force_authenticates_to_the_acquiring_user(self, pool, alice):
+        stale_alice = alice
+        client = pool.acquire(stale_alice)
+        pool.release(client)
+
+        fresh_alice = User(pk=alice.pk, username='alice')
+        client = pool.acquire(fresh_alice)
+
+        expected = fresh_alice
+        actual = client.handler._force_user
+        assert expected is actual
+
+    def it_resets_clients_between_uses(self, pool, alice):
+        client = pool.acquire(alice)
+        client.cookies['sessionid'] = 'abc'
+        client.credentials(HTTP_AUTHORIZATION='Token abc')
+        client.defaults['HTTP_X_CUSTOM'] = 'custom'
+        client.custom_attribute = 'custom'
+        pool.release(client)
+
+        client = pool.acquire(None)
+        pool.release(client)
+        client = pool.acquire(alice)
+
+        expected = ({}, {}, {}, False, alice)
+        actual = (
+            dict(client.cookies),
+            client._credentials,
+            client.defaults,
+            hasattr(client, 'custom_attribute'),
+            client.handler._force_user,
+        )
+        assert expected == actual
+
+    def it_shares_the_middleware_chain_between_clients(self, pool, alice, bob):
+        alice_client = pool.acquire(alice)
+        bob_client = pool.acquire(bob)
+
+        expected = alice_client.handler._middleware_chain
+        actual = bob_client.handler._middleware_chain
+        assert expected is not None
+        assert expected is actual
+
+    def it_loads_the_middleware_anew_when_changed(self, pool, alice):
+        client = pool.acquire(alice)
+
+        with override_settings(MIDDLEWARE=[]):
+            assert client.handler._middleware_chain is None
+
+            other_client = pool.acquire(alice)
+            assert other_client.handler._middleware_chain is not None
+
+    def it_serves_requests_with_shared_middleware(self, pool, alice, bob):
+        pool.acquire(alice)
+        client = pool.acquire(bob)
+
+        response = client.get(url_for('authentication-user-info'))
+
+        expected = 'bob'
+        actual = response.json()['username']
+        assert expected == actual
+
+
+    class ContextWithAuthenticate:
+        authenticated_users = lambda_fixture(lambda: [])
+
+        @lambda_fixture
+        def pool(authenticated_users):
+            def authenticate(client, user):
+                authenticated_users.append(user.username)
+                client.credentials(HTTP_AUTHORIZATION=f'Token {user.username}')
+                client.cookies['sessionid'] = user.username
+
+            return DRFTestClientPool(authenticate=authenticate)
+
+        def it_caches_credentials_per_user(self, pool, authenticated_users, alice, bob):
+            pool.acquire(alice)
+            pool.acquire(alice)
+            pool.acquire(bob)
+
+            expected = ['alice', 'bob']
+            actual = authenticated_users
+            assert expected == actual
+
+        def it_restores_cached_credentials_and_cookies(self, pool, alice):
+            pool.release(pool.acquire(alice))
+            client = pool.acquire(alice)
+
+            expected = ({'HTTP_AUTHORIZATION': 'Token alice'}, 'alice', None)
+            actual = (client._credentials, client.cookies['sessionid'].value, client.handler._force_user)
+            assert expected == actual
+
+        def it_forgets_cached_credentials_when_cleared(self, pool, authenticated_users, alice):
+            pool.acquire(alice)
+            pool.clear()
+            pool.acquire(alice)
+
+            expected = ['alice', 'alice']
+            actual = authenticated_users
+            assert expected == actual
+
+        def it_authenticates_anew_after_forgetting_credentials(self, pool, authenticated_users, alice):
+            pool.release(pool.acquire(alice))
+            pool.forget_credentials()
+            pool.acquire(alice)
+
+            expected = ['alice', 'alice']
+            actual = authenticated_users
+            assert expected == actual
+
+        def it_keeps_shared_credentials_after_forgetting_credentials(self, pool, authenticated_users, alice):
+            pool.share_credentials(alice)
+            pool.forget_credentials()
+            client = pool.acquire(alice)
+
+            expected = (['alice'], {'HTTP_AUTHORIZATION': 'Token alice'})
+            actual = (authenticated_users, client._credentials)
+            assert expected == actual
+
+        def it_authenticates_anew_after_forgetting_shared_credentials(self, pool, authenticated_users, alice):
+            key = pool.share_credentials(alice)
+            pool.forget_shared_credentials(key)
+            pool.acquire(alice)
+
+            expected = ['alice', 'alice']
+            actual = authenticated_users
+            assert expected == actual
+
+
+    class ContextWithoutReuse:
+        pool = lambda_fixture(lambda: DRFTestClientPool(reuse=False))
+
+        def it_creates_a_new_client_for_every_acquire(self, pool, alice):
+            client = pool.acquire(alice)
+            pool.release(client)
+
+            assert pool.acquire(alice) is not client
+
+        def it_does_not_share_the_middleware_chain(self, pool, alice, bob):
+            alice_client = pool.acquire(alice)
+            bob_client = pool.acquire(bob)
+            alice_client.get(url_for('authentication-user-info'))
+            bob_client.get(url_for('authentication-user-info'))
+
+            assert alice_client.handler._middleware_chain is not bob_client.handler._middleware_chain
+
+
+class DescribeDRFClientPoolFixture:
+
+    def it_creates_a_new_client_for_every_test_by_default(self, drf_client_pool):
+        expected = False
+        actual = drf_client_pool.reuse
+        assert expected == actual
+
+
+class DescribeDRFDirectTestClient:
+
+    @pytest.fixture
+    def urlconf(self, monkeypatch):
+        module = ModuleType('direct_client_urls')
+        module.urlpatterns = [path('view', lambda request: HttpResponse(b'first'))]
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+
+        with override_settings(ROOT_URLCONF=module.__name__):
+            yield module
+
+    def it_resolves_urls_anew_after_url_caches_are_cleared(self, urlconf):
+        client = DRFDirectTestClient()
+        client.get('/view')
+
+        urlconf.urlpatterns = [path('view', lambda request: HttpResponse(b'second'))]
+        clear_url_caches()
+
+        expected = b'second'
+        actual = client.get('/view').content
+        assert expected == actual
+
+    def it_forgets_resolutions_when_the_urlconf_setting_changes(self, urlconf):
+        DRFDirectTestClient().get('/view')
+
+        with override_settings(ROOT_URLCONF='tests.testapp.urls'):
+            expected = 0
+            actual = _resolve.cache_info().currsize
+            assert expected == actual
@@ -0,0 +1,73 @@
+import pytest
+from pytest_lambda import lambda_fixture, static_fixture
+
+from pytest_drf import (
+    APIViewTest,
+    ConcurrentRequests,
+    Returns200,
+    UsesGetMethod,
+)
+from pytest_drf.util import url_for
+
+
+class DescribeConcurrentRequests(
+    APIViewTest,
+    UsesGetMethod,
+):
+    # NOTE: this view returns the response status passed in the URL
+    url = lambda_fixture(
+        lambda status_code:
+            url_for('status-code', code=status_code))
+
+    status_code = static_fixture(200)
+
+
+    class CaseExpectedStatus(
+        Returns200,
+        ConcurrentRequests(20, workers=4),
+    ):
+        def it_records_each_request(self, concurrent_results):
+            expected = [200] * 20
+            actual = concurrent_results.statuses
+            assert expected == actual
+
+        def it_records_throughput(self, concurrent_results):
+            assert concurrent_results.throughput > 0
+
+
+    class CaseUnexpectedStatus(
+        ConcurrentRequests(5, workers=2),
+    ):
+        status_code = static_fixture(429)
+
+        # Disable the test, because we expect a failure
+        test_it_handles_5_concurrent_requests = None
+
+        def it_reports_unexpected_statuses(self, concurrent_results, concurrent_expected_statuses):
+            expected = {429: 5}
+            actual = concurrent_results.get_unexpected_statuses(concurrent_expected_statuses)
+            assert expected == actual
+
+
+    class CaseTimedOut(
+        ConcurrentRequests(2, workers=2),
+    ):
+        # NOTE: this view sleeps for the delay passed in the URL before responding
+        url = lambda_fixture(
+            lambda status_code:
+                url_for('status-code-delayed', code=status_code, delay_ms=500))
+
+        concurrent_request_timeout = static_fixture(0.05)
+
+        # Disable the test, because we expect a failure
+        test_it_handles_2_concurrent_requests = None
+
+        def it_records_timed_out_requests(self, concurrent_results):
+            expected = (2, [None, None])
+            actual = (concurrent_results.timeouts, concurrent_results.statuses)
+            assert expected == actual
+
+        def it_fails(self, concurrent_results, concurrent_expected_statuses, concurrent_request_timeout):
+            with pytest.raises(AssertionError, match='2 of 2 concurrent requests timed out'):
+                ConcurrentRequests.test_it_handles_concurrent_requests(
+                    self, concurrent_results, concurrent_expected_statuses, concurrent_request_timeout)
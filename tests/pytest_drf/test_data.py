@@ -0,0 +1,62 @@
+from pytest_drf import class_fixture, describe_fixture
+
+
+class DescribeClassFixture:
+
+    def it_shares_saved_rows_between_tests_of_a_class(self, run_with_shared_db):
+        result = run_with_shared_db('''
+            from pytest_drf import class_fixture
+
+            from tests.testapp.models import KeyValue
+
+            def get_key_values():
+                return list(KeyValue.objects.order_by('key').values_list('key', 'value'))
+
+            class DescribeRequested:
+                key_value = class_fixture(lambda: KeyValue.objects.create(key='alpha', value='beta'))
+
+                def it_creates_the_row(self, key_value):
+                    key_value.value = 'changed'
+                    key_value.save()
+                    KeyValue.objects.create(key='gamma', value='delta')
+
+                    expected = [('alpha', 'changed'), ('gamma', 'delta')]
+                    actual = get_key_values()
+                    assert expected == actual
+
+                def it_rolls_back_the_changes_of_earlier_tests(self, key_value):
+                    expected = ([('alpha', 'beta')], 'beta')
+                    actual = (get_key_values(), key_value.value)
+                    assert expected == actual
+
+            class DescribeAutouse:
+                autoused = class_fixture(
+                    lambda: KeyValue.objects.create(key='epsilon', value='zeta'),
+                    autouse=True,
+                )
+
+                def it_creates_the_row_without_being_requested(self):
+                    KeyValue.objects.create(key='eta', value='theta')
+
+                    expected = [('epsilon', 'zeta'), ('eta', 'theta')]
+                    actual = get_key_values()
+                    assert expected == actual
+
+                def it_creates_the_row_only_once(self):
+                    expected = [('epsilon', 'zeta')]
+                    actual = get_key_values()
+                    assert expected == actual
+
+            class DescribeLaterClass:
+                def it_rolls_back_the_rows_after_each_class(self):
+                    expected = []
+                    actual = get_key_values()
+                    assert expected == actual
+        ''')
+        result.assert_outcomes(passed=5)
+
+
+class DescribeDescribeFixture:
+
+    def it_is_class_fixture(self):
+        assert describe_fixture is class_fixture
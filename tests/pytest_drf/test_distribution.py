@@ -0,0 +1,101 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pytest_drf.distribution import (
+    DURATIONS_CACHE_KEY,
+    ScopeDurations,
+    get_describe_scope,
+    order_by_cost,
+)
+
+
+class DescribeGetDescribeScope:
+
+    @pytest.mark.parametrize('nodeid,expected', [
+        pytest.param('tests/test_views.py::test_url_for', 'tests/test_views.py', id='function'),
+        pytest.param('tests/test_views.py::DescribeList::it_returns_200', 'tests/test_views.py::DescribeList', id='method'),
+        pytest.param('tests/test_views.py::DescribeList::ContextEmpty::it_returns_200', 'tests/test_views.py::DescribeList', id='nested'),
+        pytest.param('tests/test_views.py::DescribeList::it_returns[a::b]', 'tests/test_views.py::DescribeList', id='parametrized'),
+    ])
+    def it_returns_top_level_class(self, nodeid, expected):
+        actual = get_describe_scope(nodeid)
+        assert expected == actual
+
+
+class DescribeOrderByCost:
+
+    def it_orders_scopes_by_recorded_duration(self):
+        workqueue = {
+            'test_a.py::DescribeA': {'test_a.py::DescribeA::it_a': False},
+            'test_b.py::DescribeB': {'test_b.py::DescribeB::it_b': False},
+            'test_c.py::DescribeC': {'test_c.py::DescribeC::it_c': False},
+        }
+        durations = {
+            'test_a.py::DescribeA': {'duration': 1.0, 'tests': 1},
+            'test_b.py::DescribeB': {'duration': 9.0, 'tests': 1},
+            'test_c.py::DescribeC': {'duration': 5.0, 'tests': 1},
+        }
+
+        expected = ['test_b.py::DescribeB', 'test_c.py::DescribeC', 'test_a.py::DescribeA']
+        actual = list(order_by_cost(workqueue, durations))
+        assert expected == actual
+
+    def it_estimates_unrecorded_scopes_by_number_of_tests(self):
+        workqueue = {
+            'test_a.py::DescribeA': {'test_a.py::DescribeA::it_a': False},
+            'test_new.py::DescribeNew': {f'test_new.py::DescribeNew::it_{i}': False for i in range(3)},
+        }
+        durations = {
+            'test_a.py::DescribeA': {'duration': 2.0, 'tests': 1},
+        }
+
+        expected = ['test_new.py::DescribeNew', 'test_a.py::DescribeA']
+        actual = list(order_by_cost(workqueue, durations))
+        assert expected == actual
+
+    def it_orders_by_number_of_tests_without_durations(self):
+        workqueue = {
+            'test_a.py::DescribeA': {'test_a.py::DescribeA::it_a': False},
+            'test_b.py::DescribeB': {f'test_b.py::DescribeB::it_{i}': False for i in range(2)},
+        }
+
+        expected = ['test_b.py::DescribeB', 'test_a.py::DescribeA']
+        actual = list(order_by_cost(workqueue, {}))
+        assert expected == actual
+
+
+class DictCache(dict):
+    # Stands in for pytest's config.cache
+    def set(self, key, value):
+        self[key] = value
+
+
+class DescribeScopeDurations:
+
+    def it_records_durations_and_tests_by_scope(self):
+        cache = DictCache()
+        recorder = ScopeDurations(cache)
+
+        for nodeid in ('test_a.py::DescribeA::it_a', 'test_a.py::DescribeA::ContextB::it_b'):
+            for when in ('setup', 'call', 'teardown'):
+                recorder.pytest_runtest_logreport(SimpleNamespace(nodeid=nodeid, when=when, duration=0.5))
+        recorder.pytest_sessionfinish(session=None)
+
+        expected = {'test_a.py::DescribeA': {'duration': 3.0, 'tests': 2}}
+        actual = cache[DURATIONS_CACHE_KEY]
+        assert expected == actual
+
+    def it_keeps_durations_of_scopes_not_run(self):
+        cache = DictCache({DURATIONS_CACHE_KEY: {'test_old.py::DescribeOld': {'duration': 1.0, 'tests': 1}}})
+        recorder = ScopeDurations(cache)
+
+        recorder.pytest_runtest_logreport(SimpleNamespace(nodeid='test_a.py::test_a', when='setup', duration=0.5))
+        recorder.pytest_sessionfinish(session=None)
+
+        expected = {
+            'test_old.py::DescribeOld': {'duration': 1.0, 'tests': 1},
+            'test_a.py': {'duration': 0.5, 'tests': 1},
+        }
+        actual = cache[DURATIONS_CACHE_KEY]
+        assert expected == actual
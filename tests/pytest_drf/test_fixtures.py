@@ -0,0 +1,42 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from pytest_drf import class_fixture
+from pytest_drf.fixtures import _held_db_transaction
+
+
+class DescribeHeldDBTransaction:
+
+    def it_rolls_back_rows_created_while_held(self, request):
+        connection = transaction.get_connection()
+        held_transaction = _held_db_transaction(request)
+
+        next(held_transaction)
+        User.objects.create(username='alice')
+        in_atomic_block_while_held = connection.in_atomic_block
+        num_users_while_held = User.objects.count()
+
+        with pytest.raises(StopIteration):
+            next(held_transaction)
+
+        expected = (True, 1, False, 0)
+        actual = (
+            in_atomic_block_while_held,
+            num_users_while_held,
+            connection.in_atomic_block,
+            User.objects.count(),
+        )
+        assert expected == actual
+
+
+shared_user = class_fixture(lambda: User(username='shared'))
+
+
+class DescribeSharedDBFixtureSavepoint:
+
+    def it_is_used_by_tests_requesting_shared_db_fixtures(self, request, shared_user):
+        assert 'shared_db_fixture_savepoint' in request.fixturenames
+
+    def it_is_not_used_by_other_tests(self, request):
+        assert 'shared_db_fixture_savepoint' not in request.fixturenames
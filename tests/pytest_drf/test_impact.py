@@ -0,0 +1,124 @@
+import json
+import subprocess
+
+import pytest
+from pytest_lambda import lambda_fixture
+
+from pytest_drf.impact import ImpactIndex, get_changed_files, get_endpoint_dependencies
+from pytest_drf.util import url_for
+
+rootdir = lambda_fixture(lambda request: str(request.config.rootdir))
+
+
+class DescribeGetEndpointDependencies:
+
+    def it_includes_view_serializer_and_model(self, rootdir):
+        expected = {
+            'tests/testapp/models.py',
+            'tests/testapp/views/views.py',
+        }
+        actual = get_endpoint_dependencies(url_for('views-key-values-list'), rootdir)
+        assert expected == actual
+
+    def it_includes_view_base_classes(self, rootdir):
+        expected = {
+            'tests/testapp/models.py',
+            'tests/testapp/views/authorization.py',
+            'tests/testapp/views/views.py',
+        }
+        actual = get_endpoint_dependencies(url_for('authorization-key-values-list'), rootdir)
+        assert expected == actual
+
+    def it_includes_function_views(self, rootdir):
+        expected = {'tests/testapp/views/authentication.py'}
+        actual = get_endpoint_dependencies(url_for('authentication-user-info'), rootdir)
+        assert expected == actual
+
+    def it_ignores_query_strings(self, rootdir):
+        expected = {'tests/testapp/views/views.py'}
+        actual = get_endpoint_dependencies(url_for('views-query-params') + '?a=b', rootdir)
+        assert expected == actual
+
+    def it_returns_nothing_for_unknown_urls(self, rootdir):
+        expected = set()
+        actual = get_endpoint_dependencies('/does/not/exist', rootdir)
+        assert expected == actual
+
+
+class DescribeImpactIndex:
+
+    @lambda_fixture
+    def impact_index(tmp_path):
+        path = tmp_path / 'impact.json'
+        path.write_text(json.dumps({
+            'tests/test_a.py::DescribeA::it_a': ['app/views_a.py', 'app/models.py'],
+            'tests/test_b.py::DescribeB::it_b': ['app/views_b.py', 'app/models.py'],
+        }))
+        return ImpactIndex(str(path), str(tmp_path))
+
+    @pytest.mark.parametrize('changed_files,expected', [
+        pytest.param({'app/views_a.py'}, {'tests/test_a.py::DescribeA::it_a', 'tests/test_new.py::test_new'}, id='one-view'),
+        pytest.param({'app/models.py'}, {'tests/test_a.py::DescribeA::it_a', 'tests/test_b.py::DescribeB::it_b', 'tests/test_new.py::test_new'}, id='shared-model'),
+        pytest.param({'tests/test_b.py'}, {'tests/test_b.py::DescribeB::it_b', 'tests/test_new.py::test_new'}, id='test-file'),
+        pytest.param({'README.md'}, {'tests/test_new.py::test_new'}, id='unrelated'),
+    ])
+    def it_selects_affected_and_unknown_tests(self, impact_index, changed_files, expected):
+        nodeids = [
+            'tests/test_a.py::DescribeA::it_a',
+            'tests/test_b.py::DescribeB::it_b',
+            'tests/test_new.py::test_new',
+        ]
+
+        actual = {nodeid for nodeid in nodeids if impact_index.is_affected(nodeid, changed_files)}
+        assert expected == actual
+
+    def it_reports_changed_files_of_unknown_impact(self, impact_index):
+        changed_files = {'app/views_a.py', 'app/settings.py', 'app/templates/list.html', 'tests/test_a.py'}
+
+        expected = {'app/settings.py', 'app/templates/list.html'}
+        actual = impact_index.get_unknown_files(changed_files, {'tests/test_a.py'})
+        assert expected == actual
+
+    def it_does_not_report_ignored_files(self, impact_index):
+        impact_index.ignored_patterns = ('*.md', 'docs/*')
+        changed_files = {'app/settings.py', 'README.md', 'docs/usage.rst'}
+
+        expected = {'app/settings.py'}
+        actual = impact_index.get_unknown_files(changed_files, {'tests/test_a.py'})
+        assert expected == actual
+
+
+class DescribeGetChangedFiles:
+
+    @lambda_fixture
+    def repo(tmp_path):
+        def git(*args):
+            subprocess.run(
+                ('git', '-c', 'user.name=test', '-c', 'user.email=test@te.st', *args),
+                cwd=tmp_path,
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+
+        git('init')
+        (tmp_path / 'app').mkdir()
+        (tmp_path / 'app' / 'views.py').write_text('')
+        (tmp_path / 'app' / 'models.py').write_text('')
+        git('add', '.')
+        git('commit', '-m', 'Initial commit')
+        return tmp_path
+
+    def it_returns_modified_and_untracked_files(self, repo):
+        (repo / 'app' / 'views.py').write_text('changed = True\n')
+        (repo / 'app' / 'serializers.py').write_text('')
+
+        expected = {'app/views.py', 'app/serializers.py'}
+        actual = get_changed_files('HEAD', str(repo))
+        assert expected == actual
+
+    def it_returns_paths_relative_to_rootdir(self, repo):
+        (repo / 'app' / 'views.py').write_text('changed = True\n')
+
+        expected = {'views.py'}
+        actual = get_changed_files('HEAD', str(repo / 'app'))
+        assert expected == actual
@@ -0,0 +1,141 @@
+from pytest_common_subject import precondition_fixture
+from pytest_lambda import lambda_fixture
+
+from pytest_drf import (
+    APIViewTest,
+    MatchesOpenAPISchema,
+    OpenAPIValidator,
+    UsesDetailEndpoint,
+    UsesGetMethod,
+    UsesListEndpoint,
+    ViewSetTest,
+)
+from pytest_drf.openapi import needs_openapi_test
+from pytest_drf.util import url_for
+
+from tests.testapp.models import KeyValue
+
+
+class DescribeKeyValueViewSet(ViewSetTest):
+    list_url = lambda_fixture(
+        lambda:
+            url_for('views-key-values-list'))
+
+    detail_url = lambda_fixture(
+        lambda key_value:
+            url_for('views-key-values-detail', pk=key_value.pk))
+
+    key_value = precondition_fixture(
+        lambda:
+            KeyValue.objects.create(
+                key='monty',
+                value='jython',
+            ))
+
+
+    class DescribeList(
+        UsesGetMethod,
+        UsesListEndpoint,
+
+        MatchesOpenAPISchema,
+    ):
+        pass
+
+
+    class DescribeRetrieve(
+        UsesGetMethod,
+        UsesDetailEndpoint,
+
+        MatchesOpenAPISchema,
+    ):
+        def it_caches_compiled_validator(self, response, openapi_validator):
+            expected = openapi_validator.get_validator('/views/key-values/{id}/', 'GET', 200)
+            actual = openapi_validator.get_validator('/views/key-values/{id}/', 'get', 200)
+            assert expected is actual
+
+
+        class ContextSchemaDrift:
+            # Here, the schema claims a KeyValue's value is an integer
+            openapi_validator = lambda_fixture(
+                lambda openapi_schema:
+                    OpenAPIValidator({
+                        **openapi_schema,
+                        'components': {
+                            'schemas': {
+                                'KeyValue': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'id': {'type': 'integer'},
+                                        'key': {'type': 'string'},
+                                        'value': {'type': 'integer', 'nullable': True},
+                                    },
+                                },
+                            },
+                        },
+                    }))
+
+            # Disable the mixin's test, which is expected to fail
+            test_it_matches_openapi_schema = None
+
+            def it_reports_drift(self, response, openapi_validator):
+                expected = ["$.value: 'jython' is not of type 'integer', 'null'"]
+                actual = openapi_validator.get_errors(response)
+                assert expected == actual
+
+
+class DescribeNeedsOpenapiTest:
+    is_test_name = staticmethod(lambda name: name.startswith('it_'))
+
+    def it_includes_view_test_contexts_declaring_tests(self):
+        class Context(APIViewTest):
+            def it_works(self):
+                pass
+
+        expected = True
+        actual = needs_openapi_test(Context, [], self.is_test_name)
+        assert expected == actual
+
+    def it_includes_contexts_nested_within_view_tests(self):
+        class Context:
+            def it_works(self):
+                pass
+
+        expected = True
+        actual = needs_openapi_test(Context, [APIViewTest], self.is_test_name)
+        assert expected == actual
+
+    def it_excludes_contexts_without_tests(self):
+        class Context(APIViewTest):
+            class ContextNested:
+                pass
+
+        expected = False
+        actual = needs_openapi_test(Context, [], self.is_test_name)
+        assert expected == actual
+
+    def it_excludes_contexts_outside_view_tests(self):
+        class Context:
+            def it_works(self):
+                pass
+
+        expected = False
+        actual = needs_openapi_test(Context, [], self.is_test_name)
+        assert expected == actual
+
+    def it_excludes_contexts_already_including_or_disabling_the_test(self):
+        class ContextIncluded(APIViewTest, MatchesOpenAPISchema):
+            def it_works(self):
+                pass
+
+        class ContextDisabled(APIViewTest):
+            test_it_matches_openapi_schema = None
+
+            def it_works(self):
+                pass
+
+        expected = (False, False)
+        actual = (
+            needs_openapi_test(ContextIncluded, [], self.is_test_name),
+            needs_openapi_test(ContextDisabled, [], self.is_test_name),
+        )
+        assert expected == actual
@@ -1,14 +1,37 @@
-from pytest_lambda import lambda_fixture
+import pytest
+from pytest_assert_utils import util
+from pytest_common_subject import precondition_fixture
+from pytest_lambda import lambda_fixture, static_fixture
 
 from pytest_drf import (
     APIViewTest,
+    AsyncAPIViewTest,
     ReturnsCursorPagination,
     ReturnsLimitOffsetPagination,
     ReturnsPageNumberPagination,
     UsesGetMethod,
+    WalksAllPages,
 )
+from pytest_drf.async_client import DRFAsyncTestClient
+from pytest_drf.pagination import _find_misordered_item
 from pytest_drf.util import url_for
 
+from tests.testapp.models import KeyValue
+
+
+class DescribeFindMisorderedItem:
+
+    @pytest.mark.parametrize('values,ordering,nulls_largest,expected', [
+        pytest.param([1, 2, None], ('value',), True, None, id='nulls-last'),
+        pytest.param([None, 1, 2], ('value',), False, None, id='nulls-first'),
+        pytest.param([None, 1, 2], ('value',), True, 1, id='nulls-first-misordered'),
+        pytest.param([None, 2, 1], ('-value',), True, None, id='descending-nulls-first'),
+    ])
+    def it_orders_nulls_as_the_db_does(self, values, ordering, nulls_largest, expected):
+        items = [{'value': value} for value in values]
+        actual = _find_misordered_item(items, ordering, nulls_largest)
+        assert expected == actual
+
 
 class DescibePageNumberPaginationView(
     APIViewTest,
@@ -35,3 +58,144 @@ class DescibeCursorPaginationView(
     ReturnsCursorPagination,
 ):
     url = lambda_fixture(lambda: url_for('pagination-cursor'))
+
+
+class KeyValuePagesTests(
+    APIViewTest,
+    UsesGetMethod,
+
+    WalksAllPages,
+):
+    # NOTE: each of the pagination views returns 2 items per page
+    key_values = precondition_fixture(
+        lambda: (
+            KeyValue.objects.create_batch(
+                alpha='beta',
+                delta='gamma',
+                epsilon='zeta',
+                eta='theta',
+                iota='kappa',
+            )
+        ),
+    )
+
+    def it_returns_all_items(self, key_values, pagination_walk):
+        expected = [key_value.key for key_value in key_values]
+        actual = [item['key'] for item in pagination_walk.results]
+        assert expected == actual
+
+    def it_times_each_page(self, pagination_walk):
+        expected = [util.Any(float)] * 3
+        actual = [page.duration for page in pagination_walk.pages]
+        assert expected == actual
+
+
+class FailingPagesTests(
+    APIViewTest,
+    UsesGetMethod,
+
+    WalksAllPages,
+):
+    key_values = KeyValuePagesTests.key_values
+
+    # Disable the mixin's test, which these views are expected to fail
+    test_it_returns_each_item_once_across_pages = None
+
+    def it_fails(self, pagination_walk, pagination_item_key, pagination_ordering, pagination_expected_count):
+        with pytest.raises(AssertionError):
+            WalksAllPages.test_it_returns_each_item_once_across_pages(
+                self, pagination_walk, pagination_item_key, pagination_ordering, pagination_expected_count)
+
+
+class DescribeWalksAllPages:
+
+    class DescribePageNumberPagination(
+        KeyValuePagesTests,
+        ReturnsPageNumberPagination,
+    ):
+        url = lambda_fixture(lambda: url_for('pagination-page-number'))
+
+
+    class DescribeLimitOffsetPagination(
+        KeyValuePagesTests,
+        ReturnsLimitOffsetPagination,
+    ):
+        url = lambda_fixture(lambda: url_for('pagination-limit-offset'))
+
+
+    class DescribeCursorPagination(
+        KeyValuePagesTests,
+        ReturnsCursorPagination,
+    ):
+        url = lambda_fixture(lambda: url_for('pagination-cursor'))
+
+        def it_checks_the_cursor_ordering(self, pagination_ordering):
+            expected = ('id',)
+            actual = pagination_ordering
+            assert expected == actual
+
+
+    class DescribePaginationWithoutCount:
+
+        class ContextOrdered(
+            KeyValuePagesTests,
+        ):
+            url = lambda_fixture(lambda: url_for('pagination-next-link'))
+            pagination_ordering = static_fixture(('id',))
+
+            def it_expects_every_row_of_the_queryset(self, pagination_expected_count):
+                expected = 5
+                actual = pagination_expected_count
+                assert expected == actual
+
+        class ContextMisordered(
+            FailingPagesTests,
+        ):
+            url = lambda_fixture(lambda: url_for('pagination-next-link'))
+            pagination_ordering = static_fixture(('-id',))
+
+        class ContextUnknownTotal(
+            FailingPagesTests,
+        ):
+            url = lambda_fixture(lambda: url_for('pagination-next-link'))
+            pagination_expected_count = static_fixture(None)
+
+
+    class DescribeFaultyPagination:
+
+        class ContextDuplicatesWithCount(
+            FailingPagesTests,
+        ):
+            url = lambda_fixture(lambda: url_for('pagination-faulty', step=1, with_count=1))
+
+        class ContextDuplicatesWithoutCount(
+            FailingPagesTests,
+        ):
+            url = lambda_fixture(lambda: url_for('pagination-faulty', step=1, with_count=0))
+
+        class ContextSkipsWithCount(
+            FailingPagesTests,
+        ):
+            url = lambda_fixture(lambda: url_for('pagination-faulty', step=3, with_count=1))
+
+        class ContextSkipsWithoutCount(
+            FailingPagesTests,
+        ):
+            url = lambda_fixture(lambda: url_for('pagination-faulty', step=3, with_count=0))
+            pagination_ordering = static_fixture(('id',))
+
+            def it_returns_items_in_order(self, pagination_walk):
+                expected = sorted(item['id'] for item in pagination_walk.results)
+                actual = [item['id'] for item in pagination_walk.results]
+                assert expected == actual
+
+
+    class DescribeAsyncAPIViewTest(
+        KeyValuePagesTests,
+        AsyncAPIViewTest,
+        ReturnsPageNumberPagination,
+    ):
+        url = lambda_fixture(lambda: url_for('pagination-page-number'))
+
+        def it_walks_pages_with_the_async_client(self, client):
+            assert isinstance(client, DRFAsyncTestClient)
@@ -0,0 +1,106 @@
+from types import SimpleNamespace
+
+import pytest
+from pytest_common_subject import precondition_fixture
+from pytest_lambda import lambda_fixture
+
+from pytest_drf import APIViewTest, UsesGetMethod
+from pytest_drf.plugin import pytest_sessionfinish, pytest_testnodedown
+from pytest_drf.profiling import EndpointProfile, EndpointProfiler
+from pytest_drf.util import url_for
+
+from tests.testapp.models import KeyValue
+
+
+class DescribeEndpointProfiler(
+    APIViewTest,
+    UsesGetMethod,
+):
+    # NOTE: this view returns all KeyValue rows using a single query
+    url = lambda_fixture(lambda: url_for('queries-key-values'))
+
+    key_values = precondition_fixture(
+        lambda: (
+            KeyValue.objects.create_batch(
+                alpha='beta',
+                delta='gamma',
+            )
+        ),
+    )
+
+    @pytest.fixture(autouse=True)
+    def profiler(self):
+        # NOTE: --drf-profile may already have activated a profiler for the
+        #       whole session, so we take care to put it back afterward.
+        session_profiler = EndpointProfiler.active
+        EndpointProfiler.active = profiler = EndpointProfiler()
+        try:
+            yield profiler
+        finally:
+            EndpointProfiler.active = session_profiler
+
+    # NOTE: the response is requested, to ensure the request is made before
+    #       looking up the endpoint's profile
+    profile = lambda_fixture(
+        lambda profiler, response:
+            profiler.profiles[('queries-key-values', 'GET')])
+
+
+    def it_records_request_under_url_name_and_method(self, profiler):
+        expected = [('queries-key-values', 'GET')]
+        actual = list(profiler.profiles)
+        assert expected == actual
+
+    def it_records_num_requests(self, profile):
+        expected = 1
+        actual = profile.requests
+        assert expected == actual
+
+    def it_records_num_queries(self, profile):
+        expected = 1
+        actual = profile.total_queries
+        assert expected == actual
+
+    def it_records_response_size(self, profile, response):
+        expected = len(response.content)
+        actual = profile.total_size
+        assert expected == actual
+
+    def it_records_wall_time(self, profile):
+        assert profile.total_time > 0
+
+
+class DescribeXdistProfiles:
+
+    @pytest.fixture
+    def profiler(self):
+        session_profiler = EndpointProfiler.active
+        EndpointProfiler.active = profiler = EndpointProfiler()
+        try:
+            yield profiler
+        finally:
+            EndpointProfiler.active = session_profiler
+
+    def it_merges_worker_profiles_into_the_controller(self, profiler):
+        worker_profile = EndpointProfile('queries-key-values', 'GET')
+        worker_profile.add(duration=2.0, num_queries=1, db_time=0.5, size=10)
+        profiler.profiles[('queries-key-values', 'GET')] = worker_profile
+
+        worker_config = SimpleNamespace(workeroutput={})
+        pytest_sessionfinish(SimpleNamespace(config=worker_config))
+
+        controller_profile = EndpointProfile('queries-key-values', 'GET')
+        controller_profile.add(duration=1.0, num_queries=3, db_time=0.5, size=20)
+        profiler.profiles = {('queries-key-values', 'GET'): controller_profile}
+
+        pytest_testnodedown(SimpleNamespace(workeroutput=worker_config.workeroutput), None)
+
+        expected = (2, 3.0, 2.0, 4, 30)
+        actual = (
+            controller_profile.requests,
+            controller_profile.total_time,
+            controller_profile.max_time,
+            controller_profile.total_queries,
+            controller_profile.total_size,
+        )
+        assert expected == actual
@@ -0,0 +1,116 @@
+import pytest
+from pytest_common_subject import precondition_fixture
+from pytest_lambda import lambda_fixture
+
+from pytest_drf import (
+    APIViewTest,
+    CapturesRequestQueries,
+    ExecutesAtMostQueries,
+    ExecutesConstantQueries,
+    RequestsOnce,
+    UsesGetMethod,
+)
+from pytest_drf.util import url_for
+
+from tests.testapp.models import KeyValue
+
+
+class DescribeKeyValues(
+    APIViewTest,
+    UsesGetMethod,
+
+    ExecutesAtMostQueries(1),
+    ExecutesConstantQueries,
+):
+    # NOTE: this view returns all KeyValue rows using a single query
+    url = lambda_fixture(lambda: url_for('queries-key-values'))
+
+    key_values = precondition_fixture(
+        lambda: (
+            KeyValue.objects.create_batch(
+                alpha='beta',
+                delta='gamma',
+            )
+        ),
+    )
+
+    create_data_set = lambda_fixture(lambda: (
+        lambda size: [
+            KeyValue.objects.create(key=f'key-{i}', value=f'value-{i}')
+            for i in range(size)
+        ]
+    ))
+
+
+class DescribeKeyValuesOneByOne(
+    APIViewTest,
+    UsesGetMethod,
+
+    CapturesRequestQueries,
+):
+    # NOTE: this view executes one query to list all KeyValue IDs, then one
+    #       query per row to retrieve its key and value
+    url = lambda_fixture(lambda: url_for('queries-key-values-one-by-one'))
+
+    key_values = precondition_fixture(
+        lambda: (
+            KeyValue.objects.create_batch(
+                alpha='beta',
+                delta='gamma',
+                epsilon='zeta',
+            )
+        ),
+    )
+
+
+    def it_captures_only_request_queries(self, key_values, request_queries):
+        expected = 1 + len(key_values)
+        actual = len(request_queries)
+        assert expected == actual
+
+    def it_captures_query_sql(self, request_queries):
+        expected = ['SELECT'] * len(request_queries)
+        actual = [query.sql.split()[0] for query in request_queries]
+        assert expected == actual
+
+
+    class ContextQueryBudget(
+        ExecutesAtMostQueries(1),
+    ):
+        # Disable the mixin's test, which this view is expected to fail
+        test_it_executes_at_most_1_queries = None
+
+        def it_fails_query_budget(self, request_queries, max_queries):
+            with pytest.raises(AssertionError):
+                ExecutesAtMostQueries.test_it_executes_at_most_max_queries(self, request_queries, max_queries)
+
+
+    class ContextConstantQueries(
+        ExecutesConstantQueries,
+    ):
+        create_data_set = lambda_fixture(lambda: (
+            lambda size: [
+                KeyValue.objects.create(key=f'key-{i}', value=f'value-{i}')
+                for i in range(size)
+            ]
+        ))
+
+        # Disable the mixin's test, which this view is expected to fail
+        test_it_executes_constant_queries = None
+
+        def it_fails_constant_queries(self, call_common_subject, create_data_set, data_set_sizes):
+            with pytest.raises(AssertionError):
+                ExecutesConstantQueries.test_it_executes_constant_queries(
+                    self, call_common_subject, create_data_set, data_set_sizes)
+
+
+    class ContextRequestsOnce(
+        RequestsOnce,
+    ):
+        def it_makes_request_without_using_queries(self, response):
+            pass
+
+        def it_shares_queries_with_later_tests(self, key_values, request_queries):
+            expected = 1 + len(key_values)
+            actual = len(request_queries)
+            assert expected == actual
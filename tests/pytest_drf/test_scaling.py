@@ -0,0 +1,123 @@
+import pytest
+from pytest_lambda import lambda_fixture, static_fixture
+
+from pytest_drf import (
+    APIViewTest,
+    ScalesLinearlyAtMost,
+    ScalingMeasurement,
+    UsesGetMethod,
+    fit_scaling_exponent,
+)
+from pytest_drf.util import url_for
+
+from tests.testapp.models import KeyValue
+
+
+create_key_values = lambda_fixture(lambda: (
+    lambda size: KeyValue.objects.bulk_create([
+        KeyValue(key=f'key-{i}', value=f'value-{i}')
+        for i in range(size)
+    ])
+))
+
+
+class DescribeKeyValues(
+    APIViewTest,
+    UsesGetMethod,
+
+    ScalesLinearlyAtMost,
+):
+    # NOTE: this view returns all KeyValue rows using a single query
+    url = lambda_fixture(lambda: url_for('queries-key-values'))
+
+    create_data_set = create_key_values
+
+
+    class ContextNoisyLatency(
+        ScalesLinearlyAtMost,
+    ):
+        # The first measurements grow quadratically, the retaken ones linearly
+        @pytest.fixture(scope='class')
+        def measure_scaling(self):
+            attempts = iter([
+                [ScalingMeasurement(size, 1e-6 * size ** 2, [[]]) for size in (10, 100, 1000)],
+                [ScalingMeasurement(size, 1e-3 * size, [[]]) for size in (10, 100, 1000)],
+            ])
+            return lambda: next(attempts)
+
+    class ContextTimerNoise(
+        ScalesLinearlyAtMost,
+    ):
+        # These durations grow quadratically, but all fall below the 1ms floor
+        measure_scaling = static_fixture(lambda: [
+            ScalingMeasurement(size, 1e-10 * size ** 2, [[]]) for size in (10, 100, 1000)
+        ])
+        scaling_attempts = static_fixture(1)
+
+    class ContextSharedMeasurements(
+        ScalesLinearlyAtMost,
+    ):
+        measure_calls = []
+
+        @pytest.fixture
+        def measure_scaling(self):
+            def measure_scaling():
+                self.measure_calls.append(1)
+                return [ScalingMeasurement(size, 1e-3 * size, [[]]) for size in (10, 100, 1000)]
+            return measure_scaling
+
+        def it_measures_once_per_class(self, scaling_measurements):
+            expected = 1
+            actual = len(self.measure_calls)
+            assert expected == actual
+
+
+class DescribeKeyValuesOneByOne(
+    APIViewTest,
+    UsesGetMethod,
+
+    ScalesLinearlyAtMost,
+):
+    # NOTE: this view executes one query to list all KeyValue IDs, then one
+    #       query per row to retrieve its key and value
+    url = lambda_fixture(lambda: url_for('queries-key-values-one-by-one'))
+
+    create_data_set = create_key_values
+    data_set_sizes = static_fixture((1, 5, 10))
+    scaling_rounds = static_fixture(2)
+
+    # Disable the mixin's tests, which this view is expected to fail
+    test_its_queries_do_not_grow_with_data = None
+    test_its_latency_scales_linearly_at_most = None
+
+    def it_measures_queries_growing_with_data(self, scaling_measurements):
+        expected = {1: 2, 5: 6, 10: 11}
+        actual = {m.size: len(m.queries) for m in scaling_measurements}
+        assert expected == actual
+
+    def it_keeps_queries_of_every_round(self, scaling_measurements):
+        expected = {1: [2, 2], 5: [6, 6], 10: [11, 11]}
+        actual = {m.size: [len(queries) for queries in m.round_queries] for m in scaling_measurements}
+        assert expected == actual
+
+
+class DescribeScalingMeasurement:
+
+    def it_reports_queries_of_the_round_executing_the_most(self):
+        measurement = ScalingMeasurement(10, 0.001, [['SELECT 1'], ['SELECT 1', 'SELECT 2'], []])
+
+        expected = ['SELECT 1', 'SELECT 2']
+        actual = measurement.queries
+        assert expected == actual
+
+
+class DescribeFitScalingExponent:
+
+    @pytest.mark.parametrize('exponent', [0, 1, 2])
+    def it_fits_power_law_exponent(self, exponent):
+        sizes = [10, 100, 1000]
+        durations = [0.001 * size ** exponent for size in sizes]
+
+        expected = exponent
+        actual = fit_scaling_exponent(sizes, durations)
+        assert expected == pytest.approx(actual)
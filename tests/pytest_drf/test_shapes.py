@@ -0,0 +1,65 @@
+from typing import Optional
+
+from pytest_common_subject import precondition_fixture
+from pytest_lambda import lambda_fixture
+
+from pytest_drf import (
+    ReturnsPageNumberPagination,
+    ReturnsResultsOfShape,
+    ReturnsShape,
+    UsesDetailEndpoint,
+    UsesGetMethod,
+    UsesListEndpoint,
+    ViewSetTest,
+)
+from pytest_drf.util import url_for
+
+from tests.testapp.models import KeyValue
+
+
+KEY_VALUE_SHAPE = {
+    'id': int,
+    'key': str,
+    'value': Optional[str],
+}
+
+
+class DescribeKeyValueViewSet(ViewSetTest):
+    list_url = lambda_fixture(
+        lambda:
+            url_for('views-key-values-list'))
+
+    detail_url = lambda_fixture(
+        lambda key_value:
+            url_for('views-key-values-detail', pk=key_value.pk))
+
+
+    class DescribeList(
+        UsesGetMethod,
+        UsesListEndpoint,
+
+        ReturnsPageNumberPagination,
+        ReturnsResultsOfShape(KEY_VALUE_SHAPE),
+    ):
+        key_values = precondition_fixture(
+            lambda: (
+                KeyValue.objects.create_batch(
+                    alpha='beta',
+                    delta='gamma',
+                )
+            ),
+        )
+
+
+    class DescribeRetrieve(
+        UsesGetMethod,
+        UsesDetailEndpoint,
+
+        ReturnsShape(KEY_VALUE_SHAPE),
+    ):
+        key_value = lambda_fixture(
+            lambda:
+                KeyValue.objects.create(
+                    key='monty',
+                    value='jython',
+                ))
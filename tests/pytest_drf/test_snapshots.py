@@ -0,0 +1,154 @@
+import pytest
+from pytest_common_subject import precondition_fixture
+from pytest_lambda import lambda_fixture
+
+from pytest_drf import MatchesSnapshot, SnapshotFile, SnapshotStore, UsesGetMethod, UsesListEndpoint, ViewSetTest
+from pytest_drf.snapshots import encode_snapshot, get_snapshot_path
+from pytest_drf.util import url_for
+
+from tests.testapp.models import KeyValue
+
+
+class DescribeGetSnapshotPath:
+
+    def it_stores_snapshots_beside_test_module(self):
+        expected = '/project/tests/__snapshots__/test_views.snap'
+        actual = get_snapshot_path('/project/tests/test_views.py')
+        assert expected == actual
+
+
+class DescribeSnapshotFile:
+    snapshot_path = lambda_fixture(lambda tmp_path: str(tmp_path / '__snapshots__' / 'test_module.snap'))
+
+    def it_returns_saved_snapshots(self, snapshot_path):
+        SnapshotFile(snapshot_path).save({
+            'DescribeA::it_a': encode_snapshot({'alpha': 'beta'}),
+            'DescribeB::it_b': encode_snapshot([1, 2, 3]),
+        })
+        snapshot_file = SnapshotFile(snapshot_path)
+
+        expected = ({'alpha': 'beta'}, [1, 2, 3], None)
+        actual = (
+            snapshot_file.get('DescribeA::it_a'),
+            snapshot_file.get('DescribeB::it_b'),
+            snapshot_file.get_encoded('DescribeC::it_c'),
+        )
+        assert expected == actual
+
+    def it_keeps_snapshots_saved_by_other_sessions(self, snapshot_path):
+        snapshot_file = SnapshotFile(snapshot_path)
+        assert 'DescribeA::it_a' not in snapshot_file
+
+        SnapshotFile(snapshot_path).save({'DescribeA::it_a': encode_snapshot('a')})
+        snapshot_file.save({'DescribeB::it_b': encode_snapshot('b')})
+
+        expected = {'DescribeA::it_a': 'a', 'DescribeB::it_b': 'b'}
+        actual = {key: snapshot_file.get(key) for key in snapshot_file.index}
+        assert expected == actual
+
+    def it_rejects_other_files(self, tmp_path):
+        path = tmp_path / 'test_module.snap'
+        path.write_bytes(b'{"not": "a snapshot file"}')
+
+        with pytest.raises(ValueError):
+            SnapshotFile(str(path)).index
+
+
+class DescribeSnapshotStore:
+    snapshot_path = lambda_fixture(lambda tmp_path: str(tmp_path / 'test_module.snap'))
+
+    @lambda_fixture
+    def stored_snapshot(snapshot_path):
+        SnapshotFile(snapshot_path).save({'DescribeA::it_a': encode_snapshot({'alpha': ['beta']})})
+
+    def it_passes_matching_values(self, snapshot_path, stored_snapshot):
+        store = SnapshotStore()
+        store.assert_match(snapshot_path, 'DescribeA::it_a', {'alpha': ['beta']})
+        store.save()
+
+        expected = 0
+        actual = store.num_written
+        assert expected == actual
+
+    def it_fails_with_missing_snapshots(self, snapshot_path):
+        store = SnapshotStore()
+
+        with pytest.raises(AssertionError) as excinfo:
+            store.assert_match(snapshot_path, 'DescribeA::it_a', {'alpha': 'beta'})
+
+        assert '--drf-update-snapshots' in str(excinfo.value)
+
+    def it_records_missing_snapshots_when_updating(self, snapshot_path):
+        store = SnapshotStore(update=True)
+        store.assert_match(snapshot_path, 'DescribeA::it_a', {'alpha': 'beta'})
+        store.save()
+
+        expected = {'alpha': 'beta'}
+        actual = SnapshotFile(snapshot_path).get('DescribeA::it_a')
+        assert expected == actual
+
+    def it_fails_with_differences_by_path(self, snapshot_path, stored_snapshot):
+        store = SnapshotStore()
+
+        with pytest.raises(AssertionError) as excinfo:
+            store.assert_match(snapshot_path, 'DescribeA::it_a', {'alpha': ['gamma'], 'delta': 1})
+
+        message = str(excinfo.value)
+        assert "$.delta is unexpected (actual: 1)" in message
+        assert "$.alpha[0] expected: 'beta', actual: 'gamma'" in message
+
+    def it_overwrites_snapshots_when_updating(self, snapshot_path, stored_snapshot):
+        store = SnapshotStore(update=True)
+        store.assert_match(snapshot_path, 'DescribeA::it_a', {'alpha': ['gamma']})
+        store.save()
+
+        expected = {'alpha': ['gamma']}
+        actual = SnapshotFile(snapshot_path).get('DescribeA::it_a')
+        assert expected == actual
+
+    def it_removes_snapshots_of_uncollected_tests_when_updating(self, snapshot_path, stored_snapshot):
+        store = SnapshotStore(update=True)
+        store.record_collected(snapshot_path, 'DescribeB::it_b')
+        store.assert_match(snapshot_path, 'DescribeB::it_b', 'b')
+        store.save()
+
+        expected = ({'DescribeB::it_b'}, 1)
+        actual = (set(SnapshotFile(snapshot_path).index), store.num_removed)
+        assert expected == actual
+
+    def it_keeps_snapshots_of_uncollected_tests_when_not_updating(self, snapshot_path, stored_snapshot):
+        store = SnapshotStore()
+        store.record_collected(snapshot_path, 'DescribeB::it_b')
+        store.save()
+
+        expected = {'DescribeA::it_a'}
+        actual = set(SnapshotFile(snapshot_path).index)
+        assert expected == actual
+
+
+class DescribeMatchesSnapshot(
+    ViewSetTest,
+    UsesGetMethod,
+    UsesListEndpoint,
+    MatchesSnapshot,
+):
+    list_url = lambda_fixture(lambda: url_for('views-key-values-list'))
+    snapshot_path = lambda_fixture(lambda tmp_path: str(tmp_path / 'test_snapshots.snap'))
+    snapshot_store = lambda_fixture(lambda: SnapshotStore())
+
+    key_values = precondition_fixture(lambda: KeyValue.objects.create_batch(alpha='beta'))
+
+    # NOTE: primary keys differ depending on which tests ran before, so they're
+    #       left out of the snapshot
+    snapshot_value = lambda_fixture(lambda results: [
+        {k: v for k, v in item.items() if k != 'id'}
+        for item in results
+    ])
+
+    @precondition_fixture
+    def stored_snapshot(snapshot_path):
+        SnapshotFile(snapshot_path).save({
+            'DescribeMatchesSnapshot::test_it_matches_snapshot': encode_snapshot([
+                {'key': 'alpha', 'value': 'beta'},
+            ]),
+        })
@@ -103,3 +103,16 @@ class DescribeStatusCode(
 
     class CaseArbitrary(ReturnsStatus(599)):
         status_code = static_fixture(599)
+
+
+class DescribeReturnsStatus:
+
+    def it_interns_mixins_by_status_code(self):
+        expected = ReturnsStatus(418)
+        actual = ReturnsStatus(418)
+        assert expected is actual
+
+    def it_returns_predefined_mixins(self):
+        expected = Returns200
+        actual = ReturnsStatus(200)
+        assert expected is actual
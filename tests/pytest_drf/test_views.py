@@ -1,14 +1,23 @@
 from typing import Any, Dict
 
+import pytest
+from django.contrib.auth.models import User
 from pytest_assert_utils import assert_dict_is_subset, assert_model_attrs
-from pytest_common_subject import precondition_fixture
+from pytest_common_subject import DeferredCommonSubjectRvalUsage, WithCommonSubjectDeferred, precondition_fixture
 from pytest_lambda import lambda_fixture, static_fixture
 
 from pytest_drf import (
     APIViewTest,
+    AsUser,
+    AsyncAPIViewTest,
+    DispatchesDirectly,
     Returns200,
     Returns201,
     Returns204,
+    Returns403,
+    Returns404,
+    RequestsOnce,
+    StreamsResults,
     UsesDeleteMethod,
     UsesDetailEndpoint,
     UsesGetMethod,
@@ -17,7 +26,7 @@ from pytest_drf import (
     UsesPostMethod,
     ViewSetTest,
 )
-from pytest_drf.util import pluralized, url_for
+from pytest_drf.util import json_loads, pluralized, url_for
 
 from tests.testapp.models import KeyValue
 
@@ -302,3 +311,335 @@ class DescribeKeyValueViewSet(ViewSetTest):
             expected = initial_key_value_ids - {key_value.id}
             actual = set(KeyValue.objects.values_list('pk', flat=True))
             assert expected == actual
+
+
+class DescribeRequestsOnce(
+    APIViewTest,
+    UsesGetMethod,
+    RequestsOnce,
+):
+    url = lambda_fixture(lambda: url_for('views-key-values-list'))
+
+    # NOTE: since the response is shared by all tests in the class, any fixtures
+    #       compared against it must also be shared (i.e. class-scoped)
+    key_values = precondition_fixture(
+        lambda: (
+            KeyValue.objects.create_batch(
+                alpha='beta',
+                delta='gamma',
+            )
+        ),
+        scope='class',
+    )
+
+    # Every response received by this class's tests is recorded here
+    received_responses = lambda_fixture(lambda: [], scope='class')
+
+    @pytest.fixture(autouse=True)
+    def record_response(self, response, received_responses):
+        received_responses.append(response)
+
+
+    def it_returns_key_values_rows(self, key_values, results):
+        expected = express_key_values(key_values)
+        actual = results
+        assert expected == actual
+
+    def it_shares_response_between_tests(self, received_responses):
+        expected = 1
+        actual = len(set(map(id, received_responses)))
+        assert len(received_responses) > 1
+        assert expected == actual
+
+
+    class ContextDeferred(
+        WithCommonSubjectDeferred,
+    ):
+        # Disable the recording of responses, which are not made while deferred
+        record_response = None
+
+        def it_does_not_perform_request(self, common_subject_rval):
+            with pytest.raises(DeferredCommonSubjectRvalUsage):
+                common_subject_rval.status_code
+
+        def it_performs_request_when_called(self, call_common_subject):
+            expected = 200
+            actual = call_common_subject().status_code
+            assert expected == actual
+
+
+    class ContextWithSharedDB:
+        def it_rolls_back_the_class_transaction_after_the_last_test(self, run_with_shared_db):
+            result = run_with_shared_db('''
+                import pytest
+                from django.db import transaction
+                from pytest_lambda import lambda_fixture, static_fixture
+
+                from pytest_drf import APIViewTest, RequestsOnce, UsesPostMethod
+                from pytest_drf.util import url_for
+
+                from tests.testapp.models import KeyValue
+
+                def get_keys():
+                    return sorted(KeyValue.objects.values_list('key', flat=True))
+
+                class DescribeCreate(
+                    APIViewTest,
+                    UsesPostMethod,
+                    RequestsOnce,
+                ):
+                    url = lambda_fixture(lambda: url_for('views-key-values-list'))
+                    data = static_fixture({'key': 'alpha', 'value': 'beta'})
+
+                    @pytest.fixture(scope='class')
+                    def existing_row_in_transaction(self):
+                        KeyValue.objects.create(key='gamma', value='delta')
+                        return transaction.get_connection().in_atomic_block
+
+                    def it_creates_class_scoped_rows_within_the_transaction(self, existing_row_in_transaction):
+                        assert existing_row_in_transaction
+
+                    def it_shares_the_rows_between_tests(self):
+                        expected = ['alpha', 'gamma']
+                        actual = get_keys()
+                        assert expected == actual
+
+                class DescribeLaterClass:
+                    def it_rolls_back_the_rows_of_earlier_classes(self):
+                        expected = []
+                        actual = get_keys()
+                        assert expected == actual
+            ''')
+            result.assert_outcomes(passed=3)
+
+
+class DescribeJSONDecoding(
+    APIViewTest,
+    UsesGetMethod,
+):
+    url = lambda_fixture(lambda: url_for('views-key-values-list'))
+
+    key_values = precondition_fixture(
+        lambda: (
+            KeyValue.objects.create_batch(
+                alpha='beta',
+                delta='gamma',
+            )
+        ),
+    )
+
+    # Every body decoded by json_decoder is recorded here
+    decoded_bodies = lambda_fixture(lambda: [])
+
+    @pytest.fixture
+    def json_decoder(self, decoded_bodies):
+        def json_decoder(body: bytes):
+            decoded_bodies.append(body)
+            return json_loads(body)
+        return json_decoder
+
+
+    def it_decodes_body_with_json_decoder(self, response, json, decoded_bodies):
+        expected = [response.content]
+        actual = decoded_bodies
+        assert expected == actual
+
+    def it_decodes_body_only_once(self, response, json, decoded_bodies):
+        response.json()
+        response.json()
+
+        expected = 1
+        actual = len(decoded_bodies)
+        assert expected == actual
+
+    def it_returns_key_values_rows(self, key_values, results):
+        expected = express_key_values(key_values)
+        actual = results
+        assert expected == actual
+
+    class ContextOverriddenJSON:
+        json = static_fixture({'results': ['overridden']})
+
+        def it_returns_results_of_overridden_json(self, results):
+            expected = ['overridden']
+            actual = results
+            assert expected == actual
+
+    class ContextStreamResults(
+        StreamsResults,
+    ):
+        def it_returns_iterator(self, results):
+            expected = iter(results)
+            actual = results
+            assert expected is actual
+
+        def it_returns_key_values_rows(self, key_values, results):
+            expected = express_key_values(key_values)
+            actual = list(results)
+            assert expected == actual
+
+
+class DescribeAsyncAPIViewTest(
+    AsyncAPIViewTest,
+    UsesGetMethod,
+
+    Returns200,
+):
+    # NOTE: this async view returns the class of the request object, along with
+    #       the request's query params and headers
+    url = lambda_fixture(lambda: url_for('asynchronous-request-info'))
+
+    query_params = static_fixture({
+        'key': 'val',
+    })
+
+    headers = static_fixture({
+        'Custom-Header': 'abc',
+    })
+
+
+    def it_performs_request_through_asgi_handler(self, json):
+        expected = 'ASGIRequest'
+        actual = json['request_class']
+        assert expected == actual
+
+    def it_passes_query_params(self, json, query_params):
+        expected = query_params
+        actual = json['query_params']
+        assert expected == actual
+
+    def it_passes_headers(self, json, headers):
+        expected = headers
+        actual = json['headers']
+        assert_dict_is_subset(expected, actual)
+
+    def it_gathers_concurrent_responses(self, gather_responses):
+        responses = gather_responses(3)
+
+        expected = ['ASGIRequest'] * 3
+        actual = [response.json()['request_class'] for response in responses]
+        assert expected == actual
+
+
+    class ContextDRFView(
+        UsesPostMethod,
+    ):
+        # NOTE: this view simply returns the request's POST data as the response
+        url = lambda_fixture(lambda: url_for('views-data'))
+
+        data = static_fixture({
+            'post': 'malone',
+        })
+
+        def it_posts_data(self, json, data):
+            expected = data
+            actual = json
+            assert expected == actual
+
+
+    class ContextAuthenticated(
+        AsUser('user'),
+    ):
+        # NOTE: this view returns the username, first_name, last_name, and email of
+        #       the authenticated user.
+        url = lambda_fixture(lambda: url_for('authentication-user-info'))
+
+        user = lambda_fixture(lambda: User.objects.create(username='user'))
+
+        def it_authenticates_user(self, user, json):
+            expected = user.username
+            actual = json['username']
+            assert expected == actual
+
+
+class DescribeDispatchesDirectly(
+    APIViewTest,
+    DispatchesDirectly,
+):
+
+    class DescribeQueryParamsAndHeaders(
+        UsesGetMethod,
+    ):
+        # NOTE: this view simply returns the request's headers as the response
+        url = lambda_fixture(lambda: url_for('views-headers'))
+
+        query_params = static_fixture({
+            'key': 'val',
+        })
+
+        headers = static_fixture({
+            'Custom-Header': 'abc',
+        })
+
+        def it_passes_headers(self, json, headers):
+            expected = headers
+            actual = json
+            assert_dict_is_subset(expected, actual)
+
+        def it_resolves_url(self, response):
+            expected = 'views-headers'
+            actual = response.resolver_match.url_name
+            assert expected == actual
+
+        def it_passes_query_params(self, response, query_params):
+            expected = query_params
+            actual = response.wsgi_request.GET.dict()
+            assert expected == actual
+
+
+    class DescribeData(
+        UsesPostMethod,
+    ):
+        # NOTE: this view simply returns the request's POST data as the response
+        url = lambda_fixture(lambda: url_for('views-data'))
+
+        data = static_fixture({
+            'post': 'malone',
+        })
+
+        def it_posts_data(self, json, data):
+            expected = data
+            actual = json
+            assert expected == actual
+
+
+    class DescribeAuthenticated(
+        UsesGetMethod,
+        AsUser('user'),
+    ):
+        # NOTE: this view returns the username, first_name, last_name, and email of
+        #       the authenticated user.
+        url = lambda_fixture(lambda: url_for('authentication-user-info'))
+
+        user = lambda_fixture(lambda: User.objects.create(username='user'))
+
+        def it_authenticates_user(self, user, json):
+            expected = user.username
+            actual = json['username']
+            assert expected == actual
+
+
+    class DescribeUnknownURL(
+        UsesGetMethod,
+        Returns404,
+    ):
+        url = static_fixture('/does-not-exist')
+
+        def it_has_no_resolver_match(self, response):
+            expected = None
+            actual = response.resolver_match
+            assert expected == actual
+
+
+    class DescribeViewRaisingHttp404(
+        UsesGetMethod,
+        Returns404,
+    ):
+        url = lambda_fixture(lambda: url_for('views-raises-not-found'))
+
+
+    class DescribeViewRaisingPermissionDenied(
+        UsesGetMethod,
+        Returns403,
+    ):
+        url = lambda_fixture(lambda: url_for('views-raises-permission-denied'))
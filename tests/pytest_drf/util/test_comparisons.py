@@ -0,0 +1,99 @@
+import pytest
+from pytest_assert_utils import util
+
+from pytest_drf.util import JSONDigest, assert_results_equal, json_digest
+
+
+class DescribeAssertResultsEqual:
+
+    def it_passes_equal_lists(self):
+        items = [{'id': i} for i in range(1000)]
+        assert_results_equal(items, [dict(item) for item in items])
+
+    def it_supports_matchers(self):
+        assert_results_equal([{'id': util.Any(int)}], [{'id': 1}])
+
+    def it_reports_bounded_diff(self):
+        expected = [{'id': i} for i in range(1000)]
+        actual = [{'id': -i} for i in range(1000)]
+
+        with pytest.raises(AssertionError) as excinfo:
+            assert_results_equal(expected, actual, max_diff=3)
+
+        expected = [
+            'Results differ',
+            'Mismatched items (999):',
+            "  [1] expected: {'id': 1}",
+            "        actual: {'id': -1}",
+            "  [2] expected: {'id': 2}",
+            "        actual: {'id': -2}",
+            "  [3] expected: {'id': 3}",
+            "        actual: {'id': -3}",
+            '  ... and 996 more',
+        ]
+        actual = str(excinfo.value).splitlines()
+        assert expected == actual
+
+    def it_reports_missing_items(self):
+        with pytest.raises(AssertionError) as excinfo:
+            assert_results_equal([1, 2, 3], [1])
+
+        expected = [
+            'Results differ',
+            'Expected 3 items, but 1 were returned',
+            'Missing items (2):',
+            '  2',
+            '  3',
+        ]
+        actual = str(excinfo.value).splitlines()
+        assert expected == actual
+
+    class ContextIgnoreOrder:
+
+        def it_passes_reordered_lists(self):
+            items = [{'id': i} for i in range(1000)]
+            assert_results_equal(items, items[::-1], ignore_order=True)
+
+        def it_reports_missing_and_unexpected_items(self):
+            with pytest.raises(AssertionError) as excinfo:
+                assert_results_equal([1, 2, 2, 3], [3, 4, 1, 2], ignore_order=True)
+
+            expected = [
+                'Results differ',
+                'Missing items (1):',
+                '  2',
+                'Unexpected items (1):',
+                '  4',
+            ]
+            actual = str(excinfo.value).splitlines()
+            assert expected == actual
+
+        def it_rejects_matchers(self):
+            with pytest.raises(TypeError):
+                assert_results_equal([util.Any(int)], [1], ignore_order=True)
+
+
+class DescribeJsonDigest:
+
+    def it_counts_items(self):
+        expected = 3
+        actual = json_digest([1, 2, 3]).count
+        assert expected == actual
+
+    def it_ignores_dict_key_order(self):
+        expected = json_digest([{'a': 1, 'b': 2}])
+        actual = json_digest([{'b': 2, 'a': 1}])
+        assert expected == actual
+
+    def it_considers_list_order(self):
+        assert json_digest([1, 2]) != json_digest([2, 1])
+
+    def it_ignores_list_order_if_requested(self):
+        expected = json_digest([1, 2], ignore_order=True)
+        actual = json_digest([2, 1], ignore_order=True)
+        assert expected == actual
+
+    def it_returns_stable_hash(self):
+        expected = JSONDigest(1, 'd5f9d4cf11caecf480747a4ebc1c235bd2fcd1a0da1404a613dfa65568dfd0ac')
+        actual = json_digest([{'a': 1}])
+        assert expected == actual
@@ -0,0 +1,91 @@
+from typing import Any, Dict
+
+import pytest
+from django.contrib.auth.models import Group, User
+from pytest_lambda import lambda_fixture
+
+from pytest_drf.util import capture_queries, pluralized
+
+
+def express_user(user: User, **kwargs) -> Dict[str, Any]:
+    return {
+        'username': user.username,
+        'groups': [group.name for group in user.groups.all()],
+        **kwargs,
+    }
+
+
+class DescribePluralized:
+    groups = lambda_fixture(lambda: [
+        Group.objects.create(name=name)
+        for name in ('alpha', 'beta')
+    ])
+
+    users = lambda_fixture(lambda groups: [
+        User.objects.create(username=f'user-{i}')
+        for i in range(5)
+    ])
+
+    @pytest.fixture(autouse=True)
+    def add_users_to_groups(self, users, groups):
+        for user in users:
+            user.groups.set(groups)
+
+    express_users = lambda_fixture(lambda: pluralized(express_user))
+
+
+    def it_expresses_each_object(self, users, express_users):
+        expected = [
+            {'username': f'user-{i}', 'groups': ['alpha', 'beta']}
+            for i in range(5)
+        ]
+        actual = express_users(users)
+        assert expected == actual
+
+    def it_passes_kwargs_to_each_call(self, users, express_users):
+        expected = [True] * len(users)
+        actual = [expression['extra'] for expression in express_users(users, extra=True)]
+        assert expected == actual
+
+    class ContextWithPrefetchRelated:
+        express_users = lambda_fixture(lambda: pluralized(express_user, prefetch_related=['groups']))
+
+        def it_expresses_list_in_constant_queries(self, express_users):
+            users = list(User.objects.all())
+
+            with capture_queries() as queries:
+                express_users(users)
+
+            expected = 1
+            actual = len(queries)
+            assert expected == actual
+
+        def it_expresses_queryset_in_constant_queries(self, express_users):
+            with capture_queries() as queries:
+                express_users(User.objects.all())
+
+            expected = 2
+            actual = len(queries)
+            assert expected == actual
+
+    class ContextAsDecorator:
+        express_users = lambda_fixture(lambda: pluralized(prefetch_related=['groups'])(express_user))
+
+        def it_expresses_each_object(self, users, express_users):
+            expected = [
+                {'username': f'user-{i}', 'groups': ['alpha', 'beta']}
+                for i in range(5)
+            ]
+            actual = express_users(users)
+            assert expected == actual
+
+    class ContextWithPrepare:
+        express_users = lambda_fixture(lambda: pluralized(
+            express_user,
+            prepare=lambda users: {'total': len(users)},
+        ))
+
+        def it_passes_prepared_kwargs_to_each_call(self, users, express_users):
+            expected = [5] * len(users)
+            actual = [expression['total'] for expression in express_users(iter(users))]
+            assert expected == actual
@@ -0,0 +1,62 @@
+from django.contrib.auth.models import Group, User
+
+from pytest_drf.util import snapshot_instances
+
+
+class DescribeSnapshotInstances:
+
+    def it_restores_changed_fields(self):
+        user = User(pk=1, username='alice', first_name='Alice')
+        snapshot = snapshot_instances(user)
+
+        user.first_name = 'Changed'
+        snapshot.restore()
+
+        expected = 'Alice'
+        actual = user.first_name
+        assert expected == actual
+
+    def it_discards_attributes_set_since(self):
+        user = User(pk=1, username='alice')
+        snapshot = snapshot_instances(user)
+
+        user._perm_cache = {'auth.change_user'}
+        snapshot.restore()
+
+        assert not hasattr(user, '_perm_cache')
+
+    def it_discards_related_objects_cached_since(self):
+        user = User(pk=1, username='alice')
+        snapshot = snapshot_instances(user)
+
+        user._state.fields_cache['profile'] = object()
+        snapshot.restore()
+
+        expected = {}
+        actual = user._state.fields_cache
+        assert expected == actual
+
+    def it_restores_nested_instances(self):
+        alice = User(pk=1, username='alice')
+        group = Group(pk=1, name='admins')
+        snapshot = snapshot_instances({'users': [alice], 'groups': (group,)})
+
+        alice.username = 'changed'
+        group.name = 'changed'
+        snapshot.restore()
+
+        expected = ('alice', 'admins')
+        actual = (alice.username, group.name)
+        assert expected == actual
+
+    def it_restores_repeatedly(self):
+        user = User(pk=1, username='alice')
+        snapshot = snapshot_instances(user)
+
+        for username in ('bob', 'carol'):
+            user.username = username
+            snapshot.restore()
+
+        expected = 'alice'
+        actual = user.username
+        assert expected == actual
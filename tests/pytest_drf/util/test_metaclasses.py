@@ -0,0 +1,112 @@
+import time
+from typing import List, Type
+
+import pytest
+from pytest_lambda import lambda_fixture, static_fixture
+
+from pytest_drf import (
+    APIViewTest,
+    AsUser,
+    Returns200,
+    Returns201,
+    UsesGetMethod,
+    UsesListEndpoint,
+    UsesPostMethod,
+    ViewSetTest,
+)
+from pytest_drf.util import prioritize_bases
+
+
+class DescribePrioritizeBases:
+
+    class APIViewTest:
+        client = static_fixture('unauthed_client')
+
+    class AsUser:
+        client = static_fixture('user_client')
+
+    metaclass = lambda_fixture(lambda: prioritize_bases(DescribePrioritizeBases.AsUser))
+
+    def it_places_prioritized_base_first(self, metaclass):
+        cls = metaclass('DescribeMyView', (self.APIViewTest, self.AsUser), {})
+
+        expected = (self.AsUser, self.APIViewTest)
+        actual = cls.__bases__
+        assert expected == actual
+
+    def it_computes_sort_order_once_per_base(self, metaclass, monkeypatch):
+        computed = []
+        compute_sort_order = metaclass._compute_sort_order
+
+        def counting_compute_sort_order(base):
+            computed.append(base)
+            return compute_sort_order(base)
+
+        monkeypatch.setattr(metaclass, '_compute_sort_order', counting_compute_sort_order)
+
+        for _ in range(3):
+            metaclass('DescribeMyView', (self.APIViewTest, self.AsUser), {})
+
+        expected = [self.APIViewTest, self.AsUser]
+        actual = computed
+        assert expected == actual
+
+    def it_keeps_sort_orders_separate_per_metaclass(self, metaclass):
+        other_metaclass = prioritize_bases(self.APIViewTest)
+
+        expected = (0, 1)
+        actual = (metaclass.sort_order(self.AsUser), other_metaclass.sort_order(self.AsUser))
+        assert expected == actual
+
+
+class DescribeCollectionBenchmark:
+    """Creating deeply-nested ViewSetTest trees must remain fast"""
+
+    # NOTE: APIViewTest (and thus ViewSetTest) is declared with a metaclass from
+    #       prioritize_bases, so every context including it must sort its bases
+    mixins = static_fixture([
+        (APIViewTest, UsesGetMethod, Returns200),
+        (ViewSetTest, UsesPostMethod, UsesListEndpoint, Returns201),
+        (AsUser('alice'),),
+        (AsUser('bob'), Returns200),
+    ])
+
+    # Depth of the tree of test contexts beneath each ViewSetTest
+    depth = static_fixture(5)
+
+    # Generous upper bound on the mean time to declare a single test context
+    max_mean_class_creation_time = static_fixture(0.001)
+
+    @pytest.fixture
+    def build_tree(self, mixins, depth):
+        def build_tree() -> List[Type]:
+            created = []
+
+            def build_context(name: str, bases: tuple, level: int) -> Type:
+                # As in a test module, contexts are nested within one another's
+                # namespaces (not subclassed from one another)
+                children = {}
+                if level < depth:
+                    for i, context_mixins in enumerate(mixins):
+                        child_name = f'Context{level}_{i}'
+                        children[child_name] = build_context(child_name, context_mixins, level + 1)
+
+                context = type(name, bases, children)
+                created.append(context)
+                return context
+
+            build_context('DescribeViewSet', (ViewSetTest,), 0)
+            return created
+
+        return build_tree
+
+    def it_creates_test_contexts_quickly(self, build_tree, max_mean_class_creation_time):
+        start = time.perf_counter()
+        created = build_tree()
+        duration = time.perf_counter() - start
+
+        mean_class_creation_time = duration / len(created)
+        assert mean_class_creation_time <= max_mean_class_creation_time, (
+            f'Created {len(created)} test contexts in {duration:.3f}s '
+            f'({mean_class_creation_time * 1e6:.1f}µs each)'
+        )
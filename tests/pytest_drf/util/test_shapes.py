@@ -0,0 +1,61 @@
+from typing import Any, List, Optional, Union
+
+import pytest
+from pytest_assert_utils import util
+
+from pytest_drf.util import compile_shape
+
+
+class DescribeCompileShape:
+
+    @pytest.mark.parametrize('shape, value', [
+        pytest.param(int, 1, id='int'),
+        pytest.param(float, 1, id='float-accepts-int'),
+        pytest.param(str, 'a', id='str'),
+        pytest.param(Any, object(), id='any'),
+        pytest.param(Optional[int], None, id='optional'),
+        pytest.param(Union[int, str], 'a', id='union'),
+        pytest.param([int], [1, 2, 3], id='list'),
+        pytest.param(List[str], ['a'], id='typing-list'),
+        pytest.param({'id': int, 'tags': [str]}, {'id': 1, 'tags': ['a']}, id='dict'),
+        pytest.param('constant', 'constant', id='literal'),
+        pytest.param(util.Any(str), 'a', id='matcher'),
+    ])
+    def it_accepts_matching_values(self, shape, value):
+        expected = True
+        actual = compile_shape(shape)(value)
+        assert expected == actual
+
+    @pytest.mark.parametrize('shape, value', [
+        pytest.param(int, True, id='int-rejects-bool'),
+        pytest.param(int, '1', id='int'),
+        pytest.param(Optional[int], 'a', id='optional'),
+        pytest.param([int], [1, 'a'], id='list'),
+        pytest.param({'id': int}, {'id': 1, 'extra': 2}, id='dict-extra-key'),
+        pytest.param({'id': int}, {}, id='dict-missing-key'),
+        pytest.param('constant', 'other', id='literal'),
+    ])
+    def it_rejects_mismatched_values(self, shape, value):
+        expected = False
+        actual = compile_shape(shape)(value)
+        assert expected == actual
+
+    def it_describes_every_mismatch(self):
+        shape = compile_shape({'count': int, 'results': [{'id': int, 'key': str}]})
+        value = {
+            'count': '2',
+            'results': [{'id': 1, 'key': 2}, {'id': None}],
+        }
+
+        expected = [
+            '$.count: expected int, got str',
+            '$.results[0].key: expected str, got int',
+            "$.results[1]: missing keys: 'key'",
+            '$.results[1].id: expected int, got null',
+        ]
+        actual = compile_shape(shape).get_errors(value)
+        assert expected == actual
+
+    def it_rejects_ambiguous_list_shapes(self):
+        with pytest.raises(TypeError):
+            compile_shape([int, str])
@@ -0,0 +1,55 @@
+import pytest
+from django.test import override_settings
+from django.urls import NoReverseMatch, reverse
+
+from pytest_drf.util import url_for
+
+
+@pytest.fixture(autouse=True)
+def empty_url_for_cache():
+    url_for.cache_clear()
+    yield
+    url_for.cache_clear()
+
+
+class DescribeUrlFor:
+
+    @pytest.mark.parametrize('viewname, args, kwargs', [
+        pytest.param('queries-key-values', (), {}, id='no-args'),
+        pytest.param('status-code', (418,), {}, id='positional-args'),
+        pytest.param('status-code', (), {'code': 418}, id='keyword-args'),
+        pytest.param('views-key-values-detail', ('a b',), {}, id='quoted-args'),
+        pytest.param('views-key-values-detail', (), {'pk': 1, 'format': 'json'}, id='format-suffix'),
+    ])
+    def it_returns_same_url_as_reverse(self, viewname, args, kwargs):
+        expected = reverse(viewname, args=args, kwargs=kwargs)
+        actual = url_for(viewname, *args, **kwargs)
+        assert expected == actual
+
+    def it_compiles_route_templates_once(self):
+        for code in (200, 404, 418):
+            url_for('status-code', code)
+
+        expected = (2, 1)
+        actual = url_for.cache_info()[:2]
+        assert expected == actual
+
+    def it_caches_each_arg_shape_separately(self):
+        url_for('status-code', 200)
+        url_for('status-code', code=200)
+
+        expected = (0, 2)
+        actual = url_for.cache_info()[:2]
+        assert expected == actual
+
+    def it_raises_no_reverse_match_for_invalid_args(self):
+        with pytest.raises(NoReverseMatch):
+            url_for('status-code', 'not-a-number')
+
+    def it_empties_cache_when_root_urlconf_changes(self):
+        url_for('status-code', 200)
+
+        with override_settings(ROOT_URLCONF='tests.testapp.urls'):
+            expected = (0, 0, 0)
+            actual = tuple(url_for.cache_info())
+            assert expected == actual
@@ -14,3 +14,8 @@ class KeyValue(models.Model):
     value = models.CharField(max_length=32)
 
     objects = KeyValueManager()
+
+
+class Note(models.Model):
+    text = models.CharField(max_length=32)
+    updated_at = models.DateTimeField(auto_now=True)
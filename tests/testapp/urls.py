@@ -1,19 +1,24 @@
 from django.urls import include, path
 from rest_framework import routers
 
+import tests.testapp.views.asynchronous
 import tests.testapp.views.authentication
 import tests.testapp.views.authorization
 import tests.testapp.views.pagination
+import tests.testapp.views.queries
 import tests.testapp.views.status
 import tests.testapp.views.views
 from tests.testapp import views
 
 router = routers.DefaultRouter()
 router.register('views/key-values', views.views.KeyValueViewSet, basename='views-key-values')
+router.register('authorization/key-values', views.authorization.KeyValueAccessViewSet, basename='authorization-key-values')
 
 urlpatterns = [
     path('', include(router.urls)),
 
+    path('asynchronous/request-info', views.asynchronous.request_info, name='asynchronous-request-info'),
+
     path('authentication/user-info', views.authentication.user_info, name='authentication-user-info'),
 
     path('authorization/login-required', views.authorization.login_required, name='authorization-login-required'),
@@ -21,10 +26,19 @@ urlpatterns = [
     path('pagination/page-number', views.pagination.PageNumberPaginationView.as_view(), name='pagination-page-number'),
     path('pagination/limit-offset', views.pagination.LimitOffsetPaginationView.as_view(), name='pagination-limit-offset'),
     path('pagination/cursor', views.pagination.CursorPaginationView.as_view(), name='pagination-cursor'),
+    path('pagination/next-link', views.pagination.NextLinkPaginationView.as_view(), name='pagination-next-link'),
+    path('pagination/faulty/<int:step>/<int:with_count>', views.pagination.FaultyPaginationView.as_view(), name='pagination-faulty'),
+
+    path('queries/key-values', views.queries.key_values, name='queries-key-values'),
+    path('queries/key-values-one-by-one', views.queries.key_values_one_by_one, name='queries-key-values-one-by-one'),
 
     path('status/<int:code>', views.status.status_code, name='status-code'),
+    path('status/<int:code>/delayed/<int:delay_ms>', views.status.delayed_status_code, name='status-code-delayed'),
 
     path('views/query-params', views.views.query_params, name='views-query-params'),
     path('views/headers', views.views.headers, name='views-headers'),
     path('views/data', views.views.data, name='views-data'),
+    path('views/raises-not-found', views.views.raises_not_found, name='views-raises-not-found'),
+    path('views/raises-permission-denied', views.views.raises_permission_denied, name='views-raises-permission-denied'),
+    path('views/raises-error', views.views.raises_error, name='views-raises-error'),
 ]
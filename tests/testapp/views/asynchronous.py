@@ -0,0 +1,14 @@
+import asyncio
+
+from django.http import HttpRequest, JsonResponse
+
+
+async def request_info(request: HttpRequest) -> JsonResponse:
+    # Yield to the event loop, to ensure we're really running on one
+    await asyncio.sleep(0)
+
+    return JsonResponse({
+        'request_class': type(request).__name__,
+        'query_params': request.GET.dict(),
+        'headers': dict(request.headers),
+    })
@@ -3,8 +3,20 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from tests.testapp.views.views import KeyValueViewSet
+
 
 @api_view()
 @permission_classes([permissions.IsAuthenticated])
 def login_required(request: Request) -> Response:
     return Response()
+
+
+class KeyValueAccessViewSet(KeyValueViewSet):
+    # NOTE: anyone may read, authenticated users may write, and only admins may delete
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+    def get_permissions(self):
+        if self.action == 'destroy':
+            return [permissions.IsAdminUser()]
+        return super().get_permissions()
@@ -5,18 +5,88 @@ from rest_framework.pagination import (
     LimitOffsetPagination,
     PageNumberPagination,
 )
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from tests.testapp.models import KeyValue
+from tests.testapp.views.views import KeyValueSerializer
 
 
 class PageNumberPaginationView(GenericAPIView, mixins.ListModelMixin):
-    queryset = ()
-    pagination_class = PageNumberPagination
+    queryset = KeyValue.objects.order_by('id')
+    serializer_class = KeyValueSerializer
+
+    class pagination_class(PageNumberPagination):
+        page_size = 2
+
+    def get(self, request, *args, **kwargs):
+        return self.list(request, *args, **kwargs)
 
 
 class LimitOffsetPaginationView(GenericAPIView, mixins.ListModelMixin):
-    queryset = ()
-    pagination_class = LimitOffsetPagination
+    queryset = KeyValue.objects.order_by('id')
+    serializer_class = KeyValueSerializer
+
+    class pagination_class(LimitOffsetPagination):
+        default_limit = 2
+
+    def get(self, request, *args, **kwargs):
+        return self.list(request, *args, **kwargs)
 
 
 class CursorPaginationView(GenericAPIView, mixins.ListModelMixin):
-    queryset = ()
-    pagination_class = CursorPagination
+    queryset = KeyValue.objects.order_by('id')
+    serializer_class = KeyValueSerializer
+
+    class pagination_class(CursorPagination):
+        ordering = 'id'
+        page_size = 2
+
+    def get(self, request, *args, **kwargs):
+        return self.list(request, *args, **kwargs)
+
+
+class NextLinkPaginationView(GenericAPIView, mixins.ListModelMixin):
+    queryset = KeyValue.objects.order_by('id')
+    serializer_class = KeyValueSerializer
+
+    class pagination_class(PageNumberPagination):
+        page_size = 2
+
+        def get_paginated_response(self, data):
+            return Response({
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'results': data,
+            })
+
+    def get(self, request, *args, **kwargs):
+        return self.list(request, *args, **kwargs)
+
+
+class FaultyPaginationView(GenericAPIView):
+    """Returns 2 items per page, but advances by `step` items between pages
+
+    A step of 1 returns items on more than one page; a step of 3 skips items.
+    The count is included only if `with_count` is truthy.
+    """
+    queryset = KeyValue.objects.order_by('id')
+    serializer_class = KeyValueSerializer
+    page_size = 2
+
+    def get(self, request, step, with_count):
+        items = list(self.get_queryset())
+        page = int(request.query_params.get('page', 1))
+        start = (page - 1) * step
+
+        url = request.build_absolute_uri()
+        next_link = replace_query_param(url, 'page', page + 1) if start + self.page_size < len(items) else None
+
+        body = {
+            'next': next_link,
+            'previous': None,
+            'results': self.get_serializer(items[start:start + self.page_size], many=True).data,
+        }
+        if with_count:
+            body['count'] = len(items)
+        return Response(body)
@@ -0,0 +1,22 @@
+from rest_framework.decorators import api_view
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from tests.testapp.models import KeyValue
+
+
+@api_view()
+def key_values(request: Request) -> Response:
+    return Response([
+        {'key': kv.key, 'value': kv.value}
+        for kv in KeyValue.objects.order_by('id')
+    ])
+
+
+@api_view()
+def key_values_one_by_one(request: Request) -> Response:
+    # NOTE: this view purposefully executes a query for every row
+    return Response([
+        KeyValue.objects.filter(pk=pk).values('key', 'value').get()
+        for pk in KeyValue.objects.order_by('id').values_list('pk', flat=True)
+    ])
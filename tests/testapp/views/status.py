@@ -1,3 +1,5 @@
+import time
+
 from rest_framework.decorators import api_view
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -6,3 +8,9 @@ from rest_framework.response import Response
 @api_view()
 def status_code(request: Request, code: int) -> Response:
     return Response(status=code)
+
+
+@api_view()
+def delayed_status_code(request: Request, code: int, delay_ms: int) -> Response:
+    time.sleep(delay_ms / 1000)
+    return Response(status=code)
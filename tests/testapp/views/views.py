@@ -1,3 +1,5 @@
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpRequest, HttpResponse
 from rest_framework import serializers, viewsets
 from rest_framework.decorators import api_view
 from rest_framework.pagination import PageNumberPagination
@@ -22,6 +24,18 @@ def data(request: Request) -> Response:
     return Response(request.data)
 
 
+def raises_not_found(request: HttpRequest) -> HttpResponse:
+    raise Http404
+
+
+def raises_permission_denied(request: HttpRequest) -> HttpResponse:
+    raise PermissionDenied
+
+
+def raises_error(request: HttpRequest) -> HttpResponse:
+    raise RuntimeError('Raised by the view')
+
+
 class KeyValueSerializer(serializers.ModelSerializer):
     class Meta:
         model = KeyValue